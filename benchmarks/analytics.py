@@ -0,0 +1,183 @@
+"""
+Vectorized spending insights vs a naive per-row implementation.
+
+    PYTHONPATH=src python -m benchmarks.analytics --rows 1000000
+
+Both compute the same metrics (daily totals with a trailing average, category
+z-score anomalies, month-over-month category deltas) over the same generated
+history; the script checks that the results agree and prints the timings.
+Needs numpy.
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from src.domain.entities.insights import CategoryDelta, DailySpending, SpendingAnomaly, SpendingInsights
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.infrastructure.analytics.columns import TransactionColumns
+from src.infrastructure.analytics.insights import compute_insights
+
+
+def generate(rows: int, seed: int = 3) -> List[Transaction]:
+    rnd = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    span = 5 * 365 * 86400
+    categories = list(TransactionCategory)
+    transactions = []
+
+    for transaction_id in range(1, rows + 1):
+        amount = Money(round(rnd.lognormvariate(3, 0.8) * 100))
+        if rnd.random() < 0.001:
+            amount *= 40
+        transactions.append(Transaction(
+            transaction_id=transaction_id,
+            user_id=1,
+            transaction_type=TransactionType.EXPENSE if rnd.random() < 0.9 else TransactionType.INCOME,
+            amount=amount,
+            category=rnd.choice(categories),
+            date_created=start + timedelta(seconds=rnd.randrange(span)),
+        ))
+
+    return transactions
+
+
+def naive_insights(
+    user_id: int,
+    transactions: List[Transaction],
+    window_days: int = 30,
+    z_threshold: float = 3.0,
+    min_samples: int = 10,
+) -> SpendingInsights:
+    """The straightforward loops over Transaction objects."""
+    insights = SpendingInsights(user_id=user_id)
+    expenses = [t for t in transactions if t.transaction_type == TransactionType.EXPENSE]
+    if not expenses:
+        return insights
+
+    per_day: Dict[date, int] = defaultdict(int)
+    for transaction in expenses:
+        per_day[transaction.date_created.date()] += transaction.amount
+
+    day, last_day = min(per_day), max(per_day)
+    window: List[int] = []
+    while day <= last_day:
+        window.append(per_day.get(day, 0))
+        recent = window[-window_days:]
+        insights.daily.append(DailySpending(
+            day=day, total=Money(window[-1]), rolling_average=Money(round(sum(recent) / len(recent)))
+        ))
+        day += timedelta(days=1)
+
+    by_category: Dict[TransactionCategory, List[int]] = defaultdict(list)
+    for transaction in expenses:
+        by_category[transaction.category].append(int(transaction.amount))
+
+    stats = {}
+    for category, amounts in by_category.items():
+        mean = sum(amounts) / len(amounts)
+        std = math.sqrt(sum((amount - mean) ** 2 for amount in amounts) / len(amounts))
+        stats[category] = (mean, std, len(amounts))
+
+    for transaction in expenses:
+        mean, std, count = stats[transaction.category]
+        if count < min_samples or std == 0:
+            continue
+        z_score = (int(transaction.amount) - mean) / std
+        if z_score > z_threshold:
+            insights.anomalies.append(SpendingAnomaly(
+                transaction_id=transaction.transaction_id,
+                category=transaction.category,
+                amount=transaction.amount,
+                date_created=transaction.date_created,
+                z_score=z_score,
+            ))
+    insights.anomalies.sort(key=lambda anomaly: -anomaly.z_score)
+
+    per_month: Dict[date, Dict[TransactionCategory, int]] = defaultdict(lambda: defaultdict(int))
+    for transaction in expenses:
+        per_month[transaction.date_created.date().replace(day=1)][transaction.category] += transaction.amount
+
+    months = sorted(per_month)
+    month = months[0]
+    while month < months[-1]:
+        following = (month + timedelta(days=32)).replace(day=1)
+        for category in TransactionCategory:
+            previous = Money(per_month.get(month, {}).get(category, 0))
+            current = Money(per_month.get(following, {}).get(category, 0))
+            if previous or current:
+                insights.category_deltas.append(CategoryDelta(
+                    month_start=following,
+                    category=category,
+                    previous_total=previous,
+                    current_total=current,
+                    change=current - previous,
+                    change_ratio=(current - previous) / previous if previous else None,
+                ))
+        month = following
+
+    return insights
+
+
+def same_insights(left: SpendingInsights, right: SpendingInsights) -> bool:
+    # Totals are exact integers; a rolling average may land on the other side of a half-cent.
+    return (
+        len(left.daily) == len(right.daily)
+        and all(
+            a.day == b.day and a.total == b.total and abs(a.rolling_average - b.rolling_average) <= 1
+            for a, b in zip(left.daily, right.daily)
+        )
+        and [a.transaction_id for a in left.anomalies] == [b.transaction_id for b in right.anomalies]
+        and len(left.category_deltas) == len(right.category_deltas)
+        and all(
+            a.month_start == b.month_start and a.category == b.category and a.change == b.change
+            for a, b in zip(left.category_deltas, right.category_deltas)
+        )
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    transactions = generate(args.rows)
+
+    started = time.perf_counter()
+    columns = TransactionColumns.from_transactions(transactions)
+    load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vectorized = compute_insights(1, columns)
+    vectorized_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    naive = naive_insights(1, transactions)
+    naive_seconds = time.perf_counter() - started
+
+    print(f"rows                 {args.rows:>12,}")
+    print(f"load into columns    {load_seconds * 1000:>10.1f} ms")
+    print(f"vectorized insights  {vectorized_seconds * 1000:>10.1f} ms")
+    print(f"naive insights       {naive_seconds * 1000:>10.1f} ms")
+    print(f"speedup              {naive_seconds / vectorized_seconds:>10.1f}x")
+    print(f"speedup incl. load   {naive_seconds / (load_seconds + vectorized_seconds):>10.1f}x")
+    print(
+        f"days {len(vectorized.daily)}, anomalies {len(vectorized.anomalies)}, "
+        f"category deltas {len(vectorized.category_deltas)}"
+    )
+
+    if not same_insights(vectorized, naive):
+        print("MISMATCH between vectorized and naive results")
+        return 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,157 @@
+"""
+Withdraw latency with budget alerts, inline vs. through the event queue.
+
+    PYTHONPATH=src python -m benchmarks.budget_alerts --budgets 0 10 50
+
+For each budget count, every seeded user gets that many budgets and two
+variants of withdraw run against them:
+
+  inline   WithdrawUseCase, then get_total_by_user since the period start for
+           every budget of the user, in the same session (the naive check)
+  queued   WithdrawUseCase(events=...) publishing to the in-memory queue while
+           BudgetAlertConsumer evaluates in the background
+
+Afterwards a backlog of --backlog queued withdrawals is drained with the
+consumer stopped meanwhile, which gives its throughput in events/s.
+Needs PostgreSQL (POSTGRES_* settings).
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List
+
+from src.application.use_cases.withdraw import WithdrawRequest, WithdrawUseCase
+from src.domain.entities.budget import Budget
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import TimeBucket, truncate_to_bucket
+from src.domain.entities.transaction import TransactionCategory, TransactionType
+from src.domain.interfaces.alert_notifier import IAlertNotifier
+from src.infrastructure.config import BudgetAlertConfig
+from benchmarks.common import ScenarioResult, print_results, run_scenario
+from benchmarks.use_cases import PostgresBackend, seed
+
+
+class CountingNotifier(IAlertNotifier):
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def notify(self, alerts) -> None:
+        self.sent += len(alerts)
+
+
+async def add_budgets(user_ids: List[int], count: int) -> None:
+    from infrastructure.database.repository.budgets import BudgetRepository
+    from src.infrastructure.database import DatabaseProvider
+
+    periods = [TimeBucket.WEEK, TimeBucket.MONTH, TimeBucket.YEAR]
+    categories = [None, *TransactionCategory]
+    async with DatabaseProvider.session_factory() as session, session.begin():
+        repo = BudgetRepository(session)
+        for user_id in user_ids:
+            for index in range(count):
+                await repo.create(
+                    Budget(
+                        user_id=user_id,
+                        category=categories[index % len(categories)],
+                        period=periods[index % len(periods)],
+                        limit=Money(1_000_000_000_00),
+                    )
+                )
+
+
+async def main(args: argparse.Namespace) -> int:
+    from infrastructure.database.repository.budgets import BudgetRepository
+    from infrastructure.database.repository.transaction import TransactionRepository
+    from infrastructure.database.repository.users import UserRepository
+    from src.infrastructure.database import DatabaseProvider
+    from src.infrastructure.database.budget_alerts import BudgetAlertConsumer
+    from src.infrastructure.events.memory import InMemoryExpenseEventQueue
+
+    backend = PostgresBackend()
+    await backend.start()
+    results: Dict[str, ScenarioResult] = {}
+
+    try:
+        rnd = random.Random(5)
+        queue = InMemoryExpenseEventQueue()
+        notifier = CountingNotifier()
+        config = BudgetAlertConfig(batch_wait_seconds=0.05)
+
+        for count in sorted(args.budgets):
+            # Fresh users per step, so earlier steps' budgets do not add up.
+            user_ids = await seed(backend, args.users, args.history, uuid.uuid4().hex[:8])
+            await add_budgets(user_ids, count)
+
+            def request() -> WithdrawRequest:
+                return WithdrawRequest(
+                    user_id=rnd.choice(user_ids), amount=Money(5_00), category=rnd.choice(list(TransactionCategory))
+                )
+
+            async def inline(index: int) -> None:
+                async with DatabaseProvider.session_factory() as session, session.begin():
+                    withdrawal = request()
+                    transaction_repo = TransactionRepository(session)
+                    await WithdrawUseCase(UserRepository(session), transaction_repo).execute(withdrawal)
+                    now = datetime.now()
+                    for budget in await BudgetRepository(session).get_by_user_ids([withdrawal.user_id]):
+                        await transaction_repo.get_total_by_user(
+                            withdrawal.user_id,
+                            TransactionType.EXPENSE,
+                            date_from=truncate_to_bucket(now, budget.period),
+                            date_to=now,
+                        )
+
+            async def queued(index: int) -> None:
+                async with backend.repositories() as (user_repo, transaction_repo):
+                    await WithdrawUseCase(user_repo, transaction_repo, events=queue).execute(request())
+
+            results[f"inline/{count}"] = await run_scenario(inline, args.operations, args.concurrency)
+
+            consumer = asyncio.create_task(
+                BudgetAlertConsumer(DatabaseProvider.session_factory, queue, notifier, config).run()
+            )
+            try:
+                results[f"queued/{count}"] = await run_scenario(queued, args.operations, args.concurrency)
+            finally:
+                consumer.cancel()
+
+        # Consumer throughput on a backlog, budgets of the last step.
+        await run_scenario(queued, args.backlog, args.concurrency)
+        drainer = BudgetAlertConsumer(DatabaseProvider.session_factory, queue, notifier, config)
+        events = 0
+        started = time.perf_counter()
+        while True:
+            delivery = await queue.receive(config.batch_size, 0.05)
+            if not delivery.events:
+                break
+            events += len(delivery.events)
+            await drainer.process(delivery)
+        drained = time.perf_counter() - started
+    finally:
+        await backend.stop()
+
+    print(f"{args.users} users per step, history {args.history}, concurrency {args.concurrency}")
+    print_results(results)
+    print(f"\nconsumer: {events} events in {drained:.2f}s, {events / drained:.0f} events/s "
+          f"with {max(args.budgets)} budgets per user; {notifier.sent} alerts, {queue.dropped} dropped")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[0, 10, 50])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--history", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--backlog", type=int, default=10_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
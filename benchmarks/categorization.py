@@ -0,0 +1,119 @@
+"""
+Throughput of the local categorizer on synthetic bank statement lines.
+
+    PYTHONPATH=src python -m benchmarks.categorization --rows 50000
+
+Trains a HashedNgramModel on generated (description, category) samples, then
+measures raw model predictions and LocalCategorizer.categorize() over chunks
+the way BulkImportUseCase calls it (repeated merchants hit the LRU cache).
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from src.domain.entities.transaction import TransactionCategory
+from src.infrastructure.cache.memory import InMemoryCacheBackend
+from src.infrastructure.categorization.model import HashedNgramModel, normalize_description
+from src.infrastructure.categorization.service import LocalCategorizer
+from src.infrastructure.config import CategorizerConfig
+
+MERCHANTS: Dict[TransactionCategory, List[str]] = {
+    TransactionCategory.FOOD: [
+        "Pyaterochka", "Magnit", "Perekrestok", "VkusVill", "Burger King", "KFC",
+        "Shokoladnitsa", "Starbucks Coffee", "Dodo Pizza", "Yandex Eda", "Delivery Club",
+    ],
+    TransactionCategory.TRANSPORT: [
+        "Yandex Go", "Uber Trip", "Metro Moskva", "Aeroexpress", "Lukoil AZS",
+        "Gazprom Neft", "RZD Bilety", "Citydrive", "Belka Car", "Troika Popolnenie",
+    ],
+    TransactionCategory.ENTERTAINMENT: [
+        "Kinopoisk", "Netflix", "Spotify", "Steam Purchase", "Karo Film",
+        "Yandex Plus", "Afisha Bilety", "PlayStation Store", "Okko", "Bowling City",
+    ],
+    TransactionCategory.UTILITIES: [
+        "Mosenergosbyt", "MGTS Internet", "Rostelecom", "MTS Svyaz", "Beeline",
+        "Zhkh Oplata", "Mosvodokanal", "Megafon", "Tele2", "Gazprom Mezhregiongaz",
+    ],
+    TransactionCategory.OTHER: [
+        "Perevod Sber", "Wildberries", "Ozon", "Apteka Rigla", "Leroy Merlin",
+        "IKEA", "Sportmaster", "Pochta Rossii", "Gosuslugi Poshlina", "Tinkoff Card2Card",
+    ],
+}
+
+
+def statement_line(rnd: random.Random, merchant: str) -> str:
+    """Noise like a real statement: card suffix, city, date, reference number."""
+    city = rnd.choice(("MOSCOW", "SPB", "KAZAN", ""))
+    return (
+        f"{merchant.upper() if rnd.random() < 0.5 else merchant} {city} "
+        f"*{rnd.randint(1000, 9999)} {rnd.randint(1, 28):02d}.{rnd.randint(1, 12):02d} "
+        f"REF{rnd.randint(100000, 999999)}"
+    )
+
+
+def generate(rnd: random.Random, rows: int) -> List[Tuple[str, TransactionCategory]]:
+    categories = list(MERCHANTS)
+    samples = []
+    for _ in range(rows):
+        category = rnd.choice(categories)
+        samples.append((statement_line(rnd, rnd.choice(MERCHANTS[category])), category))
+    return samples
+
+
+async def main(args: argparse.Namespace) -> int:
+    rnd = random.Random(1)
+    train = generate(rnd, args.train_rows)
+    test = generate(rnd, args.rows)
+
+    model = HashedNgramModel(n_features=args.n_features)
+    started = time.perf_counter()
+    model.train([(normalize_description(text), category) for text, category in train], epochs=args.epochs)
+    print(f"train: {len(train)} samples in {time.perf_counter() - started:.2f}s")
+
+    normalized = [normalize_description(text) for text, _ in test]
+    started = time.perf_counter()
+    predictions = model.predict(normalized)
+    elapsed = time.perf_counter() - started
+    accuracy = sum(predicted == category for (predicted, _), (_, category) in zip(predictions, test)) / len(test)
+    print(f"model.predict: {len(test) / elapsed:,.0f} rows/s, accuracy {accuracy:.3f}")
+
+    categorizer = LocalCategorizer(model, cache=InMemoryCacheBackend(), config=CategorizerConfig())
+    descriptions = [text for text, _ in test]
+    started = time.perf_counter()
+    for offset in range(0, len(descriptions), args.chunk_size):
+        await categorizer.categorize(descriptions[offset:offset + args.chunk_size])
+    elapsed = time.perf_counter() - started
+    print(
+        f"categorize (chunks of {args.chunk_size}): {len(descriptions) / elapsed:,.0f} rows/s, "
+        f"{categorizer.stats}"
+    )
+
+    # Concurrent small requests are merged by the batcher.
+    started = time.perf_counter()
+    fresh = LocalCategorizer(model, config=CategorizerConfig(lru_size=0))
+    await asyncio.gather(*(fresh.categorize([text]) for text in descriptions[: args.concurrent]))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{args.concurrent} concurrent single-row calls: {args.concurrent / elapsed:,.0f} rows/s "
+        f"in {fresh._batcher.calls} model calls"
+    )
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000, help="Rows to categorize")
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--n-features", type=int, default=2 ** 18)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--concurrent", type=int, default=5000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
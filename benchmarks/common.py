@@ -0,0 +1,102 @@
+"""Helpers shared by the benchmark scripts."""
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+
+@dataclass
+class ScenarioResult:
+    operations: int
+    concurrency: int
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(
+    operation: Callable[[int], Awaitable[object]],
+    operations: int,
+    concurrency: int,
+) -> ScenarioResult:
+    """Call operation(i) for i in range(operations) from `concurrency` workers."""
+    latencies: List[float] = []
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < operations:
+            index = next_index
+            next_index += 1
+
+            started = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return ScenarioResult(
+        operations=operations,
+        concurrency=concurrency,
+        ops_per_sec=operations / elapsed if elapsed else 0.0,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p95_ms=percentile(latencies, 0.95) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+    )
+
+
+def print_results(results: Dict[str, ScenarioResult]) -> None:
+    print(f"{'scenario':<16}{'ops/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<16}{result.ops_per_sec:>12.1f}{result.p50_ms:>10.3f}"
+            f"{result.p95_ms:>10.3f}{result.p99_ms:>10.3f}"
+        )
+
+
+def save_baseline(path: Path, meta: dict, results: Dict[str, ScenarioResult]) -> None:
+    payload = {**meta, "results": {name: asdict(result) for name, result in results.items()}}
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def compare_with_baseline(
+    path: Path,
+    results: Dict[str, ScenarioResult],
+    tolerance: float,
+) -> List[str]:
+    """
+    Regressions against a saved baseline: throughput lower or p95 higher
+    than the baseline by more than `tolerance` (0.2 = 20%).
+    """
+    baseline = json.loads(path.read_text())["results"]
+    regressions = []
+
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if result.ops_per_sec < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result.ops_per_sec:.1f} ops/s vs {previous['ops_per_sec']:.1f} in baseline"
+            )
+        if result.p95_ms > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {result.p95_ms:.3f} ms vs {previous['p95_ms']:.3f} ms in baseline"
+            )
+
+    return regressions
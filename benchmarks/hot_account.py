@@ -0,0 +1,82 @@
+"""
+Deposit throughput against a single hot account, with and without coalescing.
+
+    PYTHONPATH=src python -m benchmarks.hot_account --operations 5000 --concurrency 64
+
+Every deposit targets the same user, so without coalescing they serialize on
+the user row lock. With coalescing, deposits arriving within --window-ms share
+one UPDATE + multi-row INSERT. Needs PostgreSQL (POSTGRES_* settings).
+"""
+import argparse
+import asyncio
+import sys
+import uuid
+from typing import Dict
+
+from src.application.use_cases.create_user import CreateUserRequest, CreateUserUseCase
+from src.application.use_cases.deposit import DepositRequest, DepositUseCase
+from src.domain.entities.money import Money
+from src.infrastructure.config import DepositCoalescingConfig
+from benchmarks.common import ScenarioResult, print_results, run_scenario
+from benchmarks.use_cases import PlainPasswordHasher, PostgresBackend
+
+
+async def main(args: argparse.Namespace) -> int:
+    from src.infrastructure.database import DatabaseProvider
+    from src.infrastructure.database.coalescing import TransactionCoalescer
+
+    backend = PostgresBackend()
+    await backend.start()
+
+    try:
+        async with backend.repositories() as (user_repo, _):
+            user = await CreateUserUseCase(user_repo, PlainPasswordHasher()).execute(
+                CreateUserRequest(email=f"hot-{uuid.uuid4().hex[:8]}@bench", username="hot", password="x")
+            )
+
+        coalescer = TransactionCoalescer(
+            DatabaseProvider.session_factory,
+            DepositCoalescingConfig(enabled=True, window_ms=args.window_ms, max_batch=args.max_batch),
+        )
+
+        async def direct(index: int) -> None:
+            async with backend.repositories() as (user_repo, transaction_repo):
+                await DepositUseCase(user_repo, transaction_repo).execute(
+                    DepositRequest(user_id=user.user_id, amount=Money(100))
+                )
+
+        async def coalesced(index: int) -> None:
+            async with backend.repositories() as (user_repo, transaction_repo):
+                await DepositUseCase(user_repo, transaction_repo, coalescer=coalescer).execute(
+                    DepositRequest(user_id=user.user_id, amount=Money(100))
+                )
+
+        results: Dict[str, ScenarioResult] = {
+            "direct": await run_scenario(direct, args.operations, args.concurrency),
+            "coalesced": await run_scenario(coalesced, args.operations, args.concurrency),
+        }
+        await coalescer.close()
+
+        async with backend.repositories() as (user_repo, _):
+            balance = (await user_repo.get_by_id(user.user_id, with_lock=False)).balance
+    finally:
+        await backend.stop()
+
+    print_results(results)
+    expected = Money(100) * 2 * args.operations
+    print(f"final balance {balance}, expected {expected}")
+
+    return 0 if balance == expected else 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=5000, help="Deposits per scenario")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=100)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
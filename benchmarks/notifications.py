@@ -0,0 +1,221 @@
+"""
+Outbound Telegram notifications against a local fake Bot API server.
+
+    PYTHONPATH=src python -m benchmarks.notifications --messages 10000 --chats 500
+
+The fake server (FakeBotApi of tests/fakes.py, which the dispatcher tests use
+too) enforces the Bot API limits multiplied by --speedup, answering 429 with
+parameters.retry_after when they are exceeded, fails --error-rate of the
+requests with 500 and answers 403 for --blocked chats. Both variants send
+the same --messages notifications, queued all at once, to --chats chats with a
+skewed distribution (a few chats get most of the messages):
+
+  naive       max_in_flight workers sending in arrival order through the same
+              client, sleeping retry_after and retrying on errors (unbounded
+              fan-out is slower still: httpx's pool degrades with thousands
+              of waiters)
+  dispatcher  NotificationDispatcher with the same limits the server enforces
+
+Reported: time until every message was delivered or given up, delivered
+notifications/s, HTTP requests, 429 responses, merged alerts, dead letters and
+delivery latency per priority.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from src.domain.entities.notification import Notification, NotificationPriority
+from src.infrastructure.config import TelegramConfig
+from src.infrastructure.memory.notifications import InMemoryDeadLetterRepository
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.notifications.dispatcher import NotificationDispatcher
+from src.infrastructure.notifications.telegram import TelegramBotClient, TelegramError
+from benchmarks.common import percentile
+from tests.fakes import FakeBotApi
+
+
+@dataclass
+class Outcome:
+    elapsed: float
+    delivered: int
+    requests: int
+    too_many: int
+    merged: int
+    dead_letters: int
+    latency_ms: Dict[NotificationPriority, Tuple[float, float]]
+
+
+def workload(messages: int, chats: int, seed: int) -> List[Notification]:
+    rnd = random.Random(seed)
+    chat_ids = list(range(1, chats + 1))
+    weights = [1 / rank for rank in range(1, chats + 1)]
+    notifications = []
+    for index in range(messages):
+        priority = rnd.choices(
+            [NotificationPriority.ALERT, NotificationPriority.REPLY, NotificationPriority.DIGEST], [0.3, 0.6, 0.1]
+        )[0]
+        notifications.append(
+            Notification(
+                chat_id=rnd.choices(chat_ids, weights)[0],
+                text=f"{priority.name.lower()} #{index}",
+                priority=priority,
+                mergeable=priority == NotificationPriority.ALERT,
+            )
+        )
+    return notifications
+
+
+def outcome(
+    api: FakeBotApi,
+    notifications: List[Notification],
+    submitted: Dict[int, float],
+    elapsed: float,
+    merged: int,
+    dead_letters: int,
+) -> Outcome:
+    latencies: Dict[NotificationPriority, List[float]] = defaultdict(list)
+    for index, received in api.delivered.items():
+        latencies[notifications[index].priority].append(received - submitted[index])
+    for values in latencies.values():
+        values.sort()
+
+    return Outcome(
+        elapsed=elapsed,
+        delivered=len(api.delivered),
+        requests=api.requests,
+        too_many=api.too_many,
+        merged=merged,
+        dead_letters=dead_letters,
+        latency_ms={
+            priority: (percentile(values, 0.50) * 1000, percentile(values, 0.95) * 1000)
+            for priority, values in latencies.items()
+        },
+    )
+
+
+async def naive(api: FakeBotApi, client: TelegramBotClient, notifications: List[Notification],
+                config: TelegramConfig) -> Outcome:
+    api.reset()
+    submitted: Dict[int, float] = {}
+    dead_letters = 0
+
+    async def send(notification: Notification) -> None:
+        nonlocal dead_letters
+        for attempt in range(1, config.max_attempts + 1):
+            try:
+                await client.send_message(notification.chat_id, notification.text)
+                return
+            except TelegramError as e:
+                if e.permanent or attempt == config.max_attempts:
+                    dead_letters += 1
+                    return
+                await asyncio.sleep(e.retry_after or config.backoff_base_seconds * 2 ** (attempt - 1))
+
+    async def worker() -> None:
+        while pending:
+            await send(notifications[pending.pop()])
+
+    started = time.perf_counter()
+    for index in range(len(notifications)):
+        submitted[index] = time.perf_counter()
+    pending = list(reversed(range(len(notifications))))
+    await asyncio.gather(*(worker() for _ in range(config.max_in_flight)))
+
+    return outcome(api, notifications, submitted, time.perf_counter() - started, 0, dead_letters)
+
+
+async def dispatched(api: FakeBotApi, client: TelegramBotClient, notifications: List[Notification],
+                     config: TelegramConfig) -> Outcome:
+    api.reset()
+    dead_letters = InMemoryDeadLetterRepository(InMemoryStore())
+    dispatcher = NotificationDispatcher(client, dead_letters, config)
+    submitted: Dict[int, float] = {}
+
+    runner = asyncio.create_task(dispatcher.run())
+    try:
+        started = time.perf_counter()
+        for index, notification in enumerate(notifications):
+            submitted[index] = time.perf_counter()
+            dispatcher.submit(notification)
+        await dispatcher.drain()
+        elapsed = time.perf_counter() - started
+    finally:
+        runner.cancel()
+
+    return outcome(
+        api, notifications, submitted, elapsed, dispatcher.stats.merged, dispatcher.stats.dead_lettered
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    import httpx
+
+    base = TelegramConfig()
+    config = base.model_copy(update={
+        "global_rate": base.global_rate * args.speedup,
+        "global_burst": base.global_burst,
+        "chat_rate": base.chat_rate * args.speedup,
+        "backoff_base_seconds": base.backoff_base_seconds / args.speedup,
+        "backoff_max_seconds": base.backoff_max_seconds / args.speedup,
+        "max_in_flight": args.in_flight,
+    })
+    notifications = workload(args.messages, args.chats, args.seed)
+    blocked = set(random.Random(args.seed).sample(range(1, args.chats + 1), args.blocked))
+
+    api = FakeBotApi(config, args.error_rate, blocked, args.latency_ms / 1000, args.seed)
+    url = await api.start()
+    http = httpx.AsyncClient(
+        timeout=config.request_timeout_seconds,
+        limits=httpx.Limits(max_connections=config.max_in_flight, max_keepalive_connections=config.max_in_flight),
+    )
+    client = TelegramBotClient(http, "bench", url)
+    results: Dict[str, Outcome] = {}
+    try:
+        results["naive"] = await naive(api, client, notifications, config)
+        results["dispatcher"] = await dispatched(api, client, notifications, config)
+    finally:
+        await client.close()
+        await api.stop()
+
+    # Even without retries the busiest chat cannot be done sooner than this.
+    per_chat = Counter(notification.chat_id for notification in notifications if not notification.mergeable)
+    floor = max(max(per_chat.values()) / config.chat_rate, len(notifications) / config.global_rate)
+
+    print(f"{args.messages} messages to {args.chats} chats ({args.blocked} blocked), limits x{args.speedup}: "
+          f"{config.global_rate:.0f}/s overall, {config.chat_rate:.0f}/s per chat, {args.error_rate:.1%} errors, "
+          f"{args.in_flight} in flight; rate limits allow {floor:.1f}s at best")
+    print(f"{'variant':<12}{'seconds':>9}{'msg/s':>8}{'requests':>10}{'429s':>8}{'merged':>8}{'dead':>6}  "
+          "p50/p95 ms alert, reply, digest")
+    for name, result in results.items():
+        latency = ", ".join(
+            f"{result.latency_ms[priority][0]:.0f}/{result.latency_ms[priority][1]:.0f}"
+            if priority in result.latency_ms else "-"
+            for priority in NotificationPriority
+        )
+        print(f"{name:<12}{result.elapsed:>9.2f}{result.delivered / result.elapsed:>8.0f}{result.requests:>10}"
+              f"{result.too_many:>8}{result.merged:>8}{result.dead_letters:>6}  {latency}")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--chats", type=int, default=500)
+    parser.add_argument("--blocked", type=int, default=5)
+    parser.add_argument("--speedup", type=float, default=20.0, help="Multiplier of the Bot API rate limits")
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    # httpx's connection pool gets slower per request beyond a few dozen connections.
+    parser.add_argument("--in-flight", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=11)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Date-range reads before and after splitting transactions into monthly partitions.
+
+    PYTHONPATH=src python -m benchmarks.partitioning --rows 1000000 --months 24
+
+Seeds --rows transactions spread over the last --months months. On a fresh
+database they all land in the default partition, which behaves like the old
+single table; the same scenarios run again after TransactionPartitionManager
+has moved every month into its own partition:
+
+  month_total  get_total_by_user over one calendar month
+  month_list   get_by_user_id over one calendar month
+  next_page    get_page_by_user_id continuing from a cursor inside the range
+  day_window   raw aggregate over all users for a 12 hour window
+
+Needs PostgreSQL (POSTGRES_* settings) and a database without monthly partitions.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List
+
+from src.application.use_cases.create_user import CreateUserRequest, CreateUserUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.infrastructure.config import TransactionPartitionConfig
+from src.infrastructure.pagination import encode_cursor
+from benchmarks.common import ScenarioResult, print_results, run_scenario
+from benchmarks.use_cases import PlainPasswordHasher, PostgresBackend
+
+
+async def seed(backend: PostgresBackend, users: int, rows: int, first_month: date, seconds: int) -> List[int]:
+    user_ids = []
+    async with backend.repositories() as (user_repo, _):
+        for index in range(users):
+            user = await CreateUserUseCase(user_repo, PlainPasswordHasher()).execute(
+                CreateUserRequest(email=f"part-{uuid.uuid4().hex[:8]}-{index}@bench", username="part", password="x")
+            )
+            user_ids.append(user.user_id)
+
+    rnd = random.Random(11)
+    start = datetime.combine(first_month, datetime.min.time())
+    async with backend.repositories() as (_, transaction_repo):
+        await transaction_repo.create_many(
+            (
+                Transaction(
+                    user_id=rnd.choice(user_ids),
+                    transaction_type=TransactionType.EXPENSE,
+                    amount=Money(rnd.randint(1, 500_00)),
+                    category=rnd.choice(list(TransactionCategory)),
+                    date_created=start + timedelta(seconds=rnd.randrange(seconds)),
+                )
+                for _ in range(rows)
+            ),
+            # Synthetic expenses of users without a balance: skip the overdraft guard.
+            min_balance=None,
+        )
+
+    return user_ids
+
+
+async def analyze() -> None:
+    from sqlalchemy import text
+    from src.infrastructure.database import DatabaseProvider
+
+    async with DatabaseProvider.session_factory() as session, session.begin():
+        await session.execute(text("ANALYZE transactions"))
+
+
+async def run_all(
+    scenarios: Dict[str, Callable[[int], Awaitable[object]]],
+    operations: int,
+    concurrency: int,
+) -> Dict[str, ScenarioResult]:
+    results = {}
+    for name, operation in scenarios.items():
+        await run_scenario(operation, concurrency, concurrency)  # warm up
+        results[name] = await run_scenario(operation, operations, concurrency)
+    return results
+
+
+async def main(args: argparse.Namespace) -> int:
+    from infrastructure.database.repository.partitions import TransactionPartitionRepository, add_months, month_start
+    from src.infrastructure.database import DatabaseProvider
+    from src.infrastructure.database.partitions import TransactionPartitionManager
+
+    backend = PostgresBackend()
+    await backend.start()
+
+    try:
+        async with DatabaseProvider.session_factory() as session:
+            if await TransactionPartitionRepository(session).list_attached():
+                print("transactions already has monthly partitions, use a fresh database")
+                return 2
+
+        first_month = add_months(month_start(date.today()), -args.months)
+        seconds = (date.today() - first_month).days * 86400
+        user_ids = await seed(backend, args.users, args.rows, first_month, seconds)
+
+        def random_month(index: int) -> date:
+            return add_months(first_month, random.Random(index).randrange(args.months))
+
+        async def month_total(index: int) -> object:
+            month = random_month(index)
+            async with backend.repositories() as (_, repo):
+                return await repo.get_total_by_user(
+                    user_ids[index % len(user_ids)],
+                    TransactionType.EXPENSE,
+                    datetime.combine(month, datetime.min.time()),
+                    datetime.combine(add_months(month, 1), datetime.min.time()) - timedelta(microseconds=1),
+                )
+
+        async def month_list(index: int) -> object:
+            month = random_month(index)
+            async with backend.repositories() as (_, repo):
+                return await repo.get_by_user_id(
+                    user_ids[index % len(user_ids)],
+                    date_from=datetime.combine(month, datetime.min.time()),
+                    date_to=datetime.combine(add_months(month, 1), datetime.min.time()),
+                )
+
+        async def next_page(index: int) -> object:
+            position = datetime.combine(random_month(index), datetime.min.time()) + timedelta(days=15)
+            async with backend.repositories() as (_, repo):
+                return await repo.get_page_by_user_id(
+                    user_ids[index % len(user_ids)], limit=50, cursor=encode_cursor(position, 2 ** 31 - 1)
+                )
+
+        async def day_window(index: int) -> object:
+            day = datetime.combine(random_month(index), datetime.min.time()) + timedelta(days=index % 28)
+            async with backend.repositories() as (_, repo):
+                return await repo.aggregate(
+                    user_ids, date_from=day + timedelta(hours=6), date_to=day + timedelta(hours=18)
+                )
+
+        scenarios = {
+            "month_total": month_total,
+            "month_list": month_list,
+            "next_page": next_page,
+            "day_window": day_window,
+        }
+
+        await analyze()
+        single = await run_all(scenarios, args.operations, args.concurrency)
+
+        manager = TransactionPartitionManager(
+            DatabaseProvider.session_factory,
+            TransactionPartitionConfig(months_ahead=1, max_splits_per_run=args.months + 1),
+        )
+        created = await manager.ensure()
+        await analyze()
+        monthly = await run_all(scenarios, args.operations, args.concurrency)
+    finally:
+        await backend.stop()
+
+    print(f"{args.rows} rows, {args.users} users")
+    print("\nsingle table (default partition only)")
+    print_results(single)
+    print(f"\n{len(created)} monthly partitions")
+    print_results(monthly)
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
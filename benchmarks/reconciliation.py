@@ -0,0 +1,117 @@
+"""
+Balance reconciliation: one user at a time vs. grouped queries over id ranges.
+
+    PYTHONPATH=src python -m benchmarks.reconciliation --users 20000 --rows 400000
+
+  per_user  balance read plus income and expense totals, three queries per user
+  ranged    BalanceReconciler, one grouped query per --range-size users
+
+Both report users per second; per_user runs with the same number of
+concurrent sessions as the reconciler. The reconciler checks every user in
+the database, not only the seeded ones. Needs PostgreSQL (POSTGRES_* settings).
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import insert
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.infrastructure.config import ReconciliationConfig
+from benchmarks.common import run_scenario
+from benchmarks.use_cases import PostgresBackend
+
+
+async def seed(backend: PostgresBackend, users: int, rows: int) -> List[int]:
+    from infrastructure.database.models.users import UserModel
+    from src.infrastructure.database import DatabaseProvider
+
+    run_id = uuid.uuid4().hex[:8]
+    async with DatabaseProvider.session_factory() as session, session.begin():
+        result = await session.execute(
+            insert(UserModel.__table__).returning(UserModel.__table__.c.user_id),
+            [
+                {"email": f"reconcile-{run_id}-{index}@bench", "username": "reconcile", "password": "x", "balance": 0}
+                for index in range(users)
+            ],
+        )
+        user_ids = list(result.scalars())
+
+    # create_many keeps users.balance in step with the inserted rows.
+    rnd = random.Random(20)
+    now = datetime.now()
+    async with backend.repositories() as (_, transaction_repo):
+        await transaction_repo.create_many(
+            Transaction(
+                user_id=rnd.choice(user_ids),
+                transaction_type=rnd.choice([TransactionType.INCOME, TransactionType.EXPENSE]),
+                amount=Money(rnd.randint(1, 500_00)),
+                category=rnd.choice(list(TransactionCategory)),
+                date_created=now - timedelta(seconds=rnd.randrange(90 * 86400)),
+            )
+            for _ in range(rows)
+        )
+
+    return user_ids
+
+
+async def main(args: argparse.Namespace) -> int:
+    from src.infrastructure.database import DatabaseProvider
+    from src.infrastructure.database.reconciliation import BalanceReconciler
+
+    backend = PostgresBackend()
+    await backend.start()
+
+    try:
+        user_ids = await seed(backend, args.users, args.rows)
+
+        async def check_user(index: int) -> bool:
+            user_id = user_ids[index]
+            async with backend.repositories() as (user_repo, transaction_repo):
+                user = await user_repo.get_by_id(user_id, with_lock=False)
+                income = await transaction_repo.get_total_by_user(user_id, TransactionType.INCOME)
+                expense = await transaction_repo.get_total_by_user(user_id, TransactionType.EXPENSE)
+            return user.balance == income - expense
+
+        per_user = await run_scenario(check_user, len(user_ids), args.concurrency)
+
+        with tempfile.TemporaryDirectory() as directory:
+            config = ReconciliationConfig(
+                range_size=args.range_size,
+                concurrency=args.concurrency,
+                journal_path=str(Path(directory) / "journal.jsonl"),
+                report_path=str(Path(directory) / "discrepancies.csv"),
+            )
+            started = time.perf_counter()
+            summary = await BalanceReconciler(DatabaseProvider.session_factory, config).run()
+            elapsed = time.perf_counter() - started
+    finally:
+        await backend.stop()
+
+    print(f"{args.users} users, {args.rows} rows, concurrency {args.concurrency}")
+    print(f"{'scenario':<10} {'users':>8} {'seconds':>9} {'users/s':>10}")
+    print(f"{'per_user':<10} {per_user.operations:>8} {per_user.operations / per_user.ops_per_sec:>9.2f} {per_user.ops_per_sec:>10.0f}")
+    print(f"{'ranged':<10} {summary.checked_users:>8} {elapsed:>9.2f} {summary.checked_users / elapsed:>10.0f}")
+    print(f"{summary.discrepancies} discrepancies")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--range-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Per-row memory and mapping time of bulk transaction reads.
+
+    PYTHONPATH=src python -m benchmarks.row_mapping --rows 100000
+
+Reads the same rows four ways:
+  orm+dict     select(TransactionModel) mapped to a non-slotted entity (the old path)
+  orm+slots    select(TransactionModel) mapped to the slotted Transaction
+  core+slots   TransactionRepository.get_by_user_id (Core rows -> Transaction)
+  batch        TransactionRepository.get_batch_by_user_id (TransactionBatch)
+
+"ms" is the best of --repeat untraced runs. "retained" is what the result keeps
+alive, "peak" the high-water mark while reading, both from one tracemalloc run
+and divided by the row count. Needs PostgreSQL.
+"""
+import argparse
+import asyncio
+import gc
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlmodel import select
+
+from src.application.use_cases.create_user import CreateUserRequest, CreateUserUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from benchmarks.use_cases import PlainPasswordHasher, PostgresBackend
+
+
+@dataclass(kw_only=True)
+class DictTransaction:
+    """Transaction as it was before slots, for the baseline."""
+    transaction_id: Optional[int] = None
+    user_id: int
+    transaction_type: TransactionType
+    amount: int
+    category: TransactionCategory
+    description: Optional[str] = None
+    date_created: datetime = field(default_factory=datetime.now)
+
+
+async def measure(read: Callable[[], Awaitable[Any]], rows: int, repeat: int) -> Dict[str, float]:
+    """Best-of-repeat wall time without tracing, then one traced run for memory."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await read()
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    result = await read()
+
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == rows, (len(result), rows)
+    del result
+
+    return {
+        "ms": elapsed * 1000,
+        "retained": (retained - before) / rows,
+        "peak": (peak - before) / rows,
+    }
+
+
+async def main(args: argparse.Namespace) -> int:
+    from infrastructure.database.models.transaction import TransactionModel
+    from src.infrastructure.database import DatabaseProvider
+
+    backend = PostgresBackend()
+    await backend.start()
+
+    try:
+        async with backend.repositories() as (user_repo, transaction_repo):
+            user = await CreateUserUseCase(user_repo, PlainPasswordHasher()).execute(
+                CreateUserRequest(email=f"rows-{uuid.uuid4().hex[:8]}@bench", username="rows", password="x")
+            )
+            rnd = random.Random(5)
+            start = datetime(2024, 1, 1)
+            await transaction_repo.create_many(
+                (
+                    Transaction(
+                        user_id=user.user_id,
+                        transaction_type=TransactionType.EXPENSE,
+                        amount=Money(rnd.randint(1, 500_00)),
+                        category=rnd.choice(list(TransactionCategory)),
+                        description=None,
+                        date_created=start + timedelta(seconds=index),
+                    )
+                    for index in range(args.rows)
+                ),
+                # Synthetic expenses of a user without a balance: skip the overdraft guard.
+                min_balance=None,
+            )
+
+        def orm_read(entity: type) -> Callable[[], Awaitable[list]]:
+            async def read() -> list:
+                async with DatabaseProvider.session_factory() as session:
+                    result = await session.execute(
+                        select(TransactionModel).where(TransactionModel.user_id == user.user_id)
+                    )
+                    return [
+                        entity(
+                            transaction_id=model.transaction_id,
+                            user_id=model.user_id,
+                            transaction_type=model.transaction_type,
+                            amount=model.amount,
+                            category=model.category,
+                            description=model.description,
+                            date_created=model.date_created,
+                        )
+                        for model in result.scalars().all()
+                    ]
+            return read
+
+        async def core_read() -> list:
+            async with backend.repositories() as (_, repo):
+                return await repo.get_by_user_id(user.user_id)
+
+        async def batch_read():
+            async with backend.repositories() as (_, repo):
+                return await repo.get_batch_by_user_id(user.user_id)
+
+        scenarios = {
+            "orm+dict": orm_read(DictTransaction),
+            "orm+slots": orm_read(Transaction),
+            "core+slots": core_read,
+            "batch": batch_read,
+        }
+
+        results = {}
+        for name, read in scenarios.items():
+            await read()  # warm up connection and statement caches
+            results[name] = await measure(read, args.rows, args.repeat)
+    finally:
+        await backend.stop()
+
+    print(f"{'path':<12}{'ms':>10}{'retained B/row':>16}{'peak B/row':>12}")
+    for name, result in results.items():
+        print(f"{name:<12}{result['ms']:>10.1f}{result['retained']:>16.0f}{result['peak']:>12.0f}")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per path, best is reported")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
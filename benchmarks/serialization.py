@@ -0,0 +1,191 @@
+"""
+JSON responses of transaction lists: the standard FastAPI paths against
+TransactionPageResponse / TransactionStreamResponse.
+
+    PYTHONPATH=src python -m benchmarks.serialization --rows 1000 10000
+
+Every variant is a route of one FastAPI app that returns the same page of
+--rows in-memory transactions (no database), called straight through ASGI, so
+the time covers FastAPI's response handling plus the response itself:
+
+  jsonable  no response model: the page goes through jsonable_encoder and
+            JSONResponse (amounts become integers of minor units)
+  pydantic  response_model of pydantic models built from the entities,
+            validated again and dumped by FastAPI
+  fast      TransactionPageResponse, encoded straight from the entities
+  stream    TransactionStreamResponse of the same rows in 500-row chunks
+
+"ms" is the median of --repeat requests, "first byte" the time until the
+first body chunk was sent. The pydantic and fast bodies are checked to
+decode to the same JSON.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.interfaces.transaction_repo import TransactionPage
+from src.presentation.responses import TransactionPageResponse, TransactionStreamResponse
+
+VARIANTS = ("jsonable", "pydantic", "fast", "stream")
+
+
+class TransactionOut(BaseModel):
+    transaction_id: Optional[int]
+    user_id: int
+    transaction_type: TransactionType
+    amount: str
+    category: TransactionCategory
+    description: Optional[str]
+    date_created: datetime
+
+
+class TransactionPageOut(BaseModel):
+    items: List[TransactionOut]
+    next_cursor: Optional[str]
+
+
+def make_page(rows: int, seed: int) -> TransactionPage:
+    rnd = random.Random(seed)
+    started = datetime(2026, 1, 1)
+    return TransactionPage(
+        items=[
+            Transaction(
+                transaction_id=rows - index,
+                user_id=1,
+                transaction_type=rnd.choice(list(TransactionType)),
+                amount=Money(rnd.randint(1, 100_000_00)),
+                category=rnd.choice(list(TransactionCategory)),
+                description=rnd.choice([None, "Coffee", "Groceries for the week", "Такси до дома"]),
+                date_created=started + timedelta(seconds=rnd.randint(0, 365 * 86400), microseconds=rnd.randint(0, 999_999)),
+            )
+            for index in range(rows)
+        ],
+        next_cursor="MjAyNi0wMS0wMVQwMDowMDowMHwx",
+    )
+
+
+def create_app(page: TransactionPage) -> FastAPI:
+    app = FastAPI()
+
+    async def rows():
+        for transaction in page.items:
+            yield transaction
+
+    @app.get("/jsonable")
+    async def jsonable():
+        return page
+
+    @app.get("/pydantic", response_model=TransactionPageOut)
+    async def pydantic():
+        return TransactionPageOut(
+            items=[
+                TransactionOut(
+                    transaction_id=transaction.transaction_id,
+                    user_id=transaction.user_id,
+                    transaction_type=transaction.transaction_type,
+                    amount=str(transaction.amount),
+                    category=transaction.category,
+                    description=transaction.description,
+                    date_created=transaction.date_created,
+                )
+                for transaction in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+
+    @app.get("/fast", response_class=TransactionPageResponse)
+    async def fast():
+        return TransactionPageResponse(page)
+
+    @app.get("/stream", response_class=TransactionStreamResponse)
+    async def stream():
+        return TransactionStreamResponse(rows())
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> tuple:
+    """(seconds until the response was sent, seconds until the first body byte, body)."""
+    body: List[bytes] = []
+    first_byte: Optional[float] = None
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # StreamingResponse listens for a disconnect while it sends.
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_byte
+        if message["type"] == "http.response.body" and message.get("body"):
+            if first_byte is None:
+                first_byte = time.perf_counter()
+            body.append(message["body"])
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    finished = time.perf_counter()
+    done.set()
+    return finished - started, (first_byte or finished) - started, b"".join(body)
+
+
+async def main(args: argparse.Namespace) -> int:
+    print(f"{'rows':>7}  {'variant':<10}{'ms':>10}{'first byte':>12}{'KiB':>9}{'rows/s':>12}{'vs pydantic':>13}")
+    for rows in args.rows:
+        page = make_page(rows, args.seed)
+        app = create_app(page)
+        results: Dict[str, tuple] = {}
+
+        for variant in VARIANTS:
+            timings = [await request(app, f"/{variant}") for _ in range(args.repeat)]
+            results[variant] = (
+                statistics.median(timing[0] for timing in timings),
+                statistics.median(timing[1] for timing in timings),
+                timings[-1][2],
+            )
+
+        fast_body = json.loads(results["fast"][2])
+        if fast_body != json.loads(results["pydantic"][2]):
+            raise RuntimeError("fast and pydantic bodies differ")
+        if fast_body["items"] != json.loads(results["stream"][2]):
+            raise RuntimeError("fast and stream bodies differ")
+
+        baseline = results["pydantic"][0]
+        for variant, (seconds, first_byte, body) in results.items():
+            print(f"{rows:>7}  {variant:<10}{seconds * 1000:>10.2f}{first_byte * 1000:>12.2f}"
+                  f"{len(body) / 1024:>9.0f}{rows / seconds:>12.0f}{baseline / seconds:>12.1f}x")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=25)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Cold start of one API worker: imports, lifespan, first request, memory.
+
+    PYTHONPATH=src python -m benchmarks.startup --workers 5
+
+Every worker is a fresh interpreter that imports src.app, runs the
+lifespan startup and sends GET /metrics straight to the ASGI app (no server,
+no network). Reported per worker, then as medians:
+
+  interpreter  process start until the first line of the worker script
+  import       import src.app
+  lifespan     lifespan startup (engine, models, background tasks)
+  first req    the first request, until its response is sent
+  ready        process start until the first response: what a new
+               worker adds to a scale-out
+  rss          resident memory after the first response
+
+A separate `python -X importtime -c "import src.app"` run gives the import
+breakdown: cumulative time per top-level package and the slowest first-party
+modules. The lifespan creates the engine but does not connect, so no
+database is needed; background jobs that do connect just log their failure.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+WORKER = r"""
+import asyncio, json, time
+started = time.monotonic()
+
+def rss_kb():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * (__import__("os").sysconf("SC_PAGE_SIZE") // 1024)
+
+from src.app import app
+imported = time.monotonic()
+
+async def first_request():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/metrics", "raw_path": b"/metrics", "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    async with app.router.lifespan_context(app):
+        lifespan = time.monotonic()
+        await app(scope, receive, send)
+        answered = time.monotonic()
+        status = next(m["status"] for m in messages if m["type"] == "http.response.start")
+        print(json.dumps({
+            "started": started, "imported": imported, "lifespan": lifespan,
+            "answered": answered, "status": status, "rss_kb": rss_kb(),
+        }))
+
+asyncio.run(first_request())
+"""
+
+
+def run_worker(env: Dict[str, str]) -> Dict[str, float]:
+    spawned = time.monotonic()
+    completed = subprocess.run(
+        [sys.executable, "-c", WORKER], env=env, capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    if result["status"] != 200:
+        raise RuntimeError(f"First request answered {result['status']}")
+
+    return {
+        "interpreter": result["started"] - spawned,
+        "import": result["imported"] - result["started"],
+        "lifespan": result["lifespan"] - result["imported"],
+        "first req": result["answered"] - result["lifespan"],
+        "ready": result["answered"] - spawned,
+        "rss": result["rss_kb"] / 1024,
+    }
+
+
+def import_breakdown(env: Dict[str, str]) -> Tuple[float, Dict[str, float], List[Tuple[str, float]]]:
+    """Total import time, cumulative seconds per top-level package and the slowest first-party modules."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.app"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    packages: Dict[str, float] = defaultdict(float)
+    first_party: List[Tuple[str, float]] = []
+    total = 0.0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        self_seconds = int(self_us) / 1e6
+        total += self_seconds
+
+        module = name.strip()
+        top = module.split(".")[0]
+        if top in ("src", "infrastructure"):
+            first_party.append((module, int(cumulative_us) / 1e6))
+            top = "first party"
+        packages[top] += self_seconds
+
+    first_party.sort(key=lambda item: item[1], reverse=True)
+    return total, dict(packages), first_party
+
+
+def main(args: argparse.Namespace) -> int:
+    env = {**os.environ, "LOGURU_AUTOINIT": "false"}
+
+    total, packages, first_party = import_breakdown(env)
+    print(f"import src.app: {total * 1000:.0f} ms (-X importtime, self times summed)")
+    for package, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {package:<24}{seconds * 1000:>8.1f} ms")
+    print("slowest first-party imports (cumulative):")
+    for module, seconds in first_party[:args.top]:
+        print(f"  {module:<56}{seconds * 1000:>8.1f} ms")
+
+    workers = [run_worker(env) for _ in range(args.workers)]
+    columns = list(workers[0])
+    print(f"\n{'worker':<8}" + "".join(f"{column:>13}" for column in columns))
+    rows = [(str(index + 1), worker) for index, worker in enumerate(workers)]
+    rows.append(("median", {column: statistics.median(w[column] for w in workers) for column in columns}))
+    for name, worker in rows:
+        print(f"{name:<8}" + "".join(
+            f"{worker[column]:>10.1f} MB" if column == "rss" else f"{worker[column] * 1000:>10.1f} ms"
+            for column in columns
+        ))
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=5, help="Cold starts to measure")
+    parser.add_argument("--top", type=int, default=12, help="Rows of the import breakdown")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Dashboard statistics with and without the snapshot cache.
+
+    PYTHONPATH=src python -m benchmarks.statistics_cache --backend postgres --write-ratio 0.05
+
+One operation is a dashboard view of a random user: this week by day, this
+month by day and this year by month (three GetStatisticsUseCase calls), or,
+with probability --write-ratio, a withdrawal that invalidates the user's
+snapshots.
+
+  uncached  every view runs the three aggregate queries
+  cached    StatisticsSnapshotCache on the in-memory backend
+
+The stampede step invalidates one user and fires --stampede concurrent views
+of the same statistics at once, with and without the cache, and counts the
+aggregate queries that actually ran.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from typing import Dict, Optional
+
+from src.application.use_cases.get_statistics import GetStatisticsRequest, GetStatisticsUseCase
+from src.application.use_cases.withdraw import WithdrawRequest, WithdrawUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import TimeBucket
+from src.domain.entities.transaction import TransactionCategory
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.infrastructure.cache.memory import InMemoryCacheBackend
+from src.infrastructure.cache.statistics import StatisticsSnapshotCache
+from benchmarks.common import ScenarioResult, print_results, run_scenario
+from benchmarks.use_cases import MemoryBackend, PostgresBackend, seed
+
+DASHBOARD = [
+    (TimeBucket.WEEK, TimeBucket.DAY),
+    (TimeBucket.MONTH, TimeBucket.DAY),
+    (TimeBucket.YEAR, TimeBucket.MONTH),
+]
+
+
+class CountingRepository:
+    """Counts aggregate() calls of the wrapped repository; everything else passes through."""
+
+    def __init__(self, transaction_repo, counter: Dict[str, int]):
+        self.transaction_repo = transaction_repo
+        self.counter = counter
+
+    def __getattr__(self, name):
+        return getattr(self.transaction_repo, name)
+
+    async def aggregate(self, *args, **kwargs):
+        self.counter["aggregate"] += 1
+        return await self.transaction_repo.aggregate(*args, **kwargs)
+
+
+async def main(args: argparse.Namespace) -> int:
+    backend = MemoryBackend() if args.backend == "memory" else PostgresBackend()
+    await backend.start()
+    results: Dict[str, ScenarioResult] = {}
+    stampede: Dict[str, int] = {}
+
+    try:
+        user_ids = await seed(backend, args.users, args.history, uuid.uuid4().hex[:8])
+        cache = StatisticsSnapshotCache(InMemoryCacheBackend(), ttl=300.0)
+
+        def scenario(statistics: Optional[IStatisticsCache], seed_value: int):
+            rnd = random.Random(seed_value)
+
+            async def operation(index: int) -> None:
+                user_id = rnd.choice(user_ids)
+                async with backend.repositories() as (user_repo, transaction_repo):
+                    if rnd.random() < args.write_ratio:
+                        await WithdrawUseCase(user_repo, transaction_repo, statistics=statistics).execute(
+                            WithdrawRequest(
+                                user_id=user_id, amount=Money(1_00), category=rnd.choice(list(TransactionCategory))
+                            )
+                        )
+                        return
+
+                    use_case = GetStatisticsUseCase(transaction_repo, statistics)
+                    for period, bucket in DASHBOARD:
+                        await use_case.execute(GetStatisticsRequest(user_id=user_id, period=period, bucket=bucket))
+
+            return operation
+
+        results["uncached"] = await run_scenario(scenario(None, 1), args.operations, args.concurrency)
+        results["cached"] = await run_scenario(scenario(cache, 1), args.operations, args.concurrency)
+
+        for name, statistics in (("uncached", None), ("cached", cache)):
+            counter = {"aggregate": 0}
+            await cache.invalidate(user_ids[0])
+
+            async def view() -> None:
+                async with backend.repositories() as (_, transaction_repo):
+                    await GetStatisticsUseCase(CountingRepository(transaction_repo, counter), statistics).execute(
+                        GetStatisticsRequest(user_id=user_ids[0])
+                    )
+
+            await asyncio.gather(*(view() for _ in range(args.stampede)))
+            stampede[name] = counter["aggregate"]
+    finally:
+        await backend.stop()
+
+    print(f"{args.backend}: {args.users} users, history {args.history}, "
+          f"concurrency {args.concurrency}, write ratio {args.write_ratio:.0%}")
+    print_results(results)
+    print(f"\ncache: {cache.stats.hits} hits, {cache.stats.misses} misses, "
+          f"{cache.stats.coalesced} coalesced, {cache.stats.invalidations} invalidations")
+    print(f"stampede of {args.stampede} views: {stampede['uncached']} aggregate queries uncached, "
+          f"{stampede['cached']} cached")
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("memory", "postgres"), default="memory")
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--history", type=int, default=2000)
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--stampede", type=int, default=100)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+Latency / throughput benchmark of the application use cases.
+
+    PYTHONPATH=src python -m benchmarks.use_cases --backend memory --save benchmarks/baseline-memory.json
+    PYTHONPATH=src python -m benchmarks.use_cases --backend postgres --compare benchmarks/baseline-postgres.json
+
+The memory backend measures use case + repository overhead with no I/O.
+The postgres backend uses DatabaseProvider (POSTGRES_* settings), one
+session and commit per operation, and creates missing tables itself.
+SQLite is not supported: the repositories rely on PostgreSQL-only SQL
+(data-modifying CTEs, ON CONFLICT, date_trunc).
+"""
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Tuple
+
+from src.application.use_cases.create_user import CreateUserRequest, CreateUserUseCase
+from src.application.use_cases.deposit import DepositRequest, DepositUseCase
+from src.application.use_cases.withdraw import WithdrawRequest, WithdrawUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import AggregateDimension, TimeBucket
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.interfaces.password_hasher import IPasswordHasher
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.domain.interfaces.user_repo import IUserRepository
+from benchmarks.common import ScenarioResult, compare_with_baseline, print_results, run_scenario, save_baseline
+
+Repositories = Tuple[IUserRepository, ITransactionRepository]
+
+
+class PlainPasswordHasher(IPasswordHasher):
+    """Keeps hashing cost out of the numbers; PasswordHasher has its own pool."""
+
+    async def hash(self, password: str) -> str:
+        return password
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return password == hashed_password
+
+
+class MemoryBackend:
+    def __init__(self) -> None:
+        from src.infrastructure.memory.store import InMemoryStore
+        from src.infrastructure.memory.transaction import InMemoryTransactionRepository
+        from src.infrastructure.memory.users import InMemoryUserRepository
+
+        store = InMemoryStore()
+        self.user_repo = InMemoryUserRepository(store)
+        self.transaction_repo = InMemoryTransactionRepository(store)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @asynccontextmanager
+    async def repositories(self) -> AsyncIterator[Repositories]:
+        yield self.user_repo, self.transaction_repo
+
+
+class PostgresBackend:
+    async def start(self) -> None:
+        from infrastructure.database.base import Base
+        from src.infrastructure.database import DatabaseProvider
+
+        # Loads every model, so create_all sees all tables.
+        await DatabaseProvider.init_engine()
+        async with DatabaseProvider.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    async def stop(self) -> None:
+        from src.infrastructure.database import DatabaseProvider
+
+        await DatabaseProvider.dispose_engine()
+
+    @asynccontextmanager
+    async def repositories(self) -> AsyncIterator[Repositories]:
+        from infrastructure.database.repository.transaction import TransactionRepository
+        from infrastructure.database.repository.users import UserRepository
+        from src.infrastructure.database import DatabaseProvider
+
+        async with DatabaseProvider.session_factory() as session, session.begin():
+            yield UserRepository(session), TransactionRepository(session)
+
+
+async def seed(backend, users: int, history: int, run_id: str) -> List[int]:
+    """Users with a large balance and `history` transactions each."""
+    user_ids = []
+    hasher = PlainPasswordHasher()
+
+    for index in range(users):
+        async with backend.repositories() as (user_repo, transaction_repo):
+            user = await CreateUserUseCase(user_repo, hasher).execute(
+                CreateUserRequest(email=f"seed-{run_id}-{index}@bench", username="bench", password="x")
+            )
+            user_ids.append(user.user_id)
+            await DepositUseCase(user_repo, transaction_repo).execute(
+                DepositRequest(user_id=user.user_id, amount=Money(1_000_000_000_00))
+            )
+
+    rnd = random.Random(42)
+    transactions = (
+        Transaction(
+            user_id=user_id,
+            transaction_type=TransactionType.EXPENSE,
+            amount=Money(rnd.randint(1, 500_00)),
+            category=rnd.choice(list(TransactionCategory)),
+        )
+        for user_id in user_ids
+        for _ in range(history)
+    )
+    async with backend.repositories() as (_, transaction_repo):
+        await transaction_repo.create_many(transactions)
+
+    return user_ids
+
+
+async def main(args: argparse.Namespace) -> int:
+    backend = MemoryBackend() if args.backend == "memory" else PostgresBackend()
+    await backend.start()
+
+    try:
+        run_id = uuid.uuid4().hex[:8]
+        user_ids = await seed(backend, args.users, args.history, run_id)
+        hasher = PlainPasswordHasher()
+        rnd = random.Random(7)
+
+        async def create_user(index: int) -> None:
+            async with backend.repositories() as (user_repo, _):
+                await CreateUserUseCase(user_repo, hasher).execute(
+                    CreateUserRequest(email=f"{run_id}-{index}@bench", username="bench", password="x")
+                )
+
+        async def deposit(index: int) -> None:
+            async with backend.repositories() as (user_repo, transaction_repo):
+                await DepositUseCase(user_repo, transaction_repo).execute(
+                    DepositRequest(user_id=rnd.choice(user_ids), amount=Money(10_00))
+                )
+
+        async def withdraw(index: int) -> None:
+            async with backend.repositories() as (user_repo, transaction_repo):
+                await WithdrawUseCase(user_repo, transaction_repo).execute(
+                    WithdrawRequest(
+                        user_id=rnd.choice(user_ids), amount=Money(5_00), category=TransactionCategory.FOOD
+                    )
+                )
+
+        async def listing(index: int) -> None:
+            async with backend.repositories() as (_, transaction_repo):
+                await transaction_repo.get_page_by_user_id(rnd.choice(user_ids), limit=50)
+
+        async def aggregation(index: int) -> None:
+            async with backend.repositories() as (_, transaction_repo):
+                await transaction_repo.aggregate(
+                    [rnd.choice(user_ids)], [AggregateDimension.CATEGORY], TimeBucket.MONTH
+                )
+
+        scenarios = {
+            "create_user": create_user,
+            "deposit": deposit,
+            "withdraw": withdraw,
+            "list": listing,
+            "aggregate": aggregation,
+        }
+
+        results: Dict[str, ScenarioResult] = {}
+        for name, operation in scenarios.items():
+            if args.only and name not in args.only:
+                continue
+            results[name] = await run_scenario(operation, args.operations, args.concurrency)
+    finally:
+        await backend.stop()
+
+    print_results(results)
+
+    meta = {
+        "backend": args.backend,
+        "users": args.users,
+        "history": args.history,
+        "python": sys.version.split()[0],
+    }
+    if args.save:
+        save_baseline(args.save, meta, results)
+
+    if args.compare:
+        regressions = compare_with_baseline(args.compare, results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("memory", "postgres"), default="memory")
+    parser.add_argument("--operations", type=int, default=2000, help="Operations per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=50, help="Seeded users")
+    parser.add_argument("--history", type=int, default=200, help="Seeded transactions per user")
+    parser.add_argument("--only", nargs="*", help="Run only these scenarios")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Fail on regressions against this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
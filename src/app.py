@@ -1,20 +1,101 @@
+import asyncio
 from asyncio import CancelledError
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.application.instrumentation import set_metrics_sink
 from src.infrastructure.database import DatabaseProvider
-
+from src.infrastructure.config import budget_alert_config, cache_config, deposit_coalescing_config, telegram_config
+from src.infrastructure.metrics.factory import create_metrics_sink
+from src.presentation.middleware import RequestTimingMiddleware
+from src.presentation.routers import metrics
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Subsystems are imported where they are started, not at module level:
+    # a worker loads repositories, models and optional integrations only when
+    # its configuration enables them (see benchmarks/startup.py).
+    from src.infrastructure.cache.factory import create_cache_backend
+    from src.infrastructure.cache.statistics import StatisticsSnapshotCache
+    from src.infrastructure.database.factory import RepositoryFactory
+    from src.infrastructure.database.idempotency_cleanup import IdempotencyKeyCleaner
+    from src.infrastructure.database.partitions import TransactionPartitionManager
+    from src.infrastructure.security.password_hasher import PasswordHasher
+
     await DatabaseProvider.init_engine()
+    # Registration and login hash on its worker pool, stopped on shutdown.
+    app.state.password_hasher = PasswordHasher()
+    # Handed to GetStatisticsUseCase and, for invalidation, to deposit/withdraw
+    # (see presentation/dependencies.py, like the coalescer and expense events).
+    app.state.statistics = StatisticsSnapshotCache(
+        create_cache_backend(prefix="statistics:"), ttl=cache_config.statistics_ttl_seconds
+    )
+    # Repositories of request sessions: users behind the shared cache,
+    # transactions that invalidate statistics snapshots.
+    app.state.repositories = RepositoryFactory(create_cache_backend(), statistics=app.state.statistics)
+    cleanup = asyncio.create_task(
+        IdempotencyKeyCleaner(DatabaseProvider.session_factory).run()
+    )
+    partitions = asyncio.create_task(
+        TransactionPartitionManager(DatabaseProvider.session_factory).run()
+    )
+    app.state.deposit_coalescer = None
+    if deposit_coalescing_config.enabled:
+        from src.infrastructure.database.coalescing import TransactionCoalescer
+
+        app.state.deposit_coalescer = TransactionCoalescer(
+            DatabaseProvider.session_factory, user_repo_factory=app.state.repositories.users
+        )
+    # Outbound Telegram messages; None when no bot token is configured.
+    app.state.notifications = None
+    notifications = None
+    if telegram_config.bot_token is not None:
+        from src.infrastructure.database.dead_letters import SessionDeadLetterStore
+        from src.infrastructure.notifications.dispatcher import NotificationDispatcher
+        from src.infrastructure.notifications.telegram import TelegramBotClient
+
+        app.state.notifications = NotificationDispatcher(
+            TelegramBotClient.from_config(), SessionDeadLetterStore(DatabaseProvider.session_factory)
+        )
+        notifications = asyncio.create_task(app.state.notifications.run())
+    # Handed to WithdrawUseCase(events=...) by get_withdraw_use_case; None when budget alerts are disabled.
+    app.state.expense_events = None
+    budget_alerts = None
+    if budget_alert_config.enabled:
+        from src.infrastructure.database.budget_alerts import BudgetAlertConsumer
+        from src.infrastructure.events.factory import create_expense_event_queue
+
+        app.state.expense_events = create_expense_event_queue()
+        if app.state.notifications is not None:
+            from src.infrastructure.notifications.telegram import TelegramAlertNotifier
+
+            notifier = TelegramAlertNotifier(DatabaseProvider.session_factory, app.state.notifications)
+        else:
+            from src.infrastructure.notifications.log import LogAlertNotifier
+
+            notifier = LogAlertNotifier()
+        budget_alerts = asyncio.create_task(
+            BudgetAlertConsumer(
+                DatabaseProvider.session_factory, app.state.expense_events, notifier
+            ).run()
+        )
     try:
         yield
     except CancelledError:
         pass
     finally:
+        cleanup.cancel()
+        partitions.cancel()
+        if budget_alerts is not None:
+            budget_alerts.cancel()
+        if notifications is not None:
+            notifications.cancel()
+            await app.state.notifications.close()
+        if app.state.deposit_coalescer is not None:
+            await app.state.deposit_coalescer.close()
+        app.state.password_hasher.shutdown()
         await DatabaseProvider.dispose_engine()
 
 
@@ -28,6 +109,12 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    metrics_sink, metrics_histogram = create_metrics_sink()
+    set_metrics_sink(metrics_sink)
+    app.state.metrics_histogram = metrics_histogram
+
+    app.add_middleware(RequestTimingMiddleware)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:5173"],  # Vite dev server
@@ -36,6 +123,8 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.include_router(metrics.router)
+
     # TODO: register routers
     # api_prefix = "/api/v1"
     # app.include_router(auth.router, prefix=api_prefix)
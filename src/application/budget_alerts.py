@@ -0,0 +1,155 @@
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from src.domain.entities.budget import Budget, BudgetAlert
+from src.domain.entities.events import ExpenseRecorded
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import AggregateDimension, TimeBucket, TransactionAggregate, truncate_to_bucket
+from src.domain.entities.transaction import TransactionCategory, TransactionType
+from src.domain.interfaces.budget_repo import IBudgetRepository
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+
+
+class SpendKey(NamedTuple):
+    """Expenses of one user in one period, for one category or (None) all of them."""
+    user_id: int
+    category: Optional[TransactionCategory]
+    period: TimeBucket
+    period_start: datetime
+
+
+@dataclass
+class SpendCounter:
+    spent: Money
+    # Events up to this moment are already part of `spent` (it was seeded from the table).
+    seeded_through: datetime
+    # (budget_id, threshold) pairs known to have fired this period.
+    fired: Set[Tuple[int, int]] = field(default_factory=set)
+
+
+class BudgetAlertEvaluator:
+    """
+    Turns ExpenseRecorded events into budget alerts.
+
+    Spending is kept in incremental counters per user, category and period,
+    only for the combinations some budget watches. A counter is seeded once
+    from the database, with one aggregate query for all counters a batch is
+    missing, and from then on every event is a dict update. The least recently
+    used counters are dropped above max_counters and reseeded when needed.
+
+    A counter seeded while other expenses of the user are still in flight
+    can miss them or count them twice; it is exact again from the next
+    period on.
+    """
+
+    def __init__(self, max_counters: int = 100_000):
+        if max_counters <= 0:
+            raise ValueError("max_counters must be positive")
+        self.max_counters = max_counters
+        self.counters: OrderedDict[SpendKey, SpendCounter] = OrderedDict()
+
+    async def evaluate(
+        self,
+        events: Sequence[ExpenseRecorded],
+        budget_repo: IBudgetRepository,
+        transaction_repo: ITransactionRepository,
+    ) -> List[BudgetAlert]:
+        """Count the events and return the alerts that fire for the first time."""
+        if not events:
+            return []
+
+        budgets_by_user: Dict[int, List[Budget]] = defaultdict(list)
+        for budget in await budget_repo.get_by_user_ids(sorted({event.user_id for event in events})):
+            budgets_by_user[budget.user_id].append(budget)
+
+        watched: List[Tuple[ExpenseRecorded, Dict[SpendKey, List[Budget]]]] = []
+        unseeded: Dict[SpendKey, datetime] = {}
+
+        for event in events:
+            keys: Dict[SpendKey, List[Budget]] = defaultdict(list)
+            for budget in budgets_by_user.get(event.user_id, ()):
+                if budget.category is not None and budget.category != event.category:
+                    continue
+                key = SpendKey(
+                    event.user_id, budget.category, budget.period,
+                    truncate_to_bucket(event.date_created, budget.period),
+                )
+                keys[key].append(budget)
+                if key not in self.counters and key not in unseeded:
+                    unseeded[key] = event.date_created
+            if keys:
+                watched.append((event, keys))
+
+        if unseeded:
+            await self._seed(unseeded, transaction_repo)
+
+        candidates: List[BudgetAlert] = []
+        for event, keys in watched:
+            for key, budgets in keys.items():
+                counter = self._counter(key)
+                if counter is None:
+                    continue
+                if event.date_created > counter.seeded_through:
+                    counter.spent += event.amount
+
+                for budget in budgets:
+                    for threshold in budget.reached_thresholds(counter.spent):
+                        if (budget.budget_id, threshold) in counter.fired:
+                            continue
+                        counter.fired.add((budget.budget_id, threshold))
+                        candidates.append(
+                            BudgetAlert(
+                                budget_id=budget.budget_id,
+                                user_id=budget.user_id,
+                                category=budget.category,
+                                period=budget.period,
+                                period_start=key.period_start,
+                                threshold=threshold,
+                                spent=counter.spent,
+                                limit=budget.limit,
+                            )
+                        )
+
+        if not candidates:
+            return []
+        # Another worker, or this one before a restart, may have sent some already.
+        return await budget_repo.record_alerts(candidates)
+
+    def _counter(self, key: SpendKey) -> Optional[SpendCounter]:
+        counter = self.counters.get(key)
+        if counter is not None:
+            self.counters.move_to_end(key)
+        return counter
+
+    async def _seed(self, unseeded: Dict[SpendKey, datetime], transaction_repo: ITransactionRepository) -> None:
+        """
+        Expenses per user, category and day from the earliest period start up
+        to just before the first event of the batch; events after that point
+        are then counted on top.
+        """
+        seeded_through = min(unseeded.values()) - timedelta(microseconds=1)
+        daily = await transaction_repo.aggregate(
+            sorted({key.user_id for key in unseeded}),
+            group_by=[AggregateDimension.CATEGORY],
+            bucket=TimeBucket.DAY,
+            transaction_type=TransactionType.EXPENSE,
+            date_from=min(key.period_start for key in unseeded),
+            date_to=seeded_through,
+        )
+
+        daily_by_user: Dict[int, List[TransactionAggregate]] = defaultdict(list)
+        for row in daily:
+            daily_by_user[row.user_id].append(row)
+
+        for key in unseeded:
+            spent = Money(sum(
+                row.total
+                for row in daily_by_user.get(key.user_id, ())
+                if row.period_start >= key.period_start
+                and (key.category is None or row.category == key.category)
+            ))
+            self.counters[key] = SpendCounter(spent=spent, seeded_through=seeded_through)
+
+        while len(self.counters) > self.max_counters:
+            self.counters.popitem(last=False)
\ No newline at end of file
@@ -0,0 +1,11 @@
+from src.domain.interfaces.commit_hooks import AfterCommit, ICommitHooks
+
+
+class ImmediateCommitHooks(ICommitHooks):
+    """
+    For repositories without a surrounding transaction, such as the in-memory
+    ones: every write is visible at once, so callbacks run right away.
+    """
+
+    async def after_commit(self, callback: AfterCommit) -> None:
+        await callback()
\ No newline at end of file
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass(kw_only=True)
+class BulkImportResponseDTO:
+    """
+    Data Transfer Object for bulk import result.
+    """
+    imported: int
+    transaction_ids: List[int] = field(default_factory=list)
+    chunk_timings: List[float] = field(default_factory=list)
+    # Rows not imported: the user does not exist or their balance would have gone below zero.
+    rejected: int = 0
+    rejected_user_ids: List[int] = field(default_factory=list)
\ No newline at end of file
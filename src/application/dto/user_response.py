@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
+from src.domain.entities.money import Money
 
-@dataclass
+@dataclass(kw_only=True)
 class UserResponseDTO:
     """
     Data Transfer Object for user response.
@@ -11,5 +12,5 @@ class UserResponseDTO:
     email: str
     username: str
     number: Optional[str] = None
-    balance: float
+    balance: Money
     date_created: datetime
\ No newline at end of file
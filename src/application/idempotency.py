@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from src.domain.interfaces.idempotency_repo import IdempotencyRecord, IIdempotencyRepository
+from src.domain.entities.money import Money
+from src.application.dto.user_response import UserResponseDTO
+
+DEFAULT_TTL = timedelta(days=1)
+
+
+class IdempotencyGuard:
+    """
+    Replays the stored response of a deposit / withdraw retried with the same key.
+
+    A replay is a single SELECT: no user row lock, no insert. The first request
+    claims the key in its own DB transaction, so a failed request rolls the claim
+    back and the key can be retried; a concurrent duplicate waits on the claim
+    and then replays the committed response.
+    """
+
+    def __init__(self, repo: IIdempotencyRepository, ttl: timedelta = DEFAULT_TTL):
+        self.repo = repo
+        self.ttl = ttl
+
+    async def replay_or_claim(
+        self, user_id: int, key: str, fingerprint: Dict[str, Any]
+    ) -> Optional[UserResponseDTO]:
+        """Return the stored response, or None if the caller now owns the key."""
+        record = await self.repo.get(user_id, key)
+        if record is None:
+            if await self.repo.claim(user_id, key, self.ttl):
+                return None
+            record = await self.repo.get(user_id, key)
+            if record is None:
+                # claim() refuses keys of unknown users.
+                raise ValueError("User not found")
+
+        return self._replay(record, fingerprint)
+
+    async def remember(
+        self, user_id: int, key: str, fingerprint: Dict[str, Any], response: UserResponseDTO
+    ) -> None:
+        await self.repo.complete(user_id, key, {
+            "request": fingerprint,
+            "response": _dump_user_response(response),
+        })
+
+    @staticmethod
+    def _replay(record: IdempotencyRecord, fingerprint: Dict[str, Any]) -> UserResponseDTO:
+        if record.response is None:
+            raise ValueError("Request with this idempotency key is still in progress")
+        if record.response["request"] != fingerprint:
+            raise ValueError("Idempotency key was already used for a different request")
+        return _load_user_response(record.response["response"])
+
+
+def _dump_user_response(response: UserResponseDTO) -> Dict[str, Any]:
+    return {
+        "user_id": response.user_id,
+        "email": response.email,
+        "username": response.username,
+        "number": response.number,
+        "balance": int(response.balance),
+        "date_created": response.date_created.isoformat(),
+    }
+
+
+def _load_user_response(data: Dict[str, Any]) -> UserResponseDTO:
+    return UserResponseDTO(
+        user_id=data["user_id"],
+        email=data["email"],
+        username=data["username"],
+        number=data["number"],
+        balance=Money(data["balance"]),
+        date_created=datetime.fromisoformat(data["date_created"]),
+    )
\ No newline at end of file
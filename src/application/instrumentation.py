@@ -0,0 +1,64 @@
+import functools
+import inspect
+import time
+from typing import Any, Callable, TypeVar
+from src.domain.interfaces.metrics import IMetricsSink, NullMetricsSink
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+USE_CASE_DURATION = "use_case_duration_seconds"
+
+_metrics_sink: IMetricsSink = NullMetricsSink()
+
+
+def set_metrics_sink(sink: IMetricsSink) -> None:
+    """Install the process-wide sink; called once at startup."""
+    global _metrics_sink
+    _metrics_sink = sink
+
+
+def get_metrics_sink() -> IMetricsSink:
+    return _metrics_sink
+
+
+def timed_use_case(func: F) -> F:
+    """
+    Time a use case's execute() into use_case_duration_seconds{use_case=<class>}.
+    Failed calls are recorded too, with outcome="error".
+    Async generator executes are timed until the stream is exhausted or closed.
+    """
+
+    def observe(self: Any, started: float, outcome: str) -> None:
+        _metrics_sink.observe(
+            USE_CASE_DURATION,
+            time.perf_counter() - started,
+            {"use_case": type(self).__name__, "outcome": outcome},
+        )
+
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def stream_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+                outcome = "ok"
+            finally:
+                observe(self, started, outcome)
+
+        return stream_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await func(self, *args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            observe(self, started, outcome)
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Optional
+from src.domain.entities.statistics import AggregateDimension, StatisticsSnapshot, TimeBucket, truncate_to_bucket
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+
+async def compute_snapshot(
+    transaction_repo: ITransactionRepository,
+    user_id: int,
+    period: TimeBucket,
+    bucket: TimeBucket,
+    now: Optional[datetime] = None,
+) -> StatisticsSnapshot:
+    """
+    One aggregate query from the start of the current period on. The range
+    starts at midnight and is open-ended, so it is served from the daily rollup.
+    """
+    if bucket.rank > period.rank:
+        raise ValueError("Bucket must not be larger than the period")
+
+    period_start = truncate_to_bucket(now or datetime.now(), period)
+    groups = await transaction_repo.aggregate(
+        [user_id],
+        group_by=(AggregateDimension.TRANSACTION_TYPE, AggregateDimension.CATEGORY),
+        bucket=bucket,
+        date_from=period_start,
+    )
+
+    return StatisticsSnapshot(
+        user_id=user_id,
+        period=period,
+        bucket=bucket,
+        period_start=period_start,
+        groups=groups,
+    )
\ No newline at end of file
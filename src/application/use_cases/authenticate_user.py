@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from src.domain.interfaces.user_repo import IUserRepository
+from src.domain.interfaces.password_hasher import IPasswordHasher
+from src.application.dto.user_response import UserResponseDTO
+from src.application.instrumentation import timed_use_case
+
+@dataclass
+class AuthenticateUserRequest:
+    """DTO for logging in with email and password."""
+    email: str
+    password: str
+
+class AuthenticateUserUseCase:
+    def __init__(
+            self,
+            user_repo: IUserRepository,
+            password_hasher: IPasswordHasher
+        ):
+        self.user_repo = user_repo
+        self.password_hasher = password_hasher
+
+    @timed_use_case
+    async def execute(self, request: AuthenticateUserRequest) -> UserResponseDTO:
+        user = await self.user_repo.get_by_email(request.email)
+        if not user:
+            raise ValueError("Invalid email or password")
+
+        if not await self.password_hasher.verify(request.password, user.hashed_password):
+            raise ValueError("Invalid email or password")
+
+        # The plain password is only available now, so outdated hashes are upgraded on login.
+        # Only the hash is written, and only if no concurrent login replaced it first.
+        if self.password_hasher.needs_rehash(user.hashed_password):
+            try:
+                new_hash = await self.password_hasher.hash(request.password)
+            except ValueError:
+                # The configured scheme does not take this password (bcrypt: over 72 bytes);
+                # the old hash still works.
+                new_hash = None
+            if new_hash is not None:
+                await self.user_repo.replace_password_hash(user.user_id, user.hashed_password, new_hash)  # type: ignore[arg-type]
+
+        return UserResponseDTO(
+            user_id=user.user_id,  # type: ignore[arg-type]
+            email=user.email,
+            username=user.username,
+            number=user.number,
+            balance=user.balance,
+            date_created=user.date_created,
+        )
\ No newline at end of file
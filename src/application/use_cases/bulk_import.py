@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Set, Union
+from src.domain.entities.transaction import Transaction, TransactionCategory
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.domain.interfaces.user_repo import IUserRepository
+from src.domain.interfaces.categorizer import ITransactionCategorizer
+from src.application.dto.transaction_response import BulkImportResponseDTO
+from src.application.instrumentation import timed_use_case
+
+@dataclass
+class BulkImportRequest:
+    """DTO for importing many transactions at once (e.g. a bank statement)."""
+    transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]]
+    chunk_size: int = 1000
+
+class BulkImportUseCase:
+    def __init__(
+        self,
+        transaction_repo: ITransactionRepository,
+        user_repo: Optional[IUserRepository] = None,
+        categorizer: Optional[ITransactionCategorizer] = None,
+    ):
+        self.transaction_repo = transaction_repo
+        self.user_repo = user_repo
+        self.categorizer = categorizer
+
+    async def _validated(
+        self,
+        transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]],
+        user_ids: Set[int],
+    ) -> AsyncIterator[Transaction]:
+        """Validate rows lazily so the source is never materialized."""
+        if isinstance(transactions, AsyncIterable):
+            async for transaction in transactions:
+                yield self._validate(transaction, user_ids)
+        else:
+            for transaction in transactions:
+                yield self._validate(transaction, user_ids)
+
+    async def _categorized(
+        self,
+        transactions: AsyncIterator[Transaction],
+        chunk_size: int,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Rows left as OTHER that have a description get a predicted category.
+        Rows are categorized chunk_size at a time, one categorizer call per chunk.
+        """
+        chunk: List[Transaction] = []
+
+        async for transaction in transactions:
+            chunk.append(transaction)
+            if len(chunk) >= chunk_size:
+                await self._categorize_chunk(chunk)
+                for row in chunk:
+                    yield row
+                chunk = []
+
+        await self._categorize_chunk(chunk)
+        for row in chunk:
+            yield row
+
+    async def _categorize_chunk(self, chunk: List[Transaction]) -> None:
+        uncategorized = [
+            transaction
+            for transaction in chunk
+            if transaction.category == TransactionCategory.OTHER and transaction.description
+        ]
+        if not uncategorized:
+            return
+
+        categories = await self.categorizer.categorize(
+            [transaction.description for transaction in uncategorized]
+        )
+        for transaction, category in zip(uncategorized, categories):
+            transaction.category = category
+
+    def _validate(self, transaction: Transaction, user_ids: Set[int]) -> Transaction:
+        if not isinstance(transaction.amount, int) or isinstance(transaction.amount, bool):
+            raise ValueError("Amount must be Money (minor units), not float or bool")
+        if transaction.amount <= 0:
+            raise ValueError("Amount must be positive")
+        user_ids.add(transaction.user_id)
+        return transaction
+
+    @timed_use_case
+    async def execute(self, request: BulkImportRequest) -> BulkImportResponseDTO:
+
+        if request.chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        user_ids: Set[int] = set()
+
+        rows = self._validated(request.transactions, user_ids)
+        if self.categorizer:
+            rows = self._categorized(rows, request.chunk_size)
+
+        result = await self.transaction_repo.create_many(
+            rows,
+            chunk_size=request.chunk_size,
+        )
+
+        # Balances were changed behind the user repository's back.
+        if self.user_repo:
+            for user_id in user_ids:
+                await self.user_repo.invalidate(user_id)
+
+        return BulkImportResponseDTO(
+            imported=len(result.transaction_ids),
+            transaction_ids=result.transaction_ids,
+            chunk_timings=result.chunk_timings,
+            rejected=len(result.rejected),
+            rejected_user_ids=result.rejected_user_ids,
+        )
\ No newline at end of file
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from src.domain.entities.budget import Budget
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import TimeBucket
+from src.domain.entities.transaction import TransactionCategory
+from src.domain.interfaces.budget_repo import IBudgetRepository
+from src.domain.interfaces.user_repo import IUserRepository
+from src.application.instrumentation import timed_use_case
+
+@dataclass(kw_only=True)
+class CreateBudgetRequest:
+    user_id: int
+    limit: Money
+    category: Optional[TransactionCategory] = None
+    period: TimeBucket = TimeBucket.MONTH
+    thresholds: Tuple[int, ...] = (80, 100)
+
+
+class CreateBudgetUseCase:
+    def __init__(self, user_repo: IUserRepository, budget_repo: IBudgetRepository):
+        self.user_repo = user_repo
+        self.budget_repo = budget_repo
+
+    @timed_use_case
+    async def execute(self, request: CreateBudgetRequest) -> Budget:
+
+        if not isinstance(request.limit, int) or isinstance(request.limit, bool):
+            raise ValueError("Limit must be Money (minor units), not float or bool")
+        if request.limit <= 0:
+            raise ValueError("Limit must be positive")
+        if not request.thresholds or any(threshold <= 0 for threshold in request.thresholds):
+            raise ValueError("Thresholds must be positive percents of the limit")
+
+        user = await self.user_repo.get_by_id(request.user_id, with_lock=False)
+        if not user:
+            raise ValueError("User not found")
+
+        return await self.budget_repo.create(
+            Budget(
+                user_id=request.user_id,
+                category=request.category,
+                period=request.period,
+                limit=Money(request.limit),
+                thresholds=tuple(sorted(set(request.thresholds))),
+            )
+        )
\ No newline at end of file
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional
+from src.domain.entities.money import Money
 from src.domain.entities.user import User
 from src.domain.interfaces.user_repo import IUserRepository
 from src.domain.interfaces.password_hasher import IPasswordHasher
 from src.application.dto.user_response import UserResponseDTO 
+from src.application.instrumentation import timed_use_case
 
 @dataclass
 class CreateUserRequest:
@@ -22,6 +24,7 @@ class CreateUserUseCase:
         self.user_repo = user_repo
         self.password_hasher = password_hasher
 
+    @timed_use_case
     async def execute(self, request: CreateUserRequest) -> UserResponseDTO:
         existing_user = await self.user_repo.get_by_email(request.email)
         if existing_user:
@@ -34,7 +37,7 @@ class CreateUserUseCase:
             username=request.username,
             hashed_password=hashed_password,
             number=request.number,
-            balance=0.0,
+            balance=Money(0),
         )
 
         created_user = await self.user_repo.create(new_user)
@@ -1,49 +1,104 @@
 from dataclasses import dataclass
-from src.domain.entities.user import User
+from datetime import timedelta
+from functools import partial
+from typing import Optional
+from src.domain.entities.money import Money
 from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
 from src.domain.interfaces.user_repo import IUserRepository
 from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.domain.interfaces.idempotency_repo import IIdempotencyRepository
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.domain.interfaces.transaction_coalescer import ITransactionCoalescer
+from src.domain.interfaces.commit_hooks import ICommitHooks
+from src.application.commit_hooks import ImmediateCommitHooks
 from src.application.dto.user_response import UserResponseDTO
+from src.application.idempotency import DEFAULT_TTL, IdempotencyGuard
+from src.application.instrumentation import timed_use_case
 
 @dataclass
 class DepositRequest:
     user_id: int
-    amount: float
+    amount: Money
     transaction_type: TransactionType = TransactionType.INCOME
     category: TransactionCategory = TransactionCategory.OTHER
+    idempotency_key: Optional[str] = None
 
 class DepositUseCase:
     def __init__(
         self,
         user_repo: IUserRepository,
         transaction_repo: ITransactionRepository,
+        idempotency_repo: Optional[IIdempotencyRepository] = None,
+        idempotency_ttl: timedelta = DEFAULT_TTL,
+        coalescer: Optional[ITransactionCoalescer] = None,
+        statistics: Optional[IStatisticsCache] = None,
+        commit_hooks: Optional[ICommitHooks] = None,
     ):
         self.user_repo = user_repo
         self.transaction_repo = transaction_repo
+        self.coalescer = coalescer
+        self.statistics = statistics
+        # Statistics are invalidated once the deposit is committed.
+        self.commit_hooks = commit_hooks or ImmediateCommitHooks()
+        self.idempotency = (
+            IdempotencyGuard(idempotency_repo, idempotency_ttl) if idempotency_repo else None
+        )
 
+    @timed_use_case
     async def execute(self, request: DepositRequest) -> UserResponseDTO:
 
+        # bool is an int subclass: True would be one minor unit.
+        if not isinstance(request.amount, int) or isinstance(request.amount, bool):
+            raise ValueError("Amount must be Money (minor units), not float or bool")
         if request.amount <= 0:
             raise ValueError("Amount must be positive")
+        amount = Money(request.amount)
 
-        current_user = await self.user_repo.get_by_id(request.user_id)
-        if not current_user:
-            raise ValueError("User not found")
-        
-        current_user.deposit(request.amount) 
+        key = request.idempotency_key
+        if key is not None:
+            if self.idempotency is None:
+                raise ValueError("Idempotency keys are not supported")
+            fingerprint = {
+                "operation": "deposit",
+                "amount": int(amount),
+                "transaction_type": request.transaction_type.name,
+                "category": request.category.name,
+            }
+            replayed = await self.idempotency.replay_or_claim(request.user_id, key, fingerprint)
+            if replayed is not None:
+                return replayed
 
-        await self.user_repo.update(current_user)
-        
         new_transaction = Transaction(
-            user_id=current_user.user_id,
+            user_id=request.user_id,
             transaction_type=request.transaction_type,
-            amount=request.amount,
+            amount=amount,
             category=request.category,  
         )
 
-        await self.transaction_repo.create(new_transaction)
+        coalesced = self.coalescer is not None and key is None
+        if coalesced:
+            # Merged with concurrent deposits of the user and committed separately;
+            # keyed requests stay on the request transaction with their claim.
+            current_user = await self.coalescer.apply_transaction(
+                new_transaction,
+                delta=amount,
+            )
+        else:
+            current_user = await self.user_repo.apply_transaction(
+                new_transaction,
+                delta=amount,
+            )
+        if not current_user:
+            raise ValueError("User not found")
+
+        if self.statistics is not None:
+            if coalesced:
+                # The coalescer has committed already.
+                await self.statistics.invalidate(request.user_id)
+            else:
+                await self.commit_hooks.after_commit(partial(self.statistics.invalidate, request.user_id))
 
-        return UserResponseDTO(
+        response = UserResponseDTO(
             user_id=current_user.user_id,
             email=current_user.email,
             username=current_user.username,
@@ -51,3 +106,8 @@ class DepositUseCase:
             balance=current_user.balance,
             date_created=current_user.date_created, 
         )
+
+        if key is not None:
+            await self.idempotency.remember(request.user_id, key, fingerprint, response)
+
+        return response
@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Optional
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.application.instrumentation import timed_use_case
+
+CSV_HEADER = ("transaction_id", "transaction_type", "amount", "category", "description", "date_created")
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+@dataclass
+class ExportTransactionsRequest:
+    """DTO for exporting a user's transaction history."""
+    user_id: int
+    export_format: ExportFormat = ExportFormat.CSV
+    transaction_type: Optional[TransactionType] = None
+    category: Optional[TransactionCategory] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    rows_per_chunk: int = 500
+
+class ExportTransactionsUseCase:
+    """
+    Streams the history as text chunks of rows_per_chunk rows each,
+    so memory use does not depend on how long the history is.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: ITransactionRepository,
+    ):
+        self.transaction_repo = transaction_repo
+
+    def _csv_row(self, transaction: Transaction) -> tuple:
+        return (
+            transaction.transaction_id,
+            transaction.transaction_type.value,
+            str(transaction.amount),
+            transaction.category.value,
+            transaction.description,
+            transaction.date_created.isoformat(),
+        )
+
+    def _ndjson_line(self, transaction: Transaction) -> str:
+        return json.dumps(
+            {
+                "transaction_id": transaction.transaction_id,
+                "transaction_type": transaction.transaction_type.value,
+                "amount": str(transaction.amount),
+                "category": transaction.category.value,
+                "description": transaction.description,
+                "date_created": transaction.date_created.isoformat(),
+            }
+        ) + "\n"
+
+    @timed_use_case
+    async def execute(self, request: ExportTransactionsRequest) -> AsyncIterator[str]:
+
+        if request.rows_per_chunk <= 0:
+            raise ValueError("Rows per chunk must be positive")
+
+        transactions = self.transaction_repo.iter_by_user_id(
+            request.user_id,
+            transaction_type=request.transaction_type,
+            category=request.category,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            batch_size=request.rows_per_chunk,
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        rows_in_buffer = 0
+
+        if request.export_format == ExportFormat.CSV:
+            writer.writerow(CSV_HEADER)
+
+        async for transaction in transactions:
+            if request.export_format == ExportFormat.CSV:
+                writer.writerow(self._csv_row(transaction))
+            else:
+                buffer.write(self._ndjson_line(transaction))
+
+            rows_in_buffer += 1
+            if rows_in_buffer >= request.rows_per_chunk:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows_in_buffer = 0
+
+        if buffer.tell():
+            yield buffer.getvalue()
\ No newline at end of file
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Optional
+from src.domain.entities.statistics import StatisticsSnapshot, TimeBucket
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.application.instrumentation import timed_use_case
+from src.application.statistics import compute_snapshot
+
+@dataclass(kw_only=True)
+class GetStatisticsRequest:
+    user_id: int
+    period: TimeBucket = TimeBucket.MONTH
+    bucket: TimeBucket = TimeBucket.DAY
+
+
+class GetStatisticsUseCase:
+    def __init__(
+        self,
+        transaction_repo: ITransactionRepository,
+        statistics: Optional[IStatisticsCache] = None,
+    ):
+        self.transaction_repo = transaction_repo
+        self.statistics = statistics
+
+    @timed_use_case
+    async def execute(self, request: GetStatisticsRequest) -> StatisticsSnapshot:
+
+        if request.bucket.rank > request.period.rank:
+            raise ValueError("Bucket must not be larger than the period")
+
+        async def compute() -> StatisticsSnapshot:
+            return await compute_snapshot(
+                self.transaction_repo, request.user_id, request.period, request.bucket
+            )
+
+        if self.statistics is None:
+            return await compute()
+
+        return await self.statistics.get_or_compute(
+            request.user_id, request.period, request.bucket, compute
+        )
\ No newline at end of file
@@ -1,16 +1,28 @@
 from dataclasses import dataclass
-from src.domain.entities.user import User
+from datetime import timedelta
+from functools import partial
+from typing import Optional
+from src.domain.entities.events import ExpenseRecorded
+from src.domain.entities.money import Money
 from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
 from src.domain.interfaces.user_repo import IUserRepository
 from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.domain.interfaces.idempotency_repo import IIdempotencyRepository
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.domain.interfaces.event_queue import IExpenseEventQueue
+from src.domain.interfaces.commit_hooks import ICommitHooks
+from src.application.commit_hooks import ImmediateCommitHooks
 from src.application.dto.user_response import UserResponseDTO
+from src.application.idempotency import DEFAULT_TTL, IdempotencyGuard
+from src.application.instrumentation import timed_use_case
 
-@dataclass
+@dataclass(kw_only=True)
 class WithdrawRequest:
     user_id: int
-    amount: float
+    amount: Money
     transaction_type: TransactionType = TransactionType.EXPENSE
     category: TransactionCategory
+    idempotency_key: Optional[str] = None
 
 
 class WithdrawUseCase:
@@ -18,40 +30,91 @@ class WithdrawUseCase:
         self,
         user_repo: IUserRepository,
         transaction_repo: ITransactionRepository,
+        idempotency_repo: Optional[IIdempotencyRepository] = None,
+        idempotency_ttl: timedelta = DEFAULT_TTL,
+        events: Optional[IExpenseEventQueue] = None,
+        statistics: Optional[IStatisticsCache] = None,
+        commit_hooks: Optional[ICommitHooks] = None,
     ):
         self.user_repo = user_repo
         self.transaction_repo = transaction_repo
+        self.events = events
+        self.statistics = statistics
+        # Statistics are invalidated and events published once the withdrawal is committed.
+        self.commit_hooks = commit_hooks or ImmediateCommitHooks()
+        self.idempotency = (
+            IdempotencyGuard(idempotency_repo, idempotency_ttl) if idempotency_repo else None
+        )
 
+    @timed_use_case
     async def execute(self, request: WithdrawRequest) -> UserResponseDTO:
         
+        # bool is an int subclass: True would be one minor unit.
+        if not isinstance(request.amount, int) or isinstance(request.amount, bool):
+            raise ValueError("Amount must be Money (minor units), not float or bool")
         if request.amount <= 0:
             raise ValueError("Amount must be positive")
-        
-        current_user = await self.user_repo.get_by_id(request.user_id)
-        if not current_user:
-            raise ValueError("User not found")
-
-        try:
-            current_user.withdraw(request.amount)
-        except ValueError as e:
-            raise ValueError(f"Withdrawal failed: {str(e)}")
-
-        await self.user_repo.update(current_user)
+        amount = Money(request.amount)
 
+        key = request.idempotency_key
+        if key is not None:
+            if self.idempotency is None:
+                raise ValueError("Idempotency keys are not supported")
+            fingerprint = {
+                "operation": "withdraw",
+                "amount": int(amount),
+                "transaction_type": request.transaction_type.name,
+                "category": request.category.name,
+            }
+            replayed = await self.idempotency.replay_or_claim(request.user_id, key, fingerprint)
+            if replayed is not None:
+                return replayed
+        
         new_transaction = Transaction(
-            user_id=current_user.user_id,
+            user_id=request.user_id,
             transaction_type=request.transaction_type,
-            amount=request.amount,
+            amount=amount,
             category=request.category,  
         )
 
-        await self.transaction_repo.create(new_transaction)
+        current_user = await self.user_repo.apply_transaction(
+            new_transaction,
+            delta=-amount,
+            min_balance=Money(0),
+        )
+        if not current_user:
+            # Slow path only: find out why the guarded update matched no rows.
+            existing_user = await self.user_repo.get_by_id(request.user_id, with_lock=False)
+            if not existing_user:
+                raise ValueError("User not found")
+            raise ValueError("Withdrawal failed: Not enough balance for withdrawal")
+
+        if self.statistics is not None:
+            await self.commit_hooks.after_commit(partial(self.statistics.invalidate, request.user_id))
+
+        if self.events is not None and new_transaction.transaction_type == TransactionType.EXPENSE:
+            # Budgets are evaluated by a background consumer; the cost here does
+            # not depend on how many budgets the user has. Published after commit,
+            # so the consumer's totals include this expense and a rollback sends nothing.
+            event = ExpenseRecorded(
+                user_id=new_transaction.user_id,
+                transaction_id=new_transaction.transaction_id,
+                category=new_transaction.category,
+                amount=amount,
+                date_created=new_transaction.date_created,
+            )
+            await self.commit_hooks.after_commit(partial(self.events.publish, event))
 
-        return UserResponseDTO(
+        response = UserResponseDTO(
             user_id=current_user.user_id,
             email=current_user.email,
             username=current_user.username,
             number=current_user.number,   
             balance=current_user.balance,
             date_created=current_user.date_created, 
-        )
\ No newline at end of file
+        )
+
+        if key is not None:
+            await self.idempotency.remember(request.user_id, key, fingerprint, response)
+
+        return response
\ No newline at end of file
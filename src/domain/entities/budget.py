@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import TimeBucket
+from src.domain.entities.transaction import TransactionCategory
+
+@dataclass(kw_only=True, slots=True)
+class Budget:
+    """
+    Domain Entity: a spending limit per period, for one category or
+    (category None) for all expenses. Thresholds are percents of the limit
+    that trigger an alert once per period.
+    """
+    budget_id: Optional[int] = None
+    user_id: int
+    category: Optional[TransactionCategory] = None
+    period: TimeBucket = TimeBucket.MONTH
+    limit: Money
+    thresholds: Tuple[int, ...] = (80, 100)
+    date_created: datetime = field(default_factory=datetime.now)
+
+    def reached_thresholds(self, spent: Money) -> List[int]:
+        """Thresholds that spending of a period has reached, lowest first."""
+        return [
+            threshold
+            for threshold in sorted(self.thresholds)
+            if int(spent) * 100 >= int(self.limit) * threshold
+        ]
+
+@dataclass(kw_only=True, slots=True)
+class BudgetAlert:
+    """
+    Domain Entity: a budget threshold reached within one period.
+    Fired at most once per (budget_id, period_start, threshold).
+    """
+    budget_id: int
+    user_id: int
+    category: Optional[TransactionCategory]
+    period: TimeBucket
+    period_start: datetime
+    threshold: int
+    spent: Money
+    limit: Money
\ No newline at end of file
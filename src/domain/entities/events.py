@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionCategory
+
+@dataclass(kw_only=True, slots=True)
+class ExpenseRecorded:
+    """
+    Domain Event: an expense was written for a user.
+    Published by the write path, consumed in the background.
+    """
+    user_id: int
+    transaction_id: int
+    category: TransactionCategory
+    amount: Money
+    date_created: datetime
\ No newline at end of file
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionCategory
+
+@dataclass(kw_only=True, slots=True)
+class DailySpending:
+    """Expenses of one calendar day and the trailing average ending on it."""
+    day: date
+    total: Money
+    rolling_average: Money
+
+@dataclass(kw_only=True, slots=True)
+class SpendingAnomaly:
+    """An expense far above what the user usually spends in its category."""
+    transaction_id: int
+    category: TransactionCategory
+    amount: Money
+    date_created: datetime
+    z_score: float
+
+@dataclass(kw_only=True, slots=True)
+class CategoryDelta:
+    """Month-over-month change of expenses in one category."""
+    month_start: date
+    category: TransactionCategory
+    previous_total: Money
+    current_total: Money
+    change: Money
+    change_ratio: Optional[float] = None
+
+@dataclass(kw_only=True, slots=True)
+class SpendingInsights:
+    """
+    Domain Entity: spending statistics behind the savings advice.
+    Only expenses are taken into account.
+    """
+    user_id: int
+    daily: List[DailySpending] = field(default_factory=list)
+    anomalies: List[SpendingAnomaly] = field(default_factory=list)
+    category_deltas: List[CategoryDelta] = field(default_factory=list)
\ No newline at end of file
@@ -0,0 +1,80 @@
+from decimal import Decimal, InvalidOperation
+from typing import Any, Union
+
+MINOR_UNITS = 100
+
+
+class Money(int):
+    """
+    Value type: an amount of money in minor units (kopecks, cents).
+
+    Money is an int, so BIGINT values from the database become Money without
+    any conversion work, sums stay exact and comparisons are plain int ones.
+    Arithmetic with Money / int stays Money; mixing in a float is a TypeError
+    because that is exactly where rounding drift comes from.
+
+        Money.from_major("12.34") == Money(1234)
+        str(Money(1234)) == "12.34"
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_major(cls, value: Union[str, int, float, Decimal]) -> "Money":
+        """Parse major units ("12.34", 12, Decimal("12.34")); more than 2 decimals is an error."""
+        try:
+            minor = Decimal(str(value)) * MINOR_UNITS
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {value!r}") from None
+
+        if minor != minor.to_integral_value():
+            raise ValueError(f"Amount has more than 2 decimal places: {value!r}")
+
+        return cls(int(minor))
+
+    @property
+    def major(self) -> Decimal:
+        return Decimal(int(self)).scaleb(-2)
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __str__(self) -> str:
+        sign = "-" if self < 0 else ""
+        units, cents = divmod(abs(int(self)), MINOR_UNITS)
+        return f"{sign}{units}.{cents:02d}"
+
+    def _check(self, other: Any) -> bool:
+        if isinstance(other, float):
+            raise TypeError("Money cannot be combined with float, use Money.from_major()")
+        return isinstance(other, int)
+
+    def __add__(self, other: Any) -> "Money":
+        if not self._check(other):
+            return NotImplemented
+        return Money(int.__add__(self, other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> "Money":
+        if not self._check(other):
+            return NotImplemented
+        return Money(int.__sub__(self, other))
+
+    def __rsub__(self, other: Any) -> "Money":
+        if not self._check(other):
+            return NotImplemented
+        return Money(int.__rsub__(self, other))
+
+    def __mul__(self, other: Any) -> "Money":
+        if not self._check(other):
+            return NotImplemented
+        return Money(int.__mul__(self, other))
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(int.__neg__(self))
+
+    def __abs__(self) -> "Money":
+        return Money(int.__abs__(self))
\ No newline at end of file
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from typing import Optional
+
+class NotificationPriority(IntEnum):
+    """Lower values are sent first."""
+    ALERT = 0
+    REPLY = 1
+    DIGEST = 2
+
+@dataclass(kw_only=True, slots=True)
+class Notification:
+    """
+    Domain Entity: a message to one chat. Mergeable notifications still
+    waiting for their turn are combined into one message per chat.
+    """
+    chat_id: int
+    text: str
+    priority: NotificationPriority = NotificationPriority.REPLY
+    mergeable: bool = False
+    date_created: datetime = field(default_factory=datetime.now)
+
+@dataclass(kw_only=True, slots=True)
+class DeadLetter:
+    """
+    Domain Entity: a message given up on after its last failed attempt.
+    """
+    dead_letter_id: Optional[int] = None
+    chat_id: int
+    text: str
+    priority: NotificationPriority
+    attempts: int
+    error: str
+    date_created: datetime = field(default_factory=datetime.now)
\ No newline at end of file
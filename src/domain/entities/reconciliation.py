@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from src.domain.entities.money import Money
+
+@dataclass(kw_only=True, slots=True)
+class BalanceDiscrepancy:
+    """
+    Domain Entity: a user whose stored balance differs from the balance
+    implied by their transactions (income minus expense).
+    """
+    user_id: int
+    stored_balance: Money
+    computed_balance: Money
+
+    @property
+    def difference(self) -> Money:
+        return self.stored_balance - self.computed_balance
\ No newline at end of file
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+from enum import Enum
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionCategory, TransactionType
+
+class TimeBucket(Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+    @property
+    def rank(self) -> int:
+        """0 for DAY up to 3 for YEAR; larger buckets rank higher."""
+        return list(TimeBucket).index(self)
+
+
+def truncate_to_bucket(moment: datetime, bucket: TimeBucket) -> datetime:
+    """Python counterpart of PostgreSQL date_trunc (weeks start on Monday)."""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if bucket == TimeBucket.DAY:
+        return day
+    if bucket == TimeBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == TimeBucket.MONTH:
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+class AggregateDimension(Enum):
+    TRANSACTION_TYPE = "transaction_type"
+    CATEGORY = "category"
+
+@dataclass(kw_only=True, slots=True)
+class TransactionAggregate:
+    """
+    Domain Entity: one group of an aggregation over transactions.
+    Dimensions that were not grouped by are None.
+    """
+    user_id: int
+    transaction_type: Optional[TransactionType] = None
+    category: Optional[TransactionCategory] = None
+    period_start: Optional[datetime] = None
+    total: Money
+    count: int
+    min_amount: Money
+    max_amount: Money
+
+@dataclass(kw_only=True, slots=True)
+class StatisticsSnapshot:
+    """
+    Domain Entity: a user's totals for the current period (this week, month
+    or year) since period_start, by transaction type and category, per bucket.
+    """
+    user_id: int
+    period: TimeBucket
+    bucket: TimeBucket
+    period_start: datetime
+    groups: List[TransactionAggregate] = field(default_factory=list)
+    computed_at: datetime = field(default_factory=datetime.now)
+
+    def total(self, transaction_type: TransactionType) -> Money:
+        return Money(sum(group.total for group in self.groups if group.transaction_type == transaction_type))
\ No newline at end of file
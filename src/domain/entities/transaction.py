@@ -1,7 +1,9 @@
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, List, Optional, Sequence
 from enum import Enum
+from src.domain.entities.money import Money
 
 class TransactionType(Enum):
     INCOME = "income"
@@ -14,7 +16,7 @@ class TransactionCategory(Enum):
     UTILITIES = "utilities"
     OTHER = "other"
 
-@dataclass
+@dataclass(kw_only=True, slots=True)
 class Transaction:
     """
     Domain Entity: Transaction.
@@ -22,6 +24,62 @@ class Transaction:
     transaction_id: Optional[int] = None
     user_id: int
     transaction_type: TransactionType
-    amount: float
+    amount: Money
     category: TransactionCategory
-    date_created: datetime = field(default_factory=datetime.now)
\ No newline at end of file
+    description: Optional[str] = None
+    date_created: datetime = field(default_factory=datetime.now)
+
+@dataclass(slots=True)
+class TransactionBatch:
+    """
+    Columnar container for bulk reads: one array or list per field instead
+    of one Transaction object per row. Ids and amounts (minor units) live
+    in compact array buffers (8 bytes per row each). Enum and datetime columns hold
+    references to shared or row-sized objects.
+    Rows are materialized as Transaction only when indexed or iterated.
+    """
+    transaction_ids: array = field(default_factory=lambda: array("q"))
+    user_ids: array = field(default_factory=lambda: array("q"))
+    transaction_types: List[TransactionType] = field(default_factory=list)
+    amounts: array = field(default_factory=lambda: array("q"))
+    categories: List[TransactionCategory] = field(default_factory=list)
+    descriptions: List[Optional[str]] = field(default_factory=list)
+    dates_created: List[datetime] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "TransactionBatch":
+        """
+        Build from (transaction_id, user_id, transaction_type, amount,
+        category, description, date_created) tuples, transposed in C by zip().
+        """
+        if not rows:
+            return cls()
+
+        ids, user_ids, types, amounts, categories, descriptions, dates = zip(*rows)
+        return cls(
+            transaction_ids=array("q", ids),
+            user_ids=array("q", user_ids),
+            transaction_types=list(types),
+            amounts=array("q", amounts),
+            categories=list(categories),
+            descriptions=list(descriptions),
+            dates_created=list(dates),
+        )
+
+    def __len__(self) -> int:
+        return len(self.transaction_ids)
+
+    def __getitem__(self, index: int) -> Transaction:
+        return Transaction(
+            transaction_id=self.transaction_ids[index],
+            user_id=self.user_ids[index],
+            transaction_type=self.transaction_types[index],
+            amount=Money(self.amounts[index]),
+            category=self.categories[index],
+            description=self.descriptions[index],
+            date_created=self.dates_created[index],
+        )
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(len(self)):
+            yield self[index]
\ No newline at end of file
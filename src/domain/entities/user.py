@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
+from src.domain.entities.money import Money
 
-@dataclass
+@dataclass(kw_only=True, slots=True)
 class User:
     """
     Domain Entity: User.
@@ -12,16 +13,16 @@ class User:
     username: str
     hashed_password: str
     number: Optional[str] = None
-    balance: float = 0.0
+    balance: Money = Money(0)
     date_created: datetime = field(default_factory=datetime.now)
 
-    def deposit(self, amount: float) -> None:
+    def deposit(self, amount: Money) -> None:
         """Deposit amount to the user's balance."""
         if amount <= 0:
             raise ValueError("Amount must be positive")
         self.balance += amount
 
-    def withdraw(self, amount: float) -> None:
+    def withdraw(self, amount: Money) -> None:
         """Withdraw amount from the user's balance."""
         if amount > self.balance:
             raise ValueError("Not enough balance for withdrawal")
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+from src.domain.entities.budget import BudgetAlert
+
+class IAlertNotifier(ABC):
+    """interface for delivering budget alerts to users."""
+
+    @abstractmethod
+    async def notify(self, alerts: Sequence[BudgetAlert]) -> None:
+        """Send alerts; must not block the consumer on slow delivery."""
+        pass
\ No newline at end of file
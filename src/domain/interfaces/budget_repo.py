@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+from src.domain.entities.budget import Budget, BudgetAlert
+
+class IBudgetRepository(ABC):
+    """interface for budget repository."""
+
+    @abstractmethod
+    async def create(self, budget: Budget) -> Budget:
+        """Create a new budget, assigning its id."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, budget_id: int) -> Optional[Budget]:
+        """Get a budget by id."""
+        pass
+
+    @abstractmethod
+    async def get_by_user_ids(self, user_ids: Sequence[int]) -> List[Budget]:
+        """Get the budgets of many users in one query."""
+        pass
+
+    @abstractmethod
+    async def delete(self, budget_id: int) -> None:
+        """Delete a budget and its fired alerts."""
+        pass
+
+    @abstractmethod
+    async def record_alerts(self, alerts: Sequence[BudgetAlert]) -> List[BudgetAlert]:
+        """
+        Remember alerts as fired. Returns only those that had not fired before
+        for their (budget_id, period_start, threshold): the ones to send.
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class ICacheBackend(ABC):
+    """Interface for a key-value cache with per-entry TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove keys; missing keys are ignored."""
+        pass
\ No newline at end of file
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+from src.domain.entities.transaction import TransactionCategory
+
+class ITransactionCategorizer(ABC):
+    """interface for assigning categories from free-text descriptions."""
+
+    @abstractmethod
+    async def categorize(self, descriptions: Sequence[str]) -> List[TransactionCategory]:
+        """Return one category per description, in the same order."""
+        pass
\ No newline at end of file
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+AfterCommit = Callable[[], Awaitable[None]]
+
+class ICommitHooks(ABC):
+    """interface for side effects that must wait for the surrounding DB transaction."""
+
+    @abstractmethod
+    async def after_commit(self, callback: AfterCommit) -> None:
+        """
+        Run callback once the transaction has committed, or never if it rolls back.
+        Cache invalidation and event publishing go here, so that nobody acts on
+        a write before it is visible.
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import List
+from src.domain.entities.notification import DeadLetter
+
+class IDeadLetterRepository(ABC):
+    """interface for storing messages that could not be delivered."""
+
+    @abstractmethod
+    async def add(self, letter: DeadLetter) -> DeadLetter:
+        """Store a dead letter, assigning its id."""
+        pass
+
+    @abstractmethod
+    async def get_recent(self, limit: int) -> List[DeadLetter]:
+        """Newest dead letters first."""
+        pass
\ No newline at end of file
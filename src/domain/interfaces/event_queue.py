@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List
+from src.domain.entities.events import ExpenseRecorded
+
+@dataclass
+class EventDelivery:
+    """Events handed to a consumer; receipts are backend specific ids for ack()."""
+    events: List[ExpenseRecorded] = field(default_factory=list)
+    receipts: List[str] = field(default_factory=list)
+
+class IExpenseEventQueue(ABC):
+    """interface for the queue between the write path and background consumers."""
+
+    @abstractmethod
+    async def publish(self, event: ExpenseRecorded) -> None:
+        """Hand the event over; never waits for a consumer."""
+        pass
+
+    @abstractmethod
+    async def receive(self, max_batch: int, timeout: float) -> EventDelivery:
+        """
+        Wait up to timeout seconds for an event, then return it together with
+        whatever else is already queued, up to max_batch events.
+        """
+        pass
+
+    @abstractmethod
+    async def ack(self, delivery: EventDelivery) -> None:
+        """Mark a delivery as processed; durable backends redeliver unacked events."""
+        pass
\ No newline at end of file
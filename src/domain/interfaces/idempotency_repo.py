@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+@dataclass
+class IdempotencyRecord:
+    """A claimed idempotency key; response is None until the request completes."""
+    user_id: int
+    key: str
+    response: Optional[Dict[str, Any]]
+    expires_at: datetime
+
+class IIdempotencyRepository(ABC):
+    """interface for idempotency key storage."""
+
+    @abstractmethod
+    async def get(self, user_id: int, key: str) -> Optional[IdempotencyRecord]:
+        """Get a non-expired record for the key."""
+        pass
+
+    @abstractmethod
+    async def claim(self, user_id: int, key: str, ttl: timedelta) -> bool:
+        """
+        Reserve the key for ttl. Returns False if a non-expired record exists
+        or the user does not exist.
+        Waits for a concurrent claim of the same key to commit or roll back.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, user_id: int, key: str, response: Dict[str, Any]) -> None:
+        """Store the response of the request that claimed the key."""
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, batch_size: int) -> int:
+        """Delete up to batch_size expired records, return how many were deleted."""
+        pass
\ No newline at end of file
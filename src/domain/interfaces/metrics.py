@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+class IMetricsSink(ABC):
+    """Interface for a destination of timing measurements."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        """Record one measurement (seconds for durations). Must not block."""
+        pass
+
+class NullMetricsSink(IMetricsSink):
+    """Sink that drops everything; the default until one is configured."""
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        pass
\ No newline at end of file
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from src.domain.entities.notification import Notification
+
+class INotificationDispatcher(ABC):
+    """interface for queueing outbound messages to chats."""
+
+    @abstractmethod
+    def submit(self, notification: Notification) -> bool:
+        """
+        Queue the notification and return at once; delivery happens in the
+        background. Returns False if it was dropped because the queue is full.
+        """
+        pass
\ No newline at end of file
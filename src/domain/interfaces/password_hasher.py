@@ -11,4 +11,11 @@ class IPasswordHasher(ABC):
     @abstractmethod
     async def verify(self, password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        pass
\ No newline at end of file
+        pass
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Whether the hash was made with another scheme or weaker cost parameters
+        than currently configured. Checked after a successful login.
+        """
+        return False
\ No newline at end of file
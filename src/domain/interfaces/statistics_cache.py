@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+from src.domain.entities.statistics import StatisticsSnapshot, TimeBucket
+
+class IStatisticsCache(ABC):
+    """interface for the cache of per-user statistics snapshots."""
+
+    @abstractmethod
+    async def get_or_compute(
+        self,
+        user_id: int,
+        period: TimeBucket,
+        bucket: TimeBucket,
+        compute: Callable[[], Awaitable[StatisticsSnapshot]],
+    ) -> StatisticsSnapshot:
+        """
+        Cached snapshot of the user's current period, or the result of compute()
+        stored for the next caller. Concurrent misses of one key call compute() once.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: int) -> None:
+        """Forget every snapshot of the user; called after their transactions change."""
+        pass
\ No newline at end of file
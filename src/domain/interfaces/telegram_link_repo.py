@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+class ITelegramLinkRepository(ABC):
+    """interface for links between users and their Telegram chats."""
+
+    @abstractmethod
+    async def link(self, user_id: int, chat_id: int) -> None:
+        """Link the user to a chat, replacing an earlier link."""
+        pass
+
+    @abstractmethod
+    async def unlink(self, user_id: int) -> None:
+        """Remove the user's link; a missing link is ignored."""
+        pass
+
+    @abstractmethod
+    async def get_chat_ids(self, user_ids: Sequence[int]) -> Dict[int, int]:
+        """Chat id per user id, for the users that have a link."""
+        pass
\ No newline at end of file
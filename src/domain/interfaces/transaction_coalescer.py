@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.entities.user import User
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction
+
+class ITransactionCoalescer(ABC):
+    """interface for merging concurrent balance changes of one user into one write."""
+
+    @abstractmethod
+    async def apply_transaction(self, transaction: Transaction, delta: Money) -> Optional[User]:
+        """
+        Same contract as IUserRepository.apply_transaction without a balance guard,
+        but committed on its own, together with other pending changes of the user.
+        """
+        pass
\ No newline at end of file
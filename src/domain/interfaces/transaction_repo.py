@@ -1,7 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, List, Sequence, Union
 from datetime import datetime
-from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.reconciliation import BalanceDiscrepancy
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionBatch, TransactionCategory, TransactionType
+from src.domain.entities.statistics import AggregateDimension, TimeBucket, TransactionAggregate
+
+@dataclass
+class BulkInsertResult:
+    """
+    Outcome of a bulk insert: created ids in input order, seconds spent per chunk
+    and the rows left out because their user does not exist or the balance guard refused them.
+    """
+    transaction_ids: List[int] = field(default_factory=list)
+    chunk_timings: List[float] = field(default_factory=list)
+    rejected: List[Transaction] = field(default_factory=list)
+
+    @property
+    def rejected_user_ids(self) -> List[int]:
+        return sorted({transaction.user_id for transaction in self.rejected})
+
+@dataclass
+class TransactionPage:
+    """One page of a keyset-paginated listing; next_cursor is None on the last page."""
+    items: List[Transaction] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+@dataclass
+class BalanceReconciliation:
+    """Balances of users in [min_user_id, max_user_id] checked against their transactions."""
+    min_user_id: int
+    max_user_id: int
+    checked_users: int = 0
+    discrepancies: List[BalanceDiscrepancy] = field(default_factory=list)
 
 class ITransactionRepository(ABC):
     """interface for transaction repository."""
@@ -28,16 +60,105 @@ class ITransactionRepository(ABC):
         """    
         pass
     
+    @abstractmethod
+    async def get_batch_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        ) -> TransactionBatch:
+        """Get user's transactions, newest first, as one columnar TransactionBatch."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        ) -> TransactionPage:
+        """
+        Get a page of user's transactions, newest first.
+        Pass next_cursor of the previous page to get the following one;
+        every page costs the same regardless of its depth.
+        """
+        pass
+
+    @abstractmethod
+    def iter_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+        ) -> AsyncIterator[Transaction]:
+        """
+        Stream all matching transactions, newest first, without loading them into memory.
+        At most batch_size rows are buffered at a time.
+        """
+        pass
+
     @abstractmethod
     async def create(self, transaction: Transaction) -> Transaction:
         """Create a new transaction and return the created entity with id."""
         pass
+
+    @abstractmethod
+    async def create_many(
+        self,
+        transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]],
+        chunk_size: int = 1000,
+        min_balance: Optional[Money] = Money(0),
+    ) -> BulkInsertResult:
+        """
+        Insert transactions in chunks of chunk_size rows.
+        Balances of affected users are updated once per chunk
+        (income adds, expense subtracts). A user whose balance would fall below
+        min_balance gets none of their rows of that chunk inserted; those rows
+        are reported in BulkInsertResult.rejected. None disables the guard.
+        """
+        pass
     
     @abstractmethod
     async def get_total_by_user(
         self, 
         user_id: int, 
         transaction_type: Optional[TransactionType] = None
-    ) -> float:
-        """Get sum of transactions (for balance verification)."""
+    ) -> Money:
+        """Get sum of transactions (for balance verification), exact."""
+        pass
+
+    @abstractmethod
+    async def reconcile_balances(self, min_user_id: int, max_user_id: int) -> BalanceReconciliation:
+        """
+        Income minus expense of every user in the id range, compared with the
+        stored balance, in one grouped query: one snapshot, no per-user round trips.
+        """
+        pass
+
+    @abstractmethod
+    async def aggregate(
+        self,
+        user_ids: Sequence[int],
+        group_by: Sequence[AggregateDimension] = (),
+        bucket: Optional[TimeBucket] = None,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[TransactionAggregate]:
+        """
+        Sum, count, min and max of amounts for one or many users in a single query.
+        Always grouped by user, plus any of group_by and an optional time bucket.
+        For charts: "food per month", "income vs expense per week".
+        """
         pass
\ No newline at end of file
@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from src.domain.entities.user import User
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction
 
 class IUserRepository(ABC):
     """interface for user repository."""
 
     @abstractmethod
-    async def get_by_id(self, user_id: int) -> Optional[User]:
-        """Get a user by their ID."""
+    async def get_by_id(self, user_id: int, with_lock: bool = True) -> Optional[User]:
+        """
+        Get a user by their ID.
+
+        Unlocked reads (with_lock=False) may be served from a cache and then
+        carry no password hash (hashed_password is ""). Anything that checks
+        or replaces the hash reads the user with get_by_email() or with_lock=True.
+        """
         pass
 
     @abstractmethod
@@ -22,10 +30,57 @@ class IUserRepository(ABC):
 
     @abstractmethod
     async def update(self, user: User) -> User:
-        """Update an existing user and return the updated entity."""
+        """
+        Update the profile fields of an existing user (email, username, number)
+        and return the updated entity. Balance and password hash are left alone:
+        they change only through apply_transaction(s) and replace_password_hash.
+        """
+        pass
+
+    @abstractmethod
+    async def replace_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        """
+        Set the user's password hash to new_hash if it is still old_hash.
+        Returns False if the user does not exist or the hash was changed meanwhile.
+        """
+        pass
+
+    @abstractmethod
+    async def apply_transaction(
+        self,
+        transaction: Transaction,
+        delta: Money,
+        min_balance: Optional[Money] = None,
+    ) -> Optional[User]:
+        """
+        Atomically change the user's balance by delta and record the transaction.
+        Returns the updated user, or None if the user does not exist
+        or the new balance would fall below min_balance.
+        """
+        pass
+
+    @abstractmethod
+    async def apply_transactions(
+        self,
+        user_id: int,
+        transactions: List[Transaction],
+        deltas: List[Money],
+    ) -> Optional[List[User]]:
+        """
+        Apply several transactions of one user as a single write, in order.
+        Returns the user as seen right after each transaction (running balance),
+        or None if the user does not exist. There is no balance guard.
+        """
         pass
 
     @abstractmethod
     async def delete(self, user_id: int) -> None:
         """Delete a user by their ID."""
+        pass
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop any cached copy of the user after its row changed elsewhere
+        (e.g. balances updated by a bulk import). No-op for uncached repositories.
+        """
         pass
\ No newline at end of file
@@ -0,0 +1,154 @@
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+import numpy as np  # optional dependency, only needed by the analytics module
+from src.domain.entities.insights import CategoryDelta, DailySpending, SpendingAnomaly, SpendingInsights
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionType
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.infrastructure.analytics.columns import CATEGORIES, TransactionColumns, load_columns
+
+SECONDS_PER_DAY = 86400
+EPOCH = date(1970, 1, 1)
+EPOCH_DATETIME = datetime(1970, 1, 1)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` elements; the first ones average what is available."""
+    sums = np.cumsum(np.concatenate(([0.0], values)))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (sums[ends] - sums[starts]) / (ends - starts)
+
+
+def daily_totals(expenses: TransactionColumns) -> Tuple[int, np.ndarray]:
+    """
+    (first day as days since epoch, total per day up to the last one, zeros included).
+    bincount sums in float64, which is exact for integer minor units below 2**53.
+    """
+    days = expenses.timestamps // SECONDS_PER_DAY
+    first_day = int(days.min())
+    return first_day, np.bincount(days - first_day, weights=expenses.amounts)
+
+
+def category_z_scores(expenses: TransactionColumns, min_samples: int) -> np.ndarray:
+    """
+    Z-score of every expense against its category's mean and standard deviation.
+    Categories with fewer than min_samples expenses or zero spread get 0.
+    """
+    n_categories = len(CATEGORIES)
+    counts = np.bincount(expenses.categories, minlength=n_categories)
+    sums = np.bincount(expenses.categories, weights=expenses.amounts, minlength=n_categories)
+    amounts = expenses.amounts.astype(np.float64)
+    squares = np.bincount(expenses.categories, weights=amounts ** 2, minlength=n_categories)
+
+    safe_counts = np.maximum(counts, 1)
+    means = sums / safe_counts
+    stds = np.sqrt(np.maximum(squares / safe_counts - means ** 2, 0.0))
+    valid = (counts >= min_samples) & (stds > 0)
+
+    per_row_std = stds[expenses.categories]
+    z_scores = np.zeros(len(expenses))
+    rows = valid[expenses.categories]
+    z_scores[rows] = (amounts[rows] - means[expenses.categories][rows]) / per_row_std[rows]
+    return z_scores
+
+
+def monthly_category_totals(expenses: TransactionColumns) -> Tuple[int, np.ndarray]:
+    """(first month as months since epoch, months x categories matrix of totals)."""
+    months = expenses.timestamps.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64)
+    first_month = int(months.min())
+    n_months = int(months.max()) - first_month + 1
+    n_categories = len(CATEGORIES)
+
+    totals = np.bincount(
+        (months - first_month) * n_categories + expenses.categories,
+        weights=expenses.amounts,
+        minlength=n_months * n_categories,
+    )
+    return first_month, totals.reshape(n_months, n_categories)
+
+
+def _month_start(months_since_epoch: int) -> date:
+    return date(1970 + months_since_epoch // 12, months_since_epoch % 12 + 1, 1)
+
+
+def compute_insights(
+    user_id: int,
+    columns: TransactionColumns,
+    window_days: int = 30,
+    z_threshold: float = 3.0,
+    min_samples: int = 10,
+) -> SpendingInsights:
+    """All metrics over the columns, each a handful of vectorized passes."""
+    insights = SpendingInsights(user_id=user_id)
+    expenses = columns.expenses()
+    if not len(expenses):
+        return insights
+
+    first_day, totals = daily_totals(expenses)
+    averages = rolling_mean(totals, window_days)
+    insights.daily = [
+        DailySpending(
+            day=EPOCH + timedelta(days=first_day + index),
+            total=Money(total),
+            rolling_average=Money(average),
+        )
+        for index, (total, average) in enumerate(
+            zip(totals.astype(np.int64).tolist(), np.rint(averages).astype(np.int64).tolist())
+        )
+    ]
+
+    z_scores = category_z_scores(expenses, min_samples)
+    (anomalous,) = np.nonzero(z_scores > z_threshold)
+    anomalous = anomalous[np.argsort(-z_scores[anomalous], kind="stable")]
+    insights.anomalies = [
+        SpendingAnomaly(
+            transaction_id=int(expenses.transaction_ids[index]),
+            category=CATEGORIES[expenses.categories[index]],
+            amount=Money(expenses.amounts[index]),
+            date_created=EPOCH_DATETIME + timedelta(seconds=int(expenses.timestamps[index])),
+            z_score=float(z_scores[index]),
+        )
+        for index in anomalous.tolist()
+    ]
+
+    first_month, monthly = monthly_category_totals(expenses)
+    monthly = monthly.astype(np.int64)
+    previous, current = monthly[:-1], monthly[1:]
+    changed_months, changed_categories = np.nonzero((previous != 0) | (current != 0))
+    insights.category_deltas = [
+        CategoryDelta(
+            month_start=_month_start(first_month + month + 1),
+            category=CATEGORIES[category],
+            previous_total=Money(previous[month, category]),
+            current_total=Money(current[month, category]),
+            change=Money(current[month, category] - previous[month, category]),
+            change_ratio=_ratio(previous[month, category], current[month, category]),
+        )
+        for month, category in zip(changed_months.tolist(), changed_categories.tolist())
+    ]
+
+    return insights
+
+
+def _ratio(previous: int, current: int) -> Optional[float]:
+    return float((current - previous) / previous) if previous else None
+
+
+async def analyze_user(
+    transaction_repo: ITransactionRepository,
+    user_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    window_days: int = 30,
+    z_threshold: float = 3.0,
+) -> SpendingInsights:
+    """Load the user's expenses into columns and compute the insights."""
+    columns = await load_columns(
+        transaction_repo,
+        user_id,
+        transaction_type=TransactionType.EXPENSE,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return compute_insights(user_id, columns, window_days=window_days, z_threshold=z_threshold)
\ No newline at end of file
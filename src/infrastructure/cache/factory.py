@@ -0,0 +1,15 @@
+from src.domain.interfaces.cache import ICacheBackend
+from src.infrastructure.config import CacheConfig, RedisConfig, cache_config, redis_config
+from src.infrastructure.cache.memory import InMemoryCacheBackend
+from src.infrastructure.cache.redis import RedisCacheBackend
+
+
+def create_cache_backend(
+    config: CacheConfig = cache_config,
+    redis: RedisConfig = redis_config,
+    prefix: str = "users:",
+) -> ICacheBackend:
+    """Build the cache backend selected by CACHE_BACKEND; prefix namespaces its Redis keys."""
+    if config.backend == "redis":
+        return RedisCacheBackend.from_url(redis.url, prefix=prefix)
+    return InMemoryCacheBackend(max_entries=config.max_entries)
\ No newline at end of file
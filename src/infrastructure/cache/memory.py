@@ -0,0 +1,40 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from src.domain.interfaces.cache import ICacheBackend
+
+class InMemoryCacheBackend(ICacheBackend):
+    """
+    In-process cache: TTL per entry plus LRU eviction above max_entries.
+    Only safe to share within one event loop / worker process.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
\ No newline at end of file
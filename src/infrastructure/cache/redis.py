@@ -0,0 +1,42 @@
+from typing import Any, Optional, Protocol
+from src.domain.interfaces.cache import ICacheBackend
+
+class RedisClient(Protocol):
+    """The subset of redis.asyncio.Redis used by the cache; fakes only need these."""
+
+    async def get(self, name: str) -> Any: ...
+
+    async def set(self, name: str, value: str, ex: Optional[int] = None) -> Any: ...
+
+    async def delete(self, *names: str) -> Any: ...
+
+class RedisCacheBackend(ICacheBackend):
+    """
+    Cache shared between workers, backed by Redis or anything speaking its API.
+    Keys are stored under prefix, so several caches can share one Redis.
+    """
+
+    def __init__(self, client: RedisClient, prefix: str = "users:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "users:") -> "RedisCacheBackend":
+        """Build a backend on top of redis.asyncio (imported only when used)."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url, decode_responses=True), prefix=prefix)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            return value.decode()
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        # Redis EX takes whole seconds and rejects 0.
+        await self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
\ No newline at end of file
@@ -0,0 +1,304 @@
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Union
+from src.domain.entities.money import Money
+from src.domain.entities.statistics import (
+    AggregateDimension,
+    StatisticsSnapshot,
+    TimeBucket,
+    TransactionAggregate,
+    truncate_to_bucket,
+)
+from src.domain.entities.transaction import Transaction, TransactionBatch, TransactionCategory, TransactionType
+from src.domain.interfaces.cache import ICacheBackend
+from src.domain.interfaces.commit_hooks import ICommitHooks
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.domain.interfaces.transaction_repo import (
+    BalanceReconciliation,
+    BulkInsertResult,
+    ITransactionRepository,
+    TransactionPage,
+)
+from src.application.commit_hooks import ImmediateCommitHooks
+from src.infrastructure.cache.users import CacheStats
+
+@dataclass
+class SnapshotCacheStats(CacheStats):
+    """CacheStats of StatisticsSnapshotCache."""
+    # Misses that waited for another caller's compute() of the same key.
+    coalesced: int = 0
+
+class StatisticsSnapshotCache(IStatisticsCache):
+    """
+    Statistics snapshots in an ICacheBackend, keyed by user, period, bucket
+    and period start, so a new month starts with a new key.
+
+    Keys also carry a per-user generation token. invalidate() replaces the
+    token instead of deleting keys: one write hides every snapshot of the user,
+    and the old ones age out. A snapshot computed while a write happened is
+    stored under the old token, where nobody looks. Writers invalidate once
+    their DB transaction has committed (ICommitHooks), so no snapshot of the
+    old data can be stored under the new token.
+
+    Concurrent misses of one key share a single compute() call within the
+    process (the other callers wait for it), so a cold dashboard hit by many
+    requests costs one query per worker.
+    """
+
+    def __init__(self, cache: ICacheBackend, ttl: float = 300.0):
+        self.cache = cache
+        self.ttl = ttl
+        self.stats = SnapshotCacheStats()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _generation_key(self, user_id: int) -> str:
+        return f"stats:gen:{user_id}"
+
+    def _snapshot_key(
+        self, user_id: int, generation: str, period: TimeBucket, bucket: TimeBucket, period_start: datetime
+    ) -> str:
+        return f"stats:{user_id}:{generation}:{period.value}:{bucket.value}:{period_start:%Y%m%d}"
+
+    def _serialize(self, snapshot: StatisticsSnapshot) -> str:
+        return json.dumps(
+            {
+                "user_id": snapshot.user_id,
+                "period": snapshot.period.value,
+                "bucket": snapshot.bucket.value,
+                "period_start": snapshot.period_start.isoformat(),
+                "computed_at": snapshot.computed_at.isoformat(),
+                # Positional rows keep the payload small; groups are the bulk of it.
+                "groups": [
+                    [
+                        group.transaction_type.value if group.transaction_type else None,
+                        group.category.value if group.category else None,
+                        group.period_start.isoformat() if group.period_start else None,
+                        group.total,
+                        group.count,
+                        group.min_amount,
+                        group.max_amount,
+                    ]
+                    for group in snapshot.groups
+                ],
+            }
+        )
+
+    def _deserialize(self, value: str) -> StatisticsSnapshot:
+        data = json.loads(value)
+        user_id = data["user_id"]
+        return StatisticsSnapshot(
+            user_id=user_id,
+            period=TimeBucket(data["period"]),
+            bucket=TimeBucket(data["bucket"]),
+            period_start=datetime.fromisoformat(data["period_start"]),
+            computed_at=datetime.fromisoformat(data["computed_at"]),
+            groups=[
+                TransactionAggregate(
+                    user_id=user_id,
+                    transaction_type=TransactionType(transaction_type) if transaction_type else None,
+                    category=TransactionCategory(category) if category else None,
+                    period_start=datetime.fromisoformat(period_start) if period_start else None,
+                    total=Money(total),
+                    count=count,
+                    min_amount=Money(min_amount),
+                    max_amount=Money(max_amount),
+                )
+                for transaction_type, category, period_start, total, count, min_amount, max_amount in data["groups"]
+            ],
+        )
+
+    async def _generation(self, user_id: int) -> str:
+        generation = await self.cache.get(self._generation_key(user_id))
+        if generation is None:
+            # Snapshots under an expired token are unreachable, which is only wasteful.
+            generation = uuid.uuid4().hex
+            await self.cache.set(self._generation_key(user_id), generation, self.ttl)
+        return generation
+
+    async def get_or_compute(
+        self,
+        user_id: int,
+        period: TimeBucket,
+        bucket: TimeBucket,
+        compute: Callable[[], Awaitable[StatisticsSnapshot]],
+    ) -> StatisticsSnapshot:
+        generation = await self._generation(user_id)
+        key = self._snapshot_key(user_id, generation, period, bucket, truncate_to_bucket(datetime.now(), period))
+
+        value = await self.cache.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return self._deserialize(value)
+
+        while (pending := self._in_flight.get(key)) is not None:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The caller computing it was cancelled, not this one: take over.
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            snapshot = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved; nobody may be waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(snapshot)
+        finally:
+            del self._in_flight[key]
+
+        await self.cache.set(key, self._serialize(snapshot), self.ttl)
+        return snapshot
+
+    async def invalidate(self, user_id: int) -> None:
+        self.stats.invalidations += 1
+        await self.cache.set(self._generation_key(user_id), uuid.uuid4().hex, self.ttl)
+
+
+class StatisticsInvalidatingTransactionRepository(ITransactionRepository):
+    """
+    ITransactionRepository wrapper that invalidates the statistics snapshots
+    of every user whose transactions it creates, after the surrounding DB
+    transaction commits. Reads pass straight through.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: ITransactionRepository,
+        statistics: IStatisticsCache,
+        commit_hooks: Optional[ICommitHooks] = None,
+    ):
+        self.transaction_repo = transaction_repo
+        self.statistics = statistics
+        self.commit_hooks = commit_hooks or ImmediateCommitHooks()
+
+    async def _invalidate_after_commit(self, user_id: int) -> None:
+        await self.commit_hooks.after_commit(partial(self.statistics.invalidate, user_id))
+
+    async def get_by_id(self, transaction_id: int) -> Optional[Transaction]:
+        return await self.transaction_repo.get_by_id(transaction_id)
+
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Transaction]:
+        return await self.transaction_repo.get_by_user_id(
+            user_id, transaction_type, category, date_from, date_to, limit, offset
+        )
+
+    async def get_batch_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> TransactionBatch:
+        return await self.transaction_repo.get_batch_by_user_id(
+            user_id, transaction_type, category, date_from, date_to, limit
+        )
+
+    async def get_page_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        return await self.transaction_repo.get_page_by_user_id(
+            user_id, transaction_type, category, date_from, date_to, limit, cursor
+        )
+
+    def iter_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Transaction]:
+        return self.transaction_repo.iter_by_user_id(
+            user_id, transaction_type, category, date_from, date_to, batch_size
+        )
+
+    async def create(self, transaction: Transaction) -> Transaction:
+        created = await self.transaction_repo.create(transaction)
+        await self._invalidate_after_commit(created.user_id)
+        return created
+
+    async def create_many(
+        self,
+        transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]],
+        chunk_size: int = 1000,
+        min_balance: Optional[Money] = Money(0),
+    ) -> BulkInsertResult:
+        user_ids: Set[int] = set()
+
+        async def collected() -> AsyncIterator[Transaction]:
+            """Note the users on the way through, so the source is never materialized."""
+            if isinstance(transactions, AsyncIterable):
+                async for transaction in transactions:
+                    user_ids.add(transaction.user_id)
+                    yield transaction
+            else:
+                for transaction in transactions:
+                    user_ids.add(transaction.user_id)
+                    yield transaction
+
+        try:
+            return await self.transaction_repo.create_many(collected(), chunk_size, min_balance)
+        finally:
+            # Also after a failure: earlier chunks may be in, if the caller commits them.
+            for user_id in user_ids:
+                await self._invalidate_after_commit(user_id)
+
+    async def get_total_by_user(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> Money:
+        return await self.transaction_repo.get_total_by_user(user_id, transaction_type, date_from, date_to)
+
+    async def reconcile_balances(self, min_user_id: int, max_user_id: int) -> BalanceReconciliation:
+        return await self.transaction_repo.reconcile_balances(min_user_id, max_user_id)
+
+    async def aggregate(
+        self,
+        user_ids: Sequence[int],
+        group_by: Sequence[AggregateDimension] = (),
+        bucket: Optional[TimeBucket] = None,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[TransactionAggregate]:
+        return await self.transaction_repo.aggregate(
+            user_ids, group_by, bucket, transaction_type, category, date_from, date_to
+        )
\ No newline at end of file
@@ -0,0 +1,149 @@
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import List, Optional
+from src.domain.entities.money import Money
+from src.domain.entities.user import User
+from src.domain.entities.transaction import Transaction
+from src.domain.interfaces.cache import ICacheBackend
+from src.domain.interfaces.commit_hooks import ICommitHooks
+from src.domain.interfaces.user_repo import IUserRepository
+from src.application.commit_hooks import ImmediateCommitHooks
+
+@dataclass
+class CacheStats:
+    """Counters of a read-through cache."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+class CachedUserRepository(IUserRepository):
+    """
+    Read-through cache in front of another IUserRepository.
+
+    Only unlocked get_by_id() is served from cache; get_by_id(with_lock=True)
+    always goes to the wrapped repository, and so does get_by_email(), the
+    login path. Cached users carry no password hash (hashed_password is
+    empty): hashes stay out of a cache that may be shared through Redis.
+
+    Entries are keyed by a per-user generation token, as in
+    StatisticsSnapshotCache: a miss reads the token before it reads the
+    row and stores the row under that token. Every write replaces the
+    token right away and once more after the surrounding DB transaction
+    commits (commit_hooks), so a row read before the commit can only be
+    stored under a token nobody looks up any more.
+    """
+
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        cache: ICacheBackend,
+        ttl: float = 60.0,
+        commit_hooks: Optional[ICommitHooks] = None,
+        stats: Optional[CacheStats] = None,
+    ):
+        self.user_repo = user_repo
+        self.cache = cache
+        self.ttl = ttl
+        self.commit_hooks = commit_hooks or ImmediateCommitHooks()
+        # Shared by the per-session instances of one RepositoryFactory.
+        self.stats = stats or CacheStats()
+
+    def _generation_key(self, user_id: int) -> str:
+        return f"user:gen:{user_id}"
+
+    def _id_key(self, user_id: int, generation: str) -> str:
+        return f"user:id:{user_id}:{generation}"
+
+    def _serialize(self, user: User) -> str:
+        return json.dumps(
+            {
+                "user_id": user.user_id,
+                "email": user.email,
+                "username": user.username,
+                "number": user.number,
+                "balance": user.balance,
+                "date_created": user.date_created.isoformat(),
+            }
+        )
+
+    def _deserialize(self, value: str) -> User:
+        data = json.loads(value)
+        data["date_created"] = datetime.fromisoformat(data["date_created"])
+        data["balance"] = Money(data["balance"])
+        return User(hashed_password="", **data)
+
+    async def _generation(self, user_id: int) -> str:
+        generation = await self.cache.get(self._generation_key(user_id))
+        if generation is None:
+            # Entries under an expired token are unreachable, which is only wasteful.
+            generation = uuid.uuid4().hex
+            await self.cache.set(self._generation_key(user_id), generation, self.ttl)
+        return generation
+
+    async def get_by_id(self, user_id: int, with_lock: bool = True) -> Optional[User]:
+        if with_lock:
+            return await self.user_repo.get_by_id(user_id, with_lock=True)
+
+        # Taken before the row is read: a write committed in between replaces it.
+        generation = await self._generation(user_id)
+        key = self._id_key(user_id, generation)
+
+        value = await self.cache.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return self._deserialize(value)
+
+        self.stats.misses += 1
+        user = await self.user_repo.get_by_id(user_id, with_lock=False)
+        if user:
+            await self.cache.set(key, self._serialize(user), self.ttl)
+
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        # Logins need the password hash, which the cache does not keep.
+        return await self.user_repo.get_by_email(email)
+
+    async def create(self, user: User) -> User:
+        return await self.user_repo.create(user)
+
+    async def update(self, user: User) -> User:
+        await self.invalidate(user.user_id)
+        return await self.user_repo.update(user)
+
+    async def replace_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        # Nothing to invalidate: cached users carry no hash.
+        return await self.user_repo.replace_password_hash(user_id, old_hash, new_hash)
+
+    async def apply_transaction(
+        self,
+        transaction: Transaction,
+        delta: Money,
+        min_balance: Optional[Money] = None,
+    ) -> Optional[User]:
+        await self.invalidate(transaction.user_id)
+        return await self.user_repo.apply_transaction(transaction, delta, min_balance)
+
+    async def apply_transactions(
+        self,
+        user_id: int,
+        transactions: List[Transaction],
+        deltas: List[Money],
+    ) -> Optional[List[User]]:
+        await self.invalidate(user_id)
+        return await self.user_repo.apply_transactions(user_id, transactions, deltas)
+
+    async def delete(self, user_id: int) -> None:
+        await self.invalidate(user_id)
+        await self.user_repo.delete(user_id)
+
+    async def invalidate(self, user_id: int) -> None:
+        self.stats.invalidations += 1
+        await self._replace_generation(user_id)
+        await self.commit_hooks.after_commit(partial(self._replace_generation, user_id))
+
+    async def _replace_generation(self, user_id: int) -> None:
+        await self.cache.set(self._generation_key(user_id), uuid.uuid4().hex, self.ttl)
\ No newline at end of file
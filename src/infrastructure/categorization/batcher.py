@@ -0,0 +1,77 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class MicroBatcher(Generic[T]):
+    """
+    Groups concurrent submit() calls into one call of a blocking batch function,
+    run in an executor so the event loop keeps serving requests meanwhile.
+
+    A call is made once max_wait_ms passed since the first pending item
+    or max_batch items are pending, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[List[str]], List[T]],
+        max_batch: int = 1024,
+        max_wait_ms: float = 2.0,
+        executor: Optional[Executor] = None,
+    ):
+        self.func = func
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor
+        self.calls = 0
+        self._pending: List[Tuple[Sequence[str], asyncio.Future]] = []
+        self._pending_items = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._runs: Set[asyncio.Task] = set()
+
+    async def submit(self, items: Sequence[str]) -> List[T]:
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((items, future))
+        self._pending_items += len(items)
+
+        if self._pending_items >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending, self._pending_items = self._pending, [], 0
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def _run(self, pending: List[Tuple[Sequence[str], asyncio.Future]]) -> None:
+        items = [item for batch, _ in pending for item in batch]
+        self.calls += 1
+
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, self.func, items)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for batch, future in pending:
+            if not future.done():
+                future.set_result(results[offset:offset + len(batch)])
+            offset += len(batch)
\ No newline at end of file
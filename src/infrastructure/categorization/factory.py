@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+from src.domain.interfaces.cache import ICacheBackend
+from src.domain.interfaces.categorizer import ITransactionCategorizer
+from src.infrastructure.config import CategorizerConfig, categorizer_config
+from src.infrastructure.categorization.model import HashedNgramModel
+from src.infrastructure.categorization.service import LocalCategorizer
+
+
+def create_categorizer(
+    cache: Optional[ICacheBackend] = None,
+    config: CategorizerConfig = categorizer_config,
+) -> Optional[ITransactionCategorizer]:
+    """Load the model from CATEGORIZER_MODEL_PATH; None until one has been trained."""
+    path = Path(config.model_path)
+    if not path.exists():
+        logger.warning(f"No categorizer model at {path}, automatic categorization is off")
+        return None
+
+    return LocalCategorizer(HashedNgramModel.load(path), cache=cache, config=config)
\ No newline at end of file
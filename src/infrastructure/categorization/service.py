@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.domain.entities.transaction import TransactionCategory
+from src.domain.interfaces.cache import ICacheBackend
+from src.domain.interfaces.categorizer import ITransactionCategorizer
+from src.infrastructure.config import CategorizerConfig, categorizer_config
+from src.infrastructure.categorization.batcher import MicroBatcher
+from src.infrastructure.categorization.model import HashedNgramModel, normalize_description
+
+@dataclass
+class CategorizerStats:
+    """Where each categorized description was answered from."""
+    lru_hits: int = 0
+    cache_hits: int = 0
+    predicted: int = 0
+
+class LocalCategorizer(ITransactionCategorizer):
+    """
+    ITransactionCategorizer on top of a local HashedNgramModel.
+
+    Lookups go: in-process LRU -> shared ICacheBackend (optional, e.g. Redis)
+    -> model. Keys are normalized descriptions, so repeated merchants are
+    predicted once; cache keys include the model version, so retraining
+    never serves stale categories. Concurrent misses from all callers are
+    grouped by a MicroBatcher into one model call.
+    """
+
+    def __init__(
+        self,
+        model: HashedNgramModel,
+        cache: Optional[ICacheBackend] = None,
+        config: CategorizerConfig = categorizer_config,
+    ):
+        self.model = model
+        self.cache = cache
+        self.config = config
+        self.stats = CategorizerStats()
+        self._lru: "OrderedDict[str, TransactionCategory]" = OrderedDict()
+        self._batcher = MicroBatcher(
+            self._predict,
+            max_batch=config.batch_max_size,
+            max_wait_ms=config.batch_wait_ms,
+        )
+
+    def _cache_key(self, normalized: str) -> str:
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f"category:{self.model.version}:{digest}"
+
+    def _predict(self, normalized: List[str]) -> List[TransactionCategory]:
+        """Runs in the batcher's executor."""
+        return [
+            category if confidence >= self.config.min_confidence else TransactionCategory.OTHER
+            for category, confidence in self.model.predict(normalized)
+        ]
+
+    def _remember(self, normalized: str, category: TransactionCategory) -> None:
+        if self.config.lru_size <= 0:
+            return
+        self._lru[normalized] = category
+        self._lru.move_to_end(normalized)
+        while len(self._lru) > self.config.lru_size:
+            self._lru.popitem(last=False)
+
+    async def categorize(self, descriptions: Sequence[str]) -> List[TransactionCategory]:
+        keys = [normalize_description(description) for description in descriptions]
+        found: Dict[str, TransactionCategory] = {"": TransactionCategory.OTHER}
+        missing: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            if key in found:
+                continue
+            category = self._lru.get(key)
+            if category is None:
+                missing.append(key)
+                continue
+            self._lru.move_to_end(key)
+            self.stats.lru_hits += 1
+            found[key] = category
+
+        if missing and self.cache is not None:
+            missing = await self._from_cache(missing, found)
+
+        if missing:
+            predicted = await self._batcher.submit(missing)
+            self.stats.predicted += len(missing)
+
+            for key, category in zip(missing, predicted):
+                found[key] = category
+                self._remember(key, category)
+
+            if self.cache is not None:
+                await asyncio.gather(*(
+                    self.cache.set(self._cache_key(key), category.name, self.config.cache_ttl_seconds)
+                    for key, category in zip(missing, predicted)
+                ))
+
+        return [found[key] for key in keys]
+
+    async def _from_cache(self, keys: List[str], found: Dict[str, TransactionCategory]) -> List[str]:
+        """Fill found from the shared cache, return the keys still missing."""
+        values: Tuple[Optional[str], ...] = await asyncio.gather(
+            *(self.cache.get(self._cache_key(key)) for key in keys)
+        )
+        still_missing = []
+
+        for key, value in zip(keys, values):
+            if value is None:
+                still_missing.append(key)
+                continue
+            category = TransactionCategory[value]
+            self.stats.cache_hits += 1
+            found[key] = category
+            self._remember(key, category)
+
+        return still_missing
\ No newline at end of file
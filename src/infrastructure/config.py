@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +23,24 @@ class DatabaseConfig(BaseSettings):
     database: str = Field(default="postgres", description="Database name")
     pool_size: int = Field(default=5, description="Connection pool size")
     max_overflow: int = Field(default=20, description="Maximum overflow connections")
+    pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free connection")
+    pool_recycle: int = Field(default=1800, description="Reconnect connections older than this many seconds")
+    pool_pre_ping: bool = Field(default=True, description="Test connections on checkout")
+    statement_cache_size: int = Field(
+        default=100,
+        description="Prepared statements cached per connection (0 behind pgbouncer in transaction mode)",
+    )
+    echo: bool = Field(default=False, description="Log all SQL statements")
+    replica_urls: list[str] = Field(
+        default_factory=list,
+        description="Async DSNs of read replicas, e.g. POSTGRES_REPLICA_URLS='[\"postgresql+asyncpg://...\"]'",
+    )
+    replica_max_lag_seconds: float = Field(
+        default=5.0, description="Replicas lagging more than this are skipped"
+    )
+    replica_check_interval: float = Field(
+        default=5.0, description="Seconds between replica health/lag checks"
+    )
 
     @property
     def async_url(self) -> str:
@@ -31,7 +51,274 @@ class DatabaseConfig(BaseSettings):
         )
 
 
+class RedisConfig(BaseSettings):
+    """
+    Redis connection settings.
+
+    All fields are read from environment variables prefixed with REDIS_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="REDIS_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    url: str = Field(default="redis://localhost:6379/0", description="Redis URL")
+
+
+class CacheConfig(BaseSettings):
+    """
+    Read-through cache settings.
+
+    All fields are read from environment variables prefixed with CACHE_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    backend: Literal["memory", "redis"] = Field(default="memory", description="Cache backend")
+    max_entries: int = Field(default=10_000, description="LRU capacity of the in-memory backend")
+    user_ttl_seconds: float = Field(default=60.0, description="TTL of cached users")
+    statistics_ttl_seconds: float = Field(default=300.0, description="TTL of statistics snapshots")
+
+
+class PasswordHasherConfig(BaseSettings):
+    """
+    Password hashing settings.
+
+    All fields are read from environment variables prefixed with PASSWORD_HASHER_.
+    Raising a cost parameter makes existing hashes get upgraded on next login.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="PASSWORD_HASHER_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    scheme: Literal["bcrypt", "argon2"] = Field(default="bcrypt", description="Scheme for new hashes")
+    bcrypt_rounds: int = Field(default=12, description="bcrypt cost factor (log2 rounds)")
+    argon2_time_cost: int = Field(default=3, description="argon2 iterations")
+    argon2_memory_cost: int = Field(default=65536, description="argon2 memory in KiB")
+    argon2_parallelism: int = Field(default=4, description="argon2 lanes")
+    executor: Literal["thread", "process"] = Field(default="thread", description="Worker pool kind")
+    max_workers: int = Field(default=2, description="Worker pool size")
+    max_concurrency: int = Field(default=4, description="Hash jobs submitted to the pool at once")
+
+
+class MetricsConfig(BaseSettings):
+    """
+    Instrumentation settings.
+
+    All fields are read from environment variables prefixed with METRICS_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    sinks: list[Literal["histogram", "loguru"]] = Field(
+        default_factory=lambda: ["histogram"],
+        description="Where measurements go; histogram is what /metrics serves",
+    )
+    slow_query_ms: Optional[float] = Field(
+        default=200.0, description="Log statements slower than this; unset disables the log"
+    )
+
+
+class IdempotencyConfig(BaseSettings):
+    """
+    Idempotency key settings for deposit / withdraw.
+
+    All fields are read from environment variables prefixed with IDEMPOTENCY_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="IDEMPOTENCY_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    ttl_seconds: int = Field(
+        default=86400, ge=1, description="How long a key replays its stored response"
+    )
+    cleanup_interval_seconds: float = Field(
+        default=300.0, gt=0, description="Pause between expired key sweeps"
+    )
+    cleanup_batch_size: int = Field(
+        default=1000, ge=1, description="Expired keys deleted per DB transaction"
+    )
+
+
+class DepositCoalescingConfig(BaseSettings):
+    """
+    Micro-batching of concurrent deposits to the same account.
+
+    All fields are read from environment variables prefixed with DEPOSIT_COALESCING_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="DEPOSIT_COALESCING_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    enabled: bool = Field(default=False, description="Merge concurrent deposits per user")
+    window_ms: float = Field(
+        default=5.0, ge=0, description="How long the first deposit waits for others"
+    )
+    max_batch: int = Field(
+        default=100, ge=1, description="Write immediately once this many deposits are pending"
+    )
+
+
+class CategorizerConfig(BaseSettings):
+    """
+    Local transaction categorization model.
+
+    All fields are read from environment variables prefixed with CATEGORIZER_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CATEGORIZER_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    model_path: str = Field(
+        default="models/categorizer.bin", description="Trained model, see train_categorizer"
+    )
+    min_confidence: float = Field(
+        default=0.0, ge=0, le=1, description="Below this probability the category is OTHER"
+    )
+    lru_size: int = Field(default=10000, ge=0, description="In-process cache entries")
+    cache_ttl_seconds: float = Field(
+        default=7 * 86400, gt=0, description="TTL of predictions in the shared cache backend"
+    )
+    batch_max_size: int = Field(
+        default=1024, ge=1, description="Descriptions per model call"
+    )
+    batch_wait_ms: float = Field(
+        default=2.0, ge=0, description="How long a model call waits for more requests"
+    )
+
+
+class TransactionPartitionConfig(BaseSettings):
+    """
+    Monthly partitions of the transactions table.
+
+    All fields are read from environment variables prefixed with TRANSACTION_PARTITIONS_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRANSACTION_PARTITIONS_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    months_ahead: int = Field(
+        default=3, ge=0, description="Empty partitions kept ready after the current month"
+    )
+    retention_months: Optional[int] = Field(
+        default=None, ge=1, description="Older months are archived; unset keeps everything attached"
+    )
+    archive_schema: str = Field(
+        default="archive", pattern=r"^[a-z_][a-z0-9_]*$", description="Schema detached partitions move to"
+    )
+    max_splits_per_run: int = Field(
+        default=12, ge=1, description="Months moved out of the default partition per maintenance run"
+    )
+    lock_timeout_ms: int = Field(
+        default=5000, ge=1, description="Give up on a DDL statement that waits this long for its lock"
+    )
+    maintenance_interval_seconds: float = Field(
+        default=3600.0, gt=0, description="Pause between maintenance runs"
+    )
+
+
+class ReconciliationConfig(BaseSettings):
+    """
+    Balance reconciliation job (users.balance vs. income minus expense).
+
+    All fields are read from environment variables prefixed with RECONCILIATION_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="RECONCILIATION_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    range_size: int = Field(default=5000, ge=1, description="User ids per grouped query")
+    concurrency: int = Field(
+        default=4, ge=1, description="Ranges queried at once; keep within POSTGRES_POOL_SIZE + POSTGRES_MAX_OVERFLOW"
+    )
+    journal_path: str = Field(
+        default="reconciliation/journal.jsonl", description="Finished ranges, read back to resume a run"
+    )
+    report_path: str = Field(
+        default="reconciliation/discrepancies.csv", description="Discrepancy report written at the end"
+    )
+
+
+class BudgetAlertConfig(BaseSettings):
+    """
+    Budget alert pipeline: expense events from the write path and their consumer.
+
+    All fields are read from environment variables prefixed with BUDGET_ALERTS_.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="BUDGET_ALERTS_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    enabled: bool = Field(default=True, description="Publish expense events and run the consumer")
+    backend: Literal["memory", "redis"] = Field(
+        default="memory", description="memory: asyncio queue, lost on restart; redis: durable stream"
+    )
+    queue_max_size: int = Field(
+        default=100_000, ge=1, description="In-memory queue capacity; events beyond it are dropped"
+    )
+    stream: str = Field(default="expense-events", description="Redis stream key")
+    stream_max_len: int = Field(default=1_000_000, ge=1, description="Approximate cap on the stream length")
+    consumer_group: str = Field(default="budget-alerts", description="Redis consumer group")
+    claim_idle_seconds: float = Field(
+        default=60.0, gt=0, description="Unacked stream events older than this are redelivered"
+    )
+    batch_size: int = Field(default=500, ge=1, description="Events evaluated together")
+    batch_wait_seconds: float = Field(default=1.0, gt=0, description="How long the consumer waits for events")
+    max_counters: int = Field(default=100_000, ge=1, description="Spend counters kept in memory (LRU)")
+    retry_interval_seconds: float = Field(default=5.0, ge=0, description="Pause after a failed batch")
+
+
+class TelegramConfig(BaseSettings):
+    """
+    Telegram bot and outbound notification dispatcher settings.
+
+    All fields are read from environment variables prefixed with TELEGRAM_.
+    Defaults follow the Bot API limits: about 30 messages per second overall
+    and one per second to the same chat.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="TELEGRAM_", env_file=".env", case_sensitive=False, extra="ignore"
+    )
+
+    bot_token: Optional[SecretStr] = Field(default=None, description="Bot token; unset disables Telegram")
+    api_url: str = Field(default="https://api.telegram.org", description="Bot API base URL")
+    request_timeout_seconds: float = Field(default=10.0, gt=0, description="Timeout of one sendMessage call")
+    global_rate: float = Field(default=30.0, gt=0, description="Messages per second over all chats")
+    global_burst: int = Field(default=30, ge=1, description="Messages that may go out at once")
+    chat_rate: float = Field(default=1.0, gt=0, description="Messages per second to one chat")
+    chat_burst: int = Field(default=1, ge=1, description="Messages to one chat that may go out at once")
+    max_in_flight: int = Field(default=32, ge=1, description="Concurrent sendMessage calls")
+    max_pending: int = Field(default=100_000, ge=1, description="Queued messages; new ones are dropped beyond it")
+    max_message_length: int = Field(default=4096, ge=1, description="Alerts are merged into one message up to this length")
+    max_attempts: int = Field(default=5, ge=1, description="Attempts before a message is dead-lettered")
+    backoff_base_seconds: float = Field(default=1.0, gt=0, description="First retry delay, doubled per attempt")
+    backoff_max_seconds: float = Field(default=60.0, gt=0, description="Upper bound of the retry delay")
+
+
 database_config = DatabaseConfig()
+redis_config = RedisConfig()
+cache_config = CacheConfig()
+password_hasher_config = PasswordHasherConfig()
+metrics_config = MetricsConfig()
+idempotency_config = IdempotencyConfig()
+deposit_coalescing_config = DepositCoalescingConfig()
+categorizer_config = CategorizerConfig()
+transaction_partition_config = TransactionPartitionConfig()
+reconciliation_config = ReconciliationConfig()
+budget_alert_config = BudgetAlertConfig()
+telegram_config = TelegramConfig()
 
-# TODO: add separate config classes for other services (OpenAI, Redis, SMTP)
-# following the same pattern: class RedisConfig(BaseSettings) with env_prefix="REDIS_"
\ No newline at end of file
+# TODO: add separate config classes for other services (OpenAI, SMTP)
+# following the same pattern: class SMTPConfig(BaseSettings) with env_prefix="SMTP_"
\ No newline at end of file
@@ -0,0 +1,3 @@
+from src.infrastructure.database.provider import DatabaseProvider, PoolMetrics
+
+__all__ = ["DatabaseProvider", "PoolMetrics"]
@@ -0,0 +1,57 @@
+import asyncio
+from typing import List
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.budget_alerts import BudgetAlertEvaluator
+from src.domain.entities.budget import BudgetAlert
+from src.domain.interfaces.alert_notifier import IAlertNotifier
+from src.domain.interfaces.event_queue import EventDelivery, IExpenseEventQueue
+from src.infrastructure.config import BudgetAlertConfig, budget_alert_config
+from infrastructure.database.repository.budgets import BudgetRepository
+from infrastructure.database.repository.transaction import TransactionRepository
+
+class BudgetAlertConsumer:
+    """
+    Background consumer of expense events: evaluates them in batches of up
+    to batch_size, one DB transaction per batch, then hands new alerts to the
+    notifier and acks the batch. A failed batch is not acked, so a durable
+    queue delivers it again; alerts already recorded are not sent twice.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        queue: IExpenseEventQueue,
+        notifier: IAlertNotifier,
+        config: BudgetAlertConfig = budget_alert_config,
+    ):
+        self.session_factory = session_factory
+        self.queue = queue
+        self.notifier = notifier
+        self.config = config
+        self.evaluator = BudgetAlertEvaluator(max_counters=config.max_counters)
+
+    async def process(self, delivery: EventDelivery) -> List[BudgetAlert]:
+        async with self.session_factory() as session, session.begin():
+            alerts = await self.evaluator.evaluate(
+                delivery.events, BudgetRepository(session), TransactionRepository(session)
+            )
+
+        if alerts:
+            await self.notifier.notify(alerts)
+        await self.queue.ack(delivery)
+
+        return alerts
+
+    async def run(self) -> None:
+        """Background loop started from the application lifespan."""
+        while True:
+            try:
+                delivery = await self.queue.receive(self.config.batch_size, self.config.batch_wait_seconds)
+                if delivery.receipts or delivery.events:
+                    await self.process(delivery)
+            except Exception as e:
+                logger.warning(f"Budget alert evaluation failed: {e}")
+                # Counters may hold events of the failed batch; rebuild them from the table.
+                self.evaluator.counters.clear()
+                await asyncio.sleep(self.config.retry_interval_seconds)
\ No newline at end of file
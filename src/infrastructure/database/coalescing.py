@@ -0,0 +1,151 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.entities.money import Money
+from src.domain.entities.user import User
+from src.domain.entities.transaction import Transaction
+from src.domain.interfaces.user_repo import IUserRepository
+from src.domain.interfaces.transaction_coalescer import ITransactionCoalescer
+from src.infrastructure.config import DepositCoalescingConfig, deposit_coalescing_config
+from src.infrastructure.database.commit_hooks import SessionCommitHooks
+from infrastructure.database.repository.users import UserRepository
+
+@dataclass
+class _PendingBatch:
+    transactions: List[Transaction] = field(default_factory=list)
+    deltas: List[Money] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def _resolve(
+    future: asyncio.Future, result: Optional[User] = None, error: Optional[Exception] = None
+) -> None:
+    """Callers may have been cancelled while their batch was written."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _CommitFailed(Exception):
+    """The COMMIT of a batch failed; the batch may have been applied all the same."""
+
+
+class TransactionCoalescer(ITransactionCoalescer):
+    """
+    Collects balance changes per user for window_ms (or until max_batch are
+    pending) and writes them with one apply_transactions call in its own session.
+    The user row lock is then taken once per batch instead of once per request.
+
+    Every caller gets the running balance right after its own transaction.
+    If a statement of a batch fails, nothing was applied and its transactions
+    are retried one by one so that each caller sees its own result or error.
+    If the commit fails, the batch may have been applied: every caller gets
+    that error and nothing is retried.
+
+    Pass RepositoryFactory.users as user_repo_factory so that batches go
+    through the user cache like request writes; the session's after-commit
+    hooks run once the batch is committed.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        config: DepositCoalescingConfig = deposit_coalescing_config,
+        user_repo_factory: Callable[[AsyncSession], IUserRepository] = UserRepository,
+    ):
+        self.session_factory = session_factory
+        self.config = config
+        self.user_repo_factory = user_repo_factory
+        self._pending: Dict[int, _PendingBatch] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def apply_transaction(self, transaction: Transaction, delta: Money) -> Optional[User]:
+        user_id = transaction.user_id
+        batch = self._pending.get(user_id)
+
+        if batch is None:
+            batch = self._pending[user_id] = _PendingBatch()
+            task = asyncio.create_task(self._flush_after_window(user_id, batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+        future = asyncio.get_running_loop().create_future()
+        batch.transactions.append(transaction)
+        batch.deltas.append(delta)
+        batch.futures.append(future)
+
+        if len(batch.transactions) >= self.config.max_batch:
+            # Detach now so that later requests start a new batch.
+            self._pending.pop(user_id, None)
+            batch.full.set()
+
+        return await future
+
+    async def close(self) -> None:
+        """Write whatever is pending and wait for in-flight batches."""
+        for batch in self._pending.values():
+            batch.full.set()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def _flush_after_window(self, user_id: int, batch: _PendingBatch) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.config.window_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+
+        if self._pending.get(user_id) is batch:
+            del self._pending[user_id]
+
+        try:
+            await self._flush(user_id, batch)
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+
+    async def _flush(self, user_id: int, batch: _PendingBatch) -> None:
+        try:
+            users = await self._write(user_id, batch.transactions, batch.deltas)
+        except _CommitFailed as e:
+            for future in batch.futures:
+                _resolve(future, error=e.__cause__)
+            return
+        except Exception as e:
+            if len(batch.transactions) > 1:
+                await self._write_one_by_one(batch)
+            else:
+                _resolve(batch.futures[0], error=e)
+            return
+
+        for index, future in enumerate(batch.futures):
+            _resolve(future, users[index] if users else None)
+
+    async def _write(
+        self, user_id: int, transactions: List[Transaction], deltas: List[Money]
+    ) -> Optional[List[User]]:
+        async with self.session_factory() as session:
+            users = await self.user_repo_factory(session).apply_transactions(
+                user_id, transactions, deltas
+            )
+            try:
+                await SessionCommitHooks.commit(session)
+            except Exception as e:
+                raise _CommitFailed() from e
+        return users
+
+    async def _write_one_by_one(self, batch: _PendingBatch) -> None:
+        for transaction, delta, future in zip(batch.transactions, batch.deltas, batch.futures):
+            try:
+                users = await self._write(transaction.user_id, [transaction], [delta])
+            except _CommitFailed as e:
+                _resolve(future, error=e.__cause__)
+            except Exception as e:
+                _resolve(future, error=e)
+            else:
+                _resolve(future, users[0] if users else None)
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Convert money columns from double precision major units to BIGINT minor units.
+
+Usage:
+    python -m src.infrastructure.database.commands.migrate_money_to_minor_units [--dry-run]
+
+Every column is rewritten as round(value * 100)::bigint in one DB transaction,
+so either the whole schema moves or nothing does. Columns that are already
+BIGINT are skipped, which makes the command safe to re-run. ALTER TABLE takes
+an ACCESS EXCLUSIVE lock and rewrites the table: run it in a maintenance window.
+"""
+import argparse
+import asyncio
+from typing import List, Tuple
+from loguru import logger
+from sqlalchemy import text
+from src.domain.entities.money import MINOR_UNITS
+from src.infrastructure.database import DatabaseProvider
+
+MONEY_COLUMNS: List[Tuple[str, str]] = [
+    ("users", "balance"),
+    ("transactions", "amount"),
+    ("daily_user_category_totals", "total"),
+    ("daily_user_category_totals", "min_amount"),
+    ("daily_user_category_totals", "max_amount"),
+]
+
+COLUMN_TYPE_QUERY = text(
+    "SELECT data_type FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+)
+
+
+async def migrate_money_to_minor_units(dry_run: bool) -> None:
+    await DatabaseProvider.init_engine()
+    session_factory = DatabaseProvider.session_factory
+
+    try:
+        async with session_factory() as session, session.begin():
+            for table, column in MONEY_COLUMNS:
+                data_type = (
+                    await session.execute(COLUMN_TYPE_QUERY, {"table": table, "column": column})
+                ).scalar_one_or_none()
+
+                if data_type is None:
+                    logger.warning("{}.{} does not exist, skipping", table, column)
+                    continue
+                if data_type == "bigint":
+                    logger.info("{}.{} is already in minor units", table, column)
+                    continue
+
+                statement = (
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+                    f"USING round({column} * {MINOR_UNITS})::bigint"
+                )
+                logger.info("{}.{} ({}): {}", table, column, data_type, statement)
+                if not dry_run:
+                    await session.execute(text(statement))
+    finally:
+        await DatabaseProvider.dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true", help="Only print what would be converted")
+    args = parser.parse_args()
+
+    asyncio.run(migrate_money_to_minor_units(args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Convert transactions into a monthly partitioned table and run one maintenance pass.
+
+Usage:
+    python -m src.infrastructure.database.commands.partition_transactions [--convert-only]
+
+An unpartitioned transactions table (created before partitioning) is renamed
+and attached as the DEFAULT partition of a new partitioned table, keeping its
+id sequence. The maintenance pass then moves months out of the default
+partition, up to TRANSACTION_PARTITIONS_MAX_SPLITS_PER_RUN per run; run the
+command again (or let the application loop do it) until the default is empty.
+
+The conversion builds the (transaction_id, date_created) primary key on the
+old table while holding an exclusive lock: run it in a maintenance window.
+Already partitioned tables are left alone, so the command is safe to re-run.
+"""
+import argparse
+import asyncio
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database import DatabaseProvider
+from src.infrastructure.database.partitions import TransactionPartitionManager
+from infrastructure.database.models.transaction import DEFAULT_PARTITION, TransactionModel
+from infrastructure.database.models.users import UserModel  # noqa: F401  resolves the users foreign key
+
+TABLE = TransactionModel.__tablename__
+LEGACY_TABLE = f"{TABLE}_legacy"
+
+
+async def _is_partitioned(session: AsyncSession) -> bool:
+    result = await session.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": TABLE},
+    )
+    return result.scalar_one()
+
+
+async def _serial_sequence(session: AsyncSession, table: str) -> str:
+    result = await session.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'transaction_id')"), {"table": table}
+    )
+    return result.scalar_one()
+
+
+async def convert(session: AsyncSession) -> bool:
+    """Swap the plain table for a partitioned one in one DB transaction."""
+    if await _is_partitioned(session):
+        logger.info(f"{TABLE} is already partitioned")
+        return False
+
+    await session.execute(text(f"ALTER TABLE {TABLE} RENAME TO {LEGACY_TABLE}"))
+
+    # A partition cannot bring its own primary key; ATTACH builds the parent's one.
+    primary_key = await session.execute(
+        text("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table) AND contype = 'p'"),
+        {"table": LEGACY_TABLE},
+    )
+    for constraint in primary_key.scalars().all():
+        await session.execute(text(f"ALTER TABLE {LEGACY_TABLE} DROP CONSTRAINT {constraint}"))
+
+    # Index names are schema-wide and the new table creates the same ones. ATTACH
+    # matches the renamed indexes by definition and adopts them instead of rebuilding.
+    indexes = await session.execute(
+        text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = :table"),
+        {"table": LEGACY_TABLE},
+    )
+    for index in indexes.scalars().all():
+        await session.execute(text(f"ALTER INDEX {index} RENAME TO {index}_legacy"))
+
+    legacy_sequence = await _serial_sequence(session, LEGACY_TABLE)
+
+    connection = await session.connection()
+    # checkfirst also skips the enum types, which the old table already uses.
+    await connection.run_sync(TransactionModel.__table__.create, checkfirst=True)
+
+    # Keep handing out ids from the old sequence instead of starting over at 1.
+    new_sequence = await _serial_sequence(session, TABLE)
+    await session.execute(
+        text(f"ALTER TABLE {TABLE} ALTER COLUMN transaction_id SET DEFAULT nextval('{legacy_sequence}')")
+    )
+    await session.execute(text(f"ALTER SEQUENCE {legacy_sequence} OWNED BY {TABLE}.transaction_id"))
+    await session.execute(text(f"DROP SEQUENCE {new_sequence}"))
+
+    await session.execute(text(f"DROP TABLE {DEFAULT_PARTITION}"))
+    await session.execute(text(f"ALTER TABLE {LEGACY_TABLE} RENAME TO {DEFAULT_PARTITION}"))
+    await session.execute(text(f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+
+    logger.info(f"Converted {TABLE}, existing rows are in {DEFAULT_PARTITION}")
+    return True
+
+
+async def partition_transactions(convert_only: bool) -> None:
+    await DatabaseProvider.init_engine()
+    session_factory = DatabaseProvider.session_factory
+
+    try:
+        async with session_factory() as session, session.begin():
+            await convert(session)
+
+        if not convert_only:
+            await TransactionPartitionManager(session_factory).maintain()
+    finally:
+        await DatabaseProvider.dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--convert-only", action="store_true", help="Skip creating partitions and archiving"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(partition_transactions(args.convert_only))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Rebuild / backfill daily_user_category_totals from raw transactions.
+
+Usage:
+    python -m src.infrastructure.database.commands.rebuild_daily_totals [--batch-size 1000] [--since 2024-01-01]
+
+Users are processed in id ranges, each range in its own DB transaction,
+so the command can be re-run safely and does not hold locks for long.
+Days before --since are kept as they are; it defaults to the end of the
+newest archived partition, whose transactions are no longer in the table.
+"""
+import argparse
+import asyncio
+from datetime import date
+from typing import Optional
+from loguru import logger
+from sqlalchemy import func, select
+from src.infrastructure.database import DatabaseProvider
+from infrastructure.database.models.users import UserModel
+from infrastructure.database.repository.daily_totals import DailyTotalsRepository
+from infrastructure.database.repository.partitions import TransactionPartitionRepository
+from src.infrastructure.config import transaction_partition_config
+
+
+async def rebuild_daily_totals(batch_size: int, since: Optional[date]) -> None:
+    await DatabaseProvider.init_engine()
+    session_factory = DatabaseProvider.session_factory
+
+    try:
+        async with session_factory() as session:
+            result = await session.execute(
+                select(func.min(UserModel.user_id), func.max(UserModel.user_id))
+            )
+            min_user_id, max_user_id = result.one()
+
+            if since is None:
+                since = await TransactionPartitionRepository(session).archived_until(
+                    transaction_partition_config.archive_schema
+                )
+
+        if min_user_id is None:
+            logger.info("No users, nothing to rebuild")
+            return
+
+        for range_start in range(min_user_id, max_user_id + 1, batch_size):
+            range_end = min(range_start + batch_size - 1, max_user_id)
+
+            async with session_factory() as session, session.begin():
+                await DailyTotalsRepository(session).rebuild(range_start, range_end, since)
+
+            logger.info("Rebuilt daily totals for users {}..{}", range_start, range_end)
+    finally:
+        await DatabaseProvider.dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users per DB transaction")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="First day to rebuild")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild_daily_totals(args.batch_size, args.since))
+
+
+if __name__ == "__main__":
+    main()
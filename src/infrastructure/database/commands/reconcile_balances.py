@@ -0,0 +1,47 @@
+"""
+Check every users.balance against the user's income minus expense.
+
+Usage:
+    python -m src.infrastructure.database.commands.reconcile_balances [--range-size 5000] [--concurrency 4] [--restart]
+
+User ids are checked in ranges, one grouped query per range, several ranges
+at a time. Finished ranges are appended to RECONCILIATION_JOURNAL_PATH, so an
+interrupted run picks up where it stopped when started again; --restart
+discards the journal. Users whose balance does not match are written to
+RECONCILIATION_REPORT_PATH. The command only reads, nothing is corrected.
+"""
+import argparse
+import asyncio
+from typing import Optional
+from src.infrastructure.config import reconciliation_config
+from src.infrastructure.database import DatabaseProvider
+from src.infrastructure.database.reconciliation import BalanceReconciler
+
+
+async def reconcile_balances(range_size: Optional[int], concurrency: Optional[int], restart: bool) -> None:
+    overrides = {
+        key: value
+        for key, value in {"range_size": range_size, "concurrency": concurrency}.items()
+        if value is not None
+    }
+    config = reconciliation_config.model_copy(update=overrides)
+
+    await DatabaseProvider.init_engine()
+    try:
+        await BalanceReconciler(DatabaseProvider.session_factory, config).run(restart)
+    finally:
+        await DatabaseProvider.dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--range-size", type=int, default=None, help="User ids per grouped query")
+    parser.add_argument("--concurrency", type=int, default=None, help="Ranges queried at once")
+    parser.add_argument("--restart", action="store_true", help="Ignore the journal of a previous run")
+    args = parser.parse_args()
+
+    asyncio.run(reconcile_balances(args.range_size, args.concurrency, args.restart))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
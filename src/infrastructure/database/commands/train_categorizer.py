@@ -0,0 +1,81 @@
+"""
+Train the local categorization model on labeled transaction history.
+
+Usage:
+    python -m src.infrastructure.database.commands.train_categorizer [--epochs 5] [--holdout 0.1]
+
+Every transaction with a description is a (description, category) sample.
+The model is written to CATEGORIZER_MODEL_PATH; accuracy on a random
+holdout share of the samples is logged before it is saved.
+"""
+import argparse
+import asyncio
+import random
+from pathlib import Path
+from loguru import logger
+from sqlalchemy import select
+from src.infrastructure.config import categorizer_config
+from src.infrastructure.database import DatabaseProvider
+from src.infrastructure.categorization.model import HashedNgramModel, normalize_description
+from infrastructure.database.models.transaction import TransactionModel
+
+
+async def load_samples() -> list:
+    await DatabaseProvider.init_engine()
+    table = TransactionModel.__table__
+
+    try:
+        async with DatabaseProvider.session_factory() as session:
+            result = await session.stream(
+                select(table.c.description, table.c.category)
+                .where(table.c.description.is_not(None))
+                .execution_options(yield_per=10000)
+            )
+            samples = []
+            async for description, category in result:
+                normalized = normalize_description(description)
+                if normalized:
+                    samples.append((normalized, category))
+    finally:
+        await DatabaseProvider.dispose_engine()
+
+    return samples
+
+
+def train_categorizer(samples: list, epochs: int, holdout: float, n_features: int, path: Path) -> None:
+    random.Random(42).shuffle(samples)
+    split = int(len(samples) * holdout)
+    test, train = samples[:split], samples[split:]
+
+    model = HashedNgramModel(n_features=n_features)
+    model.train(train, epochs=epochs)
+
+    if test:
+        predictions = model.predict([text for text, _ in test])
+        correct = sum(
+            predicted == category for (predicted, _), (_, category) in zip(predictions, test)
+        )
+        logger.info("Holdout accuracy {:.3f} on {} samples", correct / len(test), len(test))
+
+    model.save(path)
+    logger.info("Saved model {} trained on {} samples to {}", model.version, len(train), path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--holdout", type=float, default=0.1, help="Share of samples kept for evaluation")
+    parser.add_argument("--n-features", type=int, default=2 ** 18, help="Hash buckets")
+    parser.add_argument("--output", type=Path, default=Path(categorizer_config.model_path))
+    args = parser.parse_args()
+
+    samples = asyncio.run(load_samples())
+    if not samples:
+        logger.info("No transactions with descriptions, nothing to train on")
+        return
+
+    train_categorizer(samples, args.epochs, args.holdout, args.n_features, args.output)
+
+
+if __name__ == "__main__":
+    main()
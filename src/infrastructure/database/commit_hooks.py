@@ -0,0 +1,49 @@
+from typing import List
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.interfaces.commit_hooks import AfterCommit, ICommitHooks
+
+INFO_KEY = "commit_hooks"
+
+
+class SessionCommitHooks(ICommitHooks):
+    """
+    After-commit callbacks of one AsyncSession, kept in session.info so that
+    every repository of the session shares them.
+
+    Whoever commits the session runs them with SessionCommitHooks.commit();
+    a rollback drops them. By then the data is committed, so a failing
+    callback is logged and does not stop the others.
+    """
+
+    def __init__(self):
+        self._callbacks: List[AfterCommit] = []
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> "SessionCommitHooks":
+        hooks = session.info.get(INFO_KEY)
+        if hooks is None:
+            hooks = session.info[INFO_KEY] = cls()
+            event.listen(session.sync_session, "after_rollback", lambda _: hooks.discard())
+        return hooks
+
+    @classmethod
+    async def commit(cls, session: AsyncSession) -> None:
+        """Commit the session, then run what was registered for its transaction."""
+        await session.commit()
+        await cls.of(session).run()
+
+    async def after_commit(self, callback: AfterCommit) -> None:
+        self._callbacks.append(callback)
+
+    async def run(self) -> None:
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.warning(f"After-commit callback failed: {e}")
+
+    def discard(self) -> None:
+        self._callbacks.clear()
\ No newline at end of file
@@ -0,0 +1,22 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.entities.notification import DeadLetter
+from src.domain.interfaces.dead_letter_repo import IDeadLetterRepository
+from infrastructure.database.repository.notifications import DeadLetterRepository
+
+class SessionDeadLetterStore(IDeadLetterRepository):
+    """
+    IDeadLetterRepository for the notification dispatcher, which lives outside
+    any request: every call runs in its own short DB transaction.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def add(self, letter: DeadLetter) -> DeadLetter:
+        async with self.session_factory() as session, session.begin():
+            return await DeadLetterRepository(session).add(letter)
+
+    async def get_recent(self, limit: int) -> List[DeadLetter]:
+        async with self.session_factory() as session:
+            return await DeadLetterRepository(session).get_recent(limit)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.interfaces.cache import ICacheBackend
+from src.domain.interfaces.idempotency_repo import IIdempotencyRepository
+from src.domain.interfaces.statistics_cache import IStatisticsCache
+from src.domain.interfaces.transaction_repo import ITransactionRepository
+from src.domain.interfaces.user_repo import IUserRepository
+from src.infrastructure.cache.statistics import StatisticsInvalidatingTransactionRepository
+from src.infrastructure.cache.users import CachedUserRepository, CacheStats
+from src.infrastructure.config import CacheConfig, cache_config
+from src.infrastructure.database.commit_hooks import SessionCommitHooks
+from infrastructure.database.repository.idempotency import IdempotencyRepository
+from infrastructure.database.repository.transaction import TransactionRepository
+from infrastructure.database.repository.users import UserRepository
+
+
+class RepositoryFactory:
+    """
+    Builds the repositories of a session the way the application runs them:
+    users behind the shared read-through cache, which drops its entries
+    again after the session commits (user_cache_stats counts its hits), and
+    transactions that invalidate the statistics snapshots of their users
+    once the session commits. Aggregates that fill those snapshots are read
+    from the primary.
+
+    users() is also the user_repo_factory of TransactionCoalescer, so
+    coalesced writes invalidate the same cache.
+    """
+
+    def __init__(
+        self,
+        user_cache: ICacheBackend,
+        statistics: Optional[IStatisticsCache] = None,
+        config: CacheConfig = cache_config,
+    ):
+        self.user_cache = user_cache
+        self.statistics = statistics
+        self.config = config
+        self.user_cache_stats = CacheStats()
+
+    def users(self, session: AsyncSession) -> IUserRepository:
+        return CachedUserRepository(
+            UserRepository(session),
+            self.user_cache,
+            ttl=self.config.user_ttl_seconds,
+            commit_hooks=SessionCommitHooks.of(session),
+            stats=self.user_cache_stats,
+        )
+
+    def transactions(self, session: AsyncSession) -> ITransactionRepository:
+        if self.statistics is None:
+            # Nothing caches the aggregates, a replica may serve them.
+            return TransactionRepository(session, replica_aggregates=True)
+        return StatisticsInvalidatingTransactionRepository(
+            TransactionRepository(session), self.statistics, commit_hooks=SessionCommitHooks.of(session)
+        )
+
+    def idempotency(self, session: AsyncSession) -> IIdempotencyRepository:
+        return IdempotencyRepository(session)
\ No newline at end of file
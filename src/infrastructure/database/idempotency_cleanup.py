@@ -0,0 +1,44 @@
+import asyncio
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.config import IdempotencyConfig, idempotency_config
+from infrastructure.database.repository.idempotency import IdempotencyRepository
+
+class IdempotencyKeyCleaner:
+    """
+    Deletes expired idempotency keys in small batches, one DB transaction each,
+    so the sweep never holds many row locks or a long transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        config: IdempotencyConfig = idempotency_config,
+    ):
+        self.session_factory = session_factory
+        self.config = config
+
+    async def sweep(self) -> int:
+        """Delete everything expired right now, return the number of keys."""
+        deleted = 0
+        while True:
+            async with self.session_factory() as session:
+                batch = await IdempotencyRepository(session).delete_expired(
+                    self.config.cleanup_batch_size
+                )
+                await session.commit()
+
+            deleted += batch
+            if batch < self.config.cleanup_batch_size:
+                return deleted
+
+    async def run(self) -> None:
+        """Background loop started from the application lifespan."""
+        while True:
+            try:
+                deleted = await self.sweep()
+                if deleted:
+                    logger.info(f"Deleted {deleted} expired idempotency keys")
+            except Exception as e:
+                logger.warning(f"Idempotency key cleanup failed: {e}")
+            await asyncio.sleep(self.config.cleanup_interval_seconds)
\ No newline at end of file
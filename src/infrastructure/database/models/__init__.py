@@ -0,0 +1,23 @@
+"""
+Table models. The application does not import them at module level: the
+database startup calls load_models() once, so only workers that start the
+database pay for SQLModel and mapper configuration.
+"""
+import importlib
+from functools import cache
+
+MODEL_MODULES = ("budgets", "daily_totals", "idempotency_keys", "notifications", "transaction", "users")
+
+
+@cache
+def load_models() -> None:
+    """
+    Import every model module and configure all mappers, once per process.
+    Without it mappers are configured by the first query that needs them,
+    inside the first request that runs one.
+    """
+    from sqlalchemy.orm import configure_mappers
+
+    for name in MODEL_MODULES:
+        importlib.import_module(f"{__name__}.{name}")
+    configure_mappers()
\ No newline at end of file
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlmodel import Field
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Enum as SQLEnum
+from infrastructure.database.base import Base
+from src.domain.entities.statistics import TimeBucket
+from src.domain.entities.transaction import TransactionCategory
+
+class BudgetModel(Base, table=True):
+    """
+    SQLModel for budgets table.
+    Maps to Domain Entity: Budget
+    """
+
+    __tablename__ = "budgets"
+
+    budget_id: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="Budget ID"
+    )
+
+    user_id: int = Field(
+        foreign_key="users.user_id",
+        ondelete="CASCADE",
+        nullable=False,
+        index=True,
+        description="User ID who owns this budget"
+    )
+
+    category: Optional[TransactionCategory] = Field(
+        default=None,
+        sa_column=Column(
+            SQLEnum(TransactionCategory, name="transaction_category"),
+            nullable=True
+        ),
+        description="Watched category, NULL for all expenses"
+    )
+
+    period: TimeBucket = Field(
+        sa_column=Column(
+            SQLEnum(TimeBucket, name="budget_period"),
+            nullable=False
+        ),
+        description="Period the limit applies to"
+    )
+
+    limit_amount: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Spending limit per period in minor units"
+    )
+
+    thresholds: List[int] = Field(
+        sa_column=Column(JSON, nullable=False),
+        description="Percents of the limit that trigger an alert"
+    )
+
+    date_created: datetime = Field(
+        default_factory=datetime.now,
+        sa_column=Column(DateTime, default=datetime.now),
+        description="Date created"
+    )
+
+
+class BudgetAlertModel(Base, table=True):
+    """
+    SQLModel for budget_alerts table.
+    One row per alert sent; the primary key is what deduplicates alerts.
+    """
+
+    __tablename__ = "budget_alerts"
+
+    budget_id: int = Field(
+        foreign_key="budgets.budget_id",
+        ondelete="CASCADE",
+        primary_key=True,
+        description="Budget ID the alert belongs to"
+    )
+
+    period_start: datetime = Field(
+        sa_column=Column(DateTime, primary_key=True),
+        description="Start of the budget period"
+    )
+
+    threshold: int = Field(
+        primary_key=True,
+        description="Percent of the limit that was reached"
+    )
+
+    spent: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Spending of the period when the alert fired, in minor units"
+    )
+
+    date_created: datetime = Field(
+        default_factory=datetime.now,
+        sa_column=Column(DateTime, default=datetime.now),
+        description="Date the alert fired"
+    )
\ No newline at end of file
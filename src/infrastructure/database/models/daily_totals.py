@@ -0,0 +1,62 @@
+from datetime import date
+from sqlmodel import Field
+from sqlalchemy import BigInteger, Column, Date, Enum as SQLEnum
+from infrastructure.database.base import Base
+from src.domain.entities.transaction import TransactionType, TransactionCategory
+
+class DailyUserCategoryTotalModel(Base, table=True):
+    """
+    SQLModel for daily_user_category_totals rollup table.
+    One row per user, day, category and type; maintained in the same
+    DB transaction as every insert into transactions.
+    """
+
+    __tablename__ = "daily_user_category_totals"
+
+    user_id: int = Field(
+        foreign_key="users.user_id",
+        ondelete="CASCADE",
+        primary_key=True,
+        description="User ID who owns the transactions"
+    )
+
+    day: date = Field(
+        sa_column=Column(Date, primary_key=True),
+        description="Calendar day of date_created"
+    )
+
+    category: TransactionCategory = Field(
+        sa_column=Column(
+            SQLEnum(TransactionCategory, name="transaction_category"),
+            primary_key=True
+        ),
+        description="Transaction category"
+    )
+
+    transaction_type: TransactionType = Field(
+        sa_column=Column(
+            SQLEnum(TransactionType, name="transaction_type"),
+            primary_key=True
+        ),
+        description="Income or Expense"
+    )
+
+    total: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Sum of amounts in minor units"
+    )
+
+    count: int = Field(
+        nullable=False,
+        description="Number of transactions"
+    )
+
+    min_amount: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Smallest amount in minor units"
+    )
+
+    max_amount: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Largest amount in minor units"
+    )
\ No newline at end of file
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlmodel import Field
+from sqlalchemy import Column, DateTime, JSON
+from infrastructure.database.base import Base
+
+class IdempotencyKeyModel(Base, table=True):
+    """
+    SQLModel for idempotency_keys table.
+    Maps to IdempotencyRecord.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id: int = Field(
+        foreign_key="users.user_id",
+        ondelete="CASCADE",
+        primary_key=True,
+        description="User ID who sent the request"
+    )
+
+    key: str = Field(
+        primary_key=True,
+        max_length=128,
+        description="Client-supplied idempotency key"
+    )
+
+    response: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSON, nullable=True),
+        description="Stored response, NULL while the request is in flight"
+    )
+
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime, nullable=False, index=True),
+        description="Record can be reused / deleted after this moment"
+    )
\ No newline at end of file
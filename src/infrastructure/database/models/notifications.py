@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field
+from sqlalchemy import BigInteger, Column, DateTime, Enum as SQLEnum, Text
+from infrastructure.database.base import Base
+from src.domain.entities.notification import NotificationPriority
+
+class TelegramLinkModel(Base, table=True):
+    """
+    SQLModel for telegram_links table.
+    One Telegram chat per user, where alerts and replies are sent.
+    """
+
+    __tablename__ = "telegram_links"
+
+    user_id: int = Field(
+        foreign_key="users.user_id",
+        ondelete="CASCADE",
+        primary_key=True,
+        description="User ID"
+    )
+
+    chat_id: int = Field(
+        sa_column=Column(BigInteger, nullable=False, unique=True),
+        description="Telegram chat id"
+    )
+
+    date_created: datetime = Field(
+        default_factory=datetime.now,
+        sa_column=Column(DateTime, default=datetime.now),
+        description="Date linked"
+    )
+
+
+class DeadLetterModel(Base, table=True):
+    """
+    SQLModel for notification_dead_letters table.
+    Maps to Domain Entity: DeadLetter
+    """
+
+    __tablename__ = "notification_dead_letters"
+
+    dead_letter_id: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="Dead letter ID"
+    )
+
+    chat_id: int = Field(
+        sa_column=Column(BigInteger, nullable=False, index=True),
+        description="Telegram chat id"
+    )
+
+    text: str = Field(
+        sa_column=Column(Text, nullable=False),
+        description="Message text"
+    )
+
+    priority: NotificationPriority = Field(
+        sa_column=Column(
+            SQLEnum(NotificationPriority, name="notification_priority"),
+            nullable=False
+        ),
+        description="Priority the message was queued with"
+    )
+
+    attempts: int = Field(
+        nullable=False,
+        description="Delivery attempts made"
+    )
+
+    error: str = Field(
+        sa_column=Column(Text, nullable=False),
+        description="Last delivery error"
+    )
+
+    date_created: datetime = Field(
+        default_factory=datetime.now,
+        sa_column=Column(DateTime, default=datetime.now),
+        description="Date given up"
+    )
\ No newline at end of file
@@ -1,31 +1,48 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from sqlmodel import Field, Relationship
-from sqlalchemy import Column, DateTime, Enum as SQLEnum
+from sqlalchemy import DDL, BigInteger, Column, DateTime, Enum as SQLEnum, Index, Integer, desc, event
 from infrastructure.database.base import Base
 from src.domain.entities.transaction import TransactionType, TransactionCategory
 
 if TYPE_CHECKING:
     from infrastructure.database.models.users import UserModel
 
+# Catches rows no monthly partition covers yet; see infrastructure.database.partitions.
+DEFAULT_PARTITION = "transactions_default"
+
+
 class TransactionModel(Base, table=True):
     """
     SQLModel for transactions table.
     Maps to Domain Entity: Transaction
+
+    Range-partitioned by month on date_created, so the primary key has to
+    include date_created. Filters on date_created let PostgreSQL skip
+    whole partitions.
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Serves keyset pagination: WHERE user_id = ? AND (date_created, transaction_id) < (?, ?)
+        Index(
+            "ix_transactions_user_id_date_created_transaction_id",
+            "user_id",
+            desc("date_created"),
+            desc("transaction_id"),
+        ),
+        {"postgresql_partition_by": "RANGE (date_created)"},
+    )
 
     transaction_id: Optional[int] = Field(
         default=None, 
-        primary_key=True, 
+        sa_column=Column(Integer, primary_key=True, autoincrement=True),
         description="Transaction ID"
     )
     
     user_id: int = Field(
         foreign_key="users.user_id", 
         ondelete="CASCADE", 
-        index=True, 
         nullable=False,
         description="User ID who owns this transaction"
     )
@@ -38,9 +55,9 @@ class TransactionModel(Base, table=True):
         description="Income or Expense"
     )
     
-    amount: float = Field(
-        nullable=False, 
-        description="Transaction amount"
+    amount: int = Field(
+        sa_column=Column(BigInteger, nullable=False),
+        description="Transaction amount in minor units"
     )
     
     category: TransactionCategory = Field(
@@ -51,12 +68,26 @@ class TransactionModel(Base, table=True):
         description="Transaction category"
     )
     
+    description: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        nullable=True,
+        description="Free-text description, e.g. the merchant line of a bank statement"
+    )
+
     date_created: datetime = Field(
         default_factory=datetime.now,
-        sa_column=Column(DateTime, default=datetime.now, nullable=False, index=True),
+        sa_column=Column(DateTime, default=datetime.now, primary_key=True, index=True),
         description="Date transaction was created"
     )
 
     user: Optional["UserModel"] = Relationship(
         back_populates="transactions"
-    )
\ No newline at end of file
+    )
+
+
+event.listen(
+    TransactionModel.__table__,
+    "after_create",
+    DDL(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF transactions DEFAULT").execute_if(dialect="postgresql"),
+)
\ No newline at end of file
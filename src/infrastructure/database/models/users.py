@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from sqlmodel import Field, Relationship
-from sqlalchemy import Column, DateTime
+from sqlalchemy import BigInteger, Column, DateTime
 from infrastructure.database.base import Base
 
 if TYPE_CHECKING:
@@ -43,9 +43,10 @@ class UserModel(Base, table=True):
         description="Phone number"
         )
     
-    balance: float = Field(
-        default=0.0, 
-        description="User balance"
+    balance: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, default=0),
+        description="User balance in minor units"
         )
     
     date_created: datetime = Field(
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import date
+from typing import List, Optional
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.config import TransactionPartitionConfig, transaction_partition_config
+from infrastructure.database.repository.partitions import (
+    TransactionPartition,
+    TransactionPartitionRepository,
+    add_months,
+    month_start,
+)
+
+class TransactionPartitionManager:
+    """
+    Keeps monthly partitions of the transactions table ahead of the calendar,
+    moves backfilled months out of the default partition and detaches months
+    older than the retention period into the archive schema.
+
+    Every step is its own short DB transaction under an advisory lock and a
+    lock_timeout, so several workers can run the loop and none of them holds
+    up inserts for long.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        config: TransactionPartitionConfig = transaction_partition_config,
+    ):
+        self.session_factory = session_factory
+        self.config = config
+
+    async def ensure(self, today: Optional[date] = None) -> List[TransactionPartition]:
+        """Create this month and months_ahead more, then split the default partition."""
+        current = month_start(today or date.today())
+        created = []
+
+        for offset in range(self.config.months_ahead + 1):
+            partition = TransactionPartition.for_month(add_months(current, offset))
+            if await self._create(partition):
+                created.append(partition)
+
+        # Rows only land in the default partition when their month has no partition
+        # yet: imports of old statements, clock skew. Oldest month first.
+        for _ in range(self.config.max_splits_per_run):
+            async with self.session_factory() as session:
+                oldest = await TransactionPartitionRepository(session).oldest_in_default()
+            if oldest is None:
+                break
+
+            partition = TransactionPartition.for_month(oldest.date())
+            if not await self._create(partition):
+                break
+            created.append(partition)
+
+        return created
+
+    async def archive(self, today: Optional[date] = None) -> List[TransactionPartition]:
+        """Detach every month that ended before the retention period."""
+        if self.config.retention_months is None:
+            return []
+
+        cutoff = add_months(month_start(today or date.today()), -self.config.retention_months)
+        async with self.session_factory() as session:
+            attached = await TransactionPartitionRepository(session).list_attached()
+
+        archived = []
+        for partition in attached:
+            if partition.month_end > cutoff:
+                break
+
+            async with self.session_factory() as session, session.begin():
+                repository = TransactionPartitionRepository(session)
+                await repository.set_lock_timeout(self.config.lock_timeout_ms)
+                await repository.lock()
+                await repository.archive(partition, self.config.archive_schema)
+
+            logger.info(f"Archived {partition.name} into schema {self.config.archive_schema}")
+            archived.append(partition)
+
+        return archived
+
+    async def _create(self, partition: TransactionPartition) -> bool:
+        async with self.session_factory() as session, session.begin():
+            repository = TransactionPartitionRepository(session)
+            await repository.set_lock_timeout(self.config.lock_timeout_ms)
+            await repository.lock()
+
+            attached = await repository.list_attached()
+            if any(existing.month_start == partition.month_start for existing in attached):
+                return False
+
+            moved = await repository.create(partition)
+
+        logger.info(f"Created partition {partition.name}, moved {moved} rows from the default partition")
+        return True
+
+    async def maintain(self, today: Optional[date] = None) -> None:
+        await self.ensure(today)
+        await self.archive(today)
+
+    async def run(self) -> None:
+        """Background loop started from the application lifespan."""
+        while True:
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.warning(f"Transaction partition maintenance failed: {e}")
+            await asyncio.sleep(self.config.maintenance_interval_seconds)
\ No newline at end of file
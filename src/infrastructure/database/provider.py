@@ -0,0 +1,157 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from src.infrastructure.config import DatabaseConfig, MetricsConfig, database_config, metrics_config
+from src.infrastructure.metrics.queries import instrument_engine
+from src.infrastructure.database.commit_hooks import SessionCommitHooks
+from src.infrastructure.database.pool import InstrumentedQueuePool
+from src.infrastructure.database.routing import ReplicaRouter, RoutingSession
+
+@dataclass
+class PoolMetrics:
+    """Snapshot of the connection pool for scraping."""
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+
+class DatabaseProvider:
+    """
+    Owns the async engines and hands out sessions.
+    init_engine() / dispose_engine() are called from the application lifespan.
+
+    With POSTGRES_REPLICA_URLS set, sessions route reads marked with
+    replica_read() to replicas (see RoutingSession); everything else,
+    including reads that fill caches, uses the primary.
+    """
+
+    config: DatabaseConfig = database_config
+    metrics_config: MetricsConfig = metrics_config
+    engine: Optional[AsyncEngine] = None
+    replica_engines: list[AsyncEngine] = []
+    router: Optional[ReplicaRouter] = None
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    _replica_checks: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _create_engine(cls, url: str, config: DatabaseConfig) -> AsyncEngine:
+        engine = create_async_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+            echo=config.echo,
+            connect_args={
+                # SQLAlchemy's own prepared statement cache and asyncpg's one.
+                "prepared_statement_cache_size": config.statement_cache_size,
+                "statement_cache_size": config.statement_cache_size,
+            },
+        )
+
+        slow_query_ms = cls.metrics_config.slow_query_ms
+        instrument_engine(
+            engine.sync_engine,
+            slow_query_seconds=slow_query_ms / 1000 if slow_query_ms is not None else None,
+        )
+
+        return engine
+
+    @classmethod
+    async def init_engine(cls, config: DatabaseConfig = database_config) -> None:
+        if cls.engine is not None:
+            return
+
+        # Imported here, not at module level: models and mappers load with the engine.
+        from infrastructure.database.models import load_models
+
+        load_models()
+        cls.config = config
+        cls.engine = cls._create_engine(config.async_url, config)
+
+        if not config.replica_urls:
+            cls.session_factory = async_sessionmaker(cls.engine, expire_on_commit=False)
+            return
+
+        cls.replica_engines = [cls._create_engine(url, config) for url in config.replica_urls]
+        cls.router = ReplicaRouter(cls.engine, cls.replica_engines, config.replica_max_lag_seconds)
+        cls.session_factory = async_sessionmaker(
+            cls.engine,
+            sync_session_class=RoutingSession,
+            info={"router": cls.router},
+            expire_on_commit=False,
+        )
+        cls._replica_checks = asyncio.create_task(
+            cls.router.run_checks(config.replica_check_interval)
+        )
+
+    @classmethod
+    async def dispose_engine(cls) -> None:
+        if cls.engine is None:
+            return
+
+        if cls._replica_checks is not None:
+            cls._replica_checks.cancel()
+            cls._replica_checks = None
+
+        for replica in cls.replica_engines:
+            await replica.dispose()
+
+        await cls.engine.dispose()
+        cls.engine = None
+        cls.replica_engines = []
+        cls.router = None
+        cls.session_factory = None
+
+    @classmethod
+    def _require_session_factory(cls) -> async_sessionmaker[AsyncSession]:
+        if cls.session_factory is None:
+            raise RuntimeError("Database engine is not initialized, call init_engine() first")
+        return cls.session_factory
+
+    @classmethod
+    async def get_session(cls) -> AsyncIterator[AsyncSession]:
+        """
+        Per-request session dependency: commits if the request succeeded,
+        then runs its after-commit hooks (see SessionCommitHooks); rolls back
+        if it raised.
+        """
+        session_factory = cls._require_session_factory()
+
+        async with session_factory() as session:
+            try:
+                yield session
+                await SessionCommitHooks.commit(session)
+            except BaseException:
+                await session.rollback()
+                raise
+
+    @classmethod
+    def pool_metrics(cls, engine: Optional[AsyncEngine] = None) -> PoolMetrics:
+        """Pool snapshot of the given engine, the primary by default."""
+        engine = engine or cls.engine
+        if engine is None:
+            raise RuntimeError("Database engine is not initialized, call init_engine() first")
+
+        pool = engine.pool
+        assert isinstance(pool, InstrumentedQueuePool)
+
+        return PoolMetrics(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=cls.config.max_overflow,
+            checkouts=pool.checkouts,
+            wait_seconds_total=pool.wait_seconds_total,
+            wait_seconds_max=pool.wait_seconds_max,
+            timeouts=pool.timeouts,
+        )
@@ -0,0 +1,222 @@
+import asyncio
+import csv
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.entities.money import Money
+from src.domain.entities.reconciliation import BalanceDiscrepancy
+from src.domain.interfaces.transaction_repo import BalanceReconciliation
+from src.infrastructure.config import ReconciliationConfig, reconciliation_config
+from infrastructure.database.models.users import UserModel
+from infrastructure.database.repository.transaction import TransactionRepository
+
+# Seconds between progress lines while ranges are running.
+PROGRESS_INTERVAL_SECONDS = 10
+
+
+@dataclass(kw_only=True)
+class ReconciliationSummary:
+    ranges: int
+    resumed_ranges: int
+    checked_users: int
+    discrepancies: int
+    seconds: float
+
+    @property
+    def users_per_second(self) -> float:
+        return self.checked_users / self.seconds if self.seconds else 0.0
+
+
+class ReconciliationJournal:
+    """
+    Append-only JSON lines file, the checkpoint of a reconciliation run.
+
+    The first line fixes the run (user id bounds and range size), every
+    following line is one finished range with its discrepancies. A line is
+    written as soon as its range is done, so an interrupted run only repeats
+    the ranges that were in flight; a torn line is skipped and its range redone.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def read(self) -> Tuple[Optional[dict], Dict[int, BalanceReconciliation]]:
+        if not self.path.exists():
+            return None, {}
+
+        header = None
+        finished = {}
+        with self.path.open() as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if header is None:
+                    header = entry
+                    continue
+                finished[entry["min_user_id"]] = BalanceReconciliation(
+                    min_user_id=entry["min_user_id"],
+                    max_user_id=entry["max_user_id"],
+                    checked_users=entry["checked_users"],
+                    discrepancies=[
+                        BalanceDiscrepancy(user_id=user_id, stored_balance=Money(stored), computed_balance=Money(computed))
+                        for user_id, stored, computed in entry["discrepancies"]
+                    ],
+                )
+        return header, finished
+
+    def start(self, header: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as journal:
+            journal.write(json.dumps(header) + "\n")
+
+    def append(self, reconciliation: BalanceReconciliation) -> None:
+        entry = {
+            "min_user_id": reconciliation.min_user_id,
+            "max_user_id": reconciliation.max_user_id,
+            "checked_users": reconciliation.checked_users,
+            "discrepancies": [
+                [item.user_id, int(item.stored_balance), int(item.computed_balance)]
+                for item in reconciliation.discrepancies
+            ],
+        }
+        with self.path.open("a") as journal:
+            journal.write(json.dumps(entry) + "\n")
+
+
+class BalanceReconciler:
+    """
+    Checks users.balance against income minus expense for every user.
+
+    User ids are split into ranges of range_size; each range is one grouped
+    query in its own session, and `concurrency` ranges run at once, so the
+    job holds at most that many pooled connections.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        config: ReconciliationConfig = reconciliation_config,
+    ):
+        self.session_factory = session_factory
+        self.config = config
+        self.journal = ReconciliationJournal(Path(config.journal_path))
+
+    async def _user_id_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(func.min(UserModel.user_id), func.max(UserModel.user_id))
+            )
+            return result.one()
+
+    async def _plan(self, restart: bool) -> Tuple[List[Tuple[int, int]], Dict[int, BalanceReconciliation]]:
+        header, finished = (None, {}) if restart else self.journal.read()
+
+        if header is not None and header["range_size"] != self.config.range_size:
+            raise ValueError(
+                f"{self.journal.path} was written with range size {header['range_size']}, "
+                f"not {self.config.range_size}; pass the same size or restart"
+            )
+
+        if header is None:
+            # Users created after the run started have no history to disagree with.
+            min_user_id, max_user_id = await self._user_id_bounds()
+            header = {"range_size": self.config.range_size, "min_user_id": min_user_id, "max_user_id": max_user_id}
+            self.journal.start(header)
+            finished = {}
+
+        if header["min_user_id"] is None:
+            return [], finished
+
+        ranges = [
+            (range_start, min(range_start + self.config.range_size - 1, header["max_user_id"]))
+            for range_start in range(header["min_user_id"], header["max_user_id"] + 1, self.config.range_size)
+        ]
+        return ranges, finished
+
+    async def _reconcile_range(self, min_user_id: int, max_user_id: int) -> BalanceReconciliation:
+        async with self.session_factory() as session:
+            return await TransactionRepository(session).reconcile_balances(min_user_id, max_user_id)
+
+    async def run(self, restart: bool = False) -> ReconciliationSummary:
+        ranges, finished = await self._plan(restart)
+        pending: asyncio.Queue[Tuple[int, int]] = asyncio.Queue()
+        for range_start, range_end in ranges:
+            if range_start not in finished:
+                pending.put_nowait((range_start, range_end))
+
+        resumed = len(finished)
+        if resumed:
+            logger.info(f"Resuming reconciliation: {resumed} of {len(ranges)} ranges already done")
+
+        checked = 0
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            nonlocal checked
+            while not pending.empty():
+                range_start, range_end = pending.get_nowait()
+                reconciliation = await self._reconcile_range(range_start, range_end)
+                self.journal.append(reconciliation)
+                finished[range_start] = reconciliation
+                checked += reconciliation.checked_users
+
+        async def report_progress() -> None:
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL_SECONDS)
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"Reconciled {len(finished)}/{len(ranges)} ranges, "
+                    f"{checked / elapsed:.0f} users/s"
+                )
+
+        progress = asyncio.create_task(report_progress())
+        try:
+            # A failing range cancels the others; whatever finished is already journaled.
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(self.config.concurrency):
+                    workers.create_task(worker())
+        finally:
+            progress.cancel()
+
+        seconds = time.perf_counter() - started
+        discrepancies = [
+            discrepancy
+            for range_start in sorted(finished)
+            for discrepancy in finished[range_start].discrepancies
+        ]
+        self.write_report(discrepancies)
+
+        summary = ReconciliationSummary(
+            ranges=len(ranges),
+            resumed_ranges=resumed,
+            checked_users=checked,
+            discrepancies=len(discrepancies),
+            seconds=seconds,
+        )
+        logger.info(
+            f"Reconciled {summary.checked_users} users in {summary.seconds:.1f}s "
+            f"({summary.users_per_second:.0f} users/s), {summary.discrepancies} discrepancies "
+            f"written to {self.config.report_path}"
+        )
+        return summary
+
+    def write_report(self, discrepancies: List[BalanceDiscrepancy]) -> None:
+        path = Path(self.config.report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="") as report:
+            writer = csv.writer(report)
+            writer.writerow(["user_id", "stored_balance", "computed_balance", "difference"])
+            for discrepancy in discrepancies:
+                writer.writerow([
+                    discrepancy.user_id,
+                    discrepancy.stored_balance,
+                    discrepancy.computed_balance,
+                    discrepancy.difference,
+                ])
\ No newline at end of file
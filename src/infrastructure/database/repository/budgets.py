@@ -0,0 +1,116 @@
+from typing import List, Optional, Sequence
+from sqlalchemy import BigInteger, DateTime, Integer, column, delete, insert, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.entities.budget import Budget, BudgetAlert
+from src.domain.entities.money import Money
+from src.domain.interfaces.budget_repo import IBudgetRepository
+from infrastructure.database.models.budgets import BudgetAlertModel, BudgetModel
+from src.infrastructure.metrics.queries import instrument_repository
+
+@instrument_repository
+class BudgetRepository(IBudgetRepository):
+    """
+    Implementation of IBudgetRepository on the budgets and budget_alerts tables.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _row_to_entity(self, row: Row) -> Budget:
+        """Convert a Core result row of the budgets table to Domain entity."""
+        return Budget(
+            budget_id=row.budget_id,
+            user_id=row.user_id,
+            category=row.category,
+            period=row.period,
+            limit=Money(row.limit_amount),
+            thresholds=tuple(row.thresholds),
+            date_created=row.date_created,
+        )
+
+    async def create(self, budget: Budget) -> Budget:
+        table = BudgetModel.__table__
+
+        result = await self.session.execute(
+            insert(table)
+            .values(
+                user_id=budget.user_id,
+                category=budget.category,
+                period=budget.period,
+                limit_amount=budget.limit,
+                thresholds=list(budget.thresholds),
+                date_created=budget.date_created,
+            )
+            .returning(table.c.budget_id)
+        )
+        budget.budget_id = result.scalar_one()
+
+        return budget
+
+    async def get_by_id(self, budget_id: int) -> Optional[Budget]:
+        table = BudgetModel.__table__
+
+        result = await self.session.execute(select(table).where(table.c.budget_id == budget_id))
+        row = result.one_or_none()
+
+        return self._row_to_entity(row) if row else None
+
+    async def get_by_user_ids(self, user_ids: Sequence[int]) -> List[Budget]:
+        if not user_ids:
+            return []
+
+        table = BudgetModel.__table__
+
+        result = await self.session.execute(
+            select(table).where(table.c.user_id.in_(user_ids)).order_by(table.c.budget_id)
+        )
+
+        return [self._row_to_entity(row) for row in result]
+
+    async def delete(self, budget_id: int) -> None:
+        table = BudgetModel.__table__
+
+        await self.session.execute(delete(table).where(table.c.budget_id == budget_id))
+
+    async def record_alerts(self, alerts: Sequence[BudgetAlert]) -> List[BudgetAlert]:
+        """
+        INSERT ... SELECT FROM (VALUES ...) JOIN budgets ON CONFLICT DO NOTHING RETURNING:
+        only rows that were not there yet come back, so concurrent consumers never
+        send the same alert twice, and alerts of budgets deleted meanwhile are skipped.
+        """
+        if not alerts:
+            return []
+
+        table = BudgetAlertModel.__table__
+        budgets = BudgetModel.__table__
+
+        new_rows = values(
+            column("budget_id", Integer),
+            column("period_start", DateTime),
+            column("threshold", Integer),
+            column("spent", BigInteger),
+            name="new_rows",
+        ).data([
+            (alert.budget_id, alert.period_start, alert.threshold, alert.spent)
+            for alert in alerts
+        ])
+
+        source = select(
+            new_rows.c.budget_id, new_rows.c.period_start, new_rows.c.threshold, new_rows.c.spent
+        ).join_from(new_rows, budgets, budgets.c.budget_id == new_rows.c.budget_id)
+
+        result = await self.session.execute(
+            pg_insert(table)
+            .from_select(["budget_id", "period_start", "threshold", "spent"], source)
+            .on_conflict_do_nothing()
+            .returning(table.c.budget_id, table.c.period_start, table.c.threshold)
+        )
+        recorded = set(result.tuples())
+
+        return [
+            alert
+            for alert in alerts
+            if (alert.budget_id, alert.period_start, alert.threshold) in recorded
+        ]
\ No newline at end of file
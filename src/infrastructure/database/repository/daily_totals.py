@@ -0,0 +1,139 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Date, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import FromClause
+from src.domain.entities.transaction import Transaction
+from infrastructure.database.models.daily_totals import DailyUserCategoryTotalModel
+from infrastructure.database.models.transaction import TransactionModel
+from infrastructure.database.models.users import UserModel
+from src.infrastructure.metrics.queries import instrument_repository
+from src.infrastructure.database.routing import locking_read
+
+KEY_COLUMNS = ("user_id", "day", "category", "transaction_type")
+VALUE_COLUMNS = ("total", "count", "min_amount", "max_amount")
+
+
+def _on_conflict_accumulate(query: Insert) -> Insert:
+    """Merge a new partial rollup row into the existing one."""
+    table = DailyUserCategoryTotalModel.__table__
+
+    return query.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={
+            "total": table.c.total + query.excluded.total,
+            "count": table.c.count + query.excluded.count,
+            "min_amount": func.least(table.c.min_amount, query.excluded.min_amount),
+            "max_amount": func.greatest(table.c.max_amount, query.excluded.max_amount),
+        },
+    )
+
+
+@instrument_repository
+class DailyTotalsRepository:
+    """
+    Maintains daily_user_category_totals.
+    Only inserts exist for transactions, so sum/count/min/max can all be kept incrementally.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def upsert_from(source: FromClause) -> Insert:
+        """
+        INSERT ... SELECT grouped rows of source ... ON CONFLICT DO UPDATE.
+        source must expose the transactions columns (a table, subquery or CTE);
+        used to chain the rollup into a single-statement write.
+        """
+        table = DailyUserCategoryTotalModel.__table__
+        day = cast(source.c.date_created, Date)
+
+        grouped = select(
+            source.c.user_id,
+            day,
+            source.c.category,
+            source.c.transaction_type,
+            func.sum(source.c.amount),
+            func.count(),
+            func.min(source.c.amount),
+            func.max(source.c.amount),
+        ).group_by(
+            source.c.user_id,
+            day,
+            source.c.category,
+            source.c.transaction_type,
+        )
+
+        return _on_conflict_accumulate(
+            insert(table).from_select([*KEY_COLUMNS, *VALUE_COLUMNS], grouped)
+        )
+
+    async def add(self, transactions: Sequence[Transaction]) -> None:
+        """Fold already inserted transactions into the rollup with one statement."""
+        if not transactions:
+            return
+
+        # ON CONFLICT cannot touch the same row twice, so pre-aggregate per key.
+        groups: Dict[Tuple, List[int]] = defaultdict(list)
+        for transaction in transactions:
+            key = (
+                transaction.user_id,
+                transaction.date_created.date(),
+                transaction.category,
+                transaction.transaction_type,
+            )
+            groups[key].append(transaction.amount)
+
+        rows = [
+            {
+                "user_id": user_id,
+                "day": day,
+                "category": category,
+                "transaction_type": transaction_type,
+                "total": sum(amounts),
+                "count": len(amounts),
+                "min_amount": min(amounts),
+                "max_amount": max(amounts),
+            }
+            for (user_id, day, category, transaction_type), amounts in groups.items()
+        ]
+
+        query = _on_conflict_accumulate(
+            insert(DailyUserCategoryTotalModel.__table__).values(rows)
+        )
+
+        await self.session.execute(query)
+
+    async def rebuild(self, min_user_id: int, max_user_id: int, since: Optional[date] = None) -> None:
+        """
+        Recompute rollup rows of users in [min_user_id, max_user_id] from raw transactions.
+        User rows are locked first, which blocks deposit/withdraw and bulk imports
+        of those users until the rebuild commits.
+
+        With `since`, days before it are left alone: their transactions may have
+        been archived out of the transactions table, the rollup is all that is left.
+        """
+        users = UserModel.__table__
+        transactions = TransactionModel.__table__
+        table = DailyUserCategoryTotalModel.__table__
+
+        await self.session.execute(
+            locking_read(
+                select(users.c.user_id)
+                .where(users.c.user_id.between(min_user_id, max_user_id))
+                .with_for_update()
+            )
+        )
+
+        stale = delete(table).where(table.c.user_id.between(min_user_id, max_user_id))
+        source = select(transactions).where(transactions.c.user_id.between(min_user_id, max_user_id))
+
+        if since is not None:
+            stale = stale.where(table.c.day >= since)
+            source = source.where(transactions.c.date_created >= since)
+
+        await self.session.execute(stale)
+        await self.session.execute(self.upsert_from(source.subquery()))
\ No newline at end of file
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import JSON, delete, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.interfaces.idempotency_repo import IdempotencyRecord, IIdempotencyRepository
+from infrastructure.database.models.idempotency_keys import IdempotencyKeyModel
+from infrastructure.database.models.users import UserModel
+from src.infrastructure.metrics.queries import instrument_repository
+
+@instrument_repository
+class IdempotencyRepository(IIdempotencyRepository):
+    """
+    Implementation of IIdempotencyRepository on the idempotency_keys table.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: int, key: str) -> Optional[IdempotencyRecord]:
+        table = IdempotencyKeyModel.__table__
+
+        query = select(table).where(
+            table.c.user_id == user_id,
+            table.c.key == key,
+            table.c.expires_at > datetime.now(),
+        )
+
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+
+        if row is None:
+            return None
+
+        return IdempotencyRecord(
+            user_id=row.user_id,
+            key=row.key,
+            response=row.response,
+            expires_at=row.expires_at,
+        )
+
+    async def claim(self, user_id: int, key: str, ttl: timedelta) -> bool:
+        """
+        INSERT ... SELECT FROM users ON CONFLICT DO UPDATE ... WHERE expired RETURNING:
+        a row comes back only if the user exists and the key was free or had expired.
+        """
+        table = IdempotencyKeyModel.__table__
+        users = UserModel.__table__
+        now = datetime.now()
+
+        source = select(
+            users.c.user_id,
+            literal(key),
+            literal(None, JSON),
+            literal(now + ttl),
+        ).where(users.c.user_id == user_id)
+
+        query = insert(table).from_select(
+            ["user_id", "key", "response", "expires_at"], source
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.key],
+            set_={"response": None, "expires_at": query.excluded.expires_at},
+            where=table.c.expires_at <= now,
+        ).returning(table.c.key)
+
+        result = await self.session.execute(query)
+
+        return result.one_or_none() is not None
+
+    async def complete(self, user_id: int, key: str, response: Dict[str, Any]) -> None:
+        table = IdempotencyKeyModel.__table__
+
+        await self.session.execute(
+            update(table)
+            .where(table.c.user_id == user_id, table.c.key == key)
+            .values(response=response)
+        )
+
+    async def delete_expired(self, batch_size: int) -> int:
+        """
+        DELETE ... WHERE (user_id, key) IN (SELECT ... LIMIT n FOR UPDATE SKIP LOCKED),
+        so several cleaners never fight over the same rows.
+        """
+        table = IdempotencyKeyModel.__table__
+
+        expired = (
+            select(table.c.user_id, table.c.key)
+            .where(table.c.expires_at <= datetime.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await self.session.execute(
+            delete(table).where(tuple_(table.c.user_id, table.c.key).in_(expired))
+        )
+
+        return result.rowcount
\ No newline at end of file
@@ -0,0 +1,95 @@
+from typing import Dict, List, Sequence
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.entities.notification import DeadLetter
+from src.domain.interfaces.dead_letter_repo import IDeadLetterRepository
+from src.domain.interfaces.telegram_link_repo import ITelegramLinkRepository
+from infrastructure.database.models.notifications import DeadLetterModel, TelegramLinkModel
+from src.infrastructure.metrics.queries import instrument_repository
+
+@instrument_repository
+class TelegramLinkRepository(ITelegramLinkRepository):
+    """
+    Implementation of ITelegramLinkRepository on the telegram_links table.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def link(self, user_id: int, chat_id: int) -> None:
+        table = TelegramLinkModel.__table__
+
+        query = pg_insert(table).values(user_id=user_id, chat_id=chat_id)
+        await self.session.execute(
+            query.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={"chat_id": query.excluded.chat_id, "date_created": query.excluded.date_created},
+            )
+        )
+
+    async def unlink(self, user_id: int) -> None:
+        table = TelegramLinkModel.__table__
+
+        await self.session.execute(delete(table).where(table.c.user_id == user_id))
+
+    async def get_chat_ids(self, user_ids: Sequence[int]) -> Dict[int, int]:
+        if not user_ids:
+            return {}
+
+        table = TelegramLinkModel.__table__
+
+        result = await self.session.execute(
+            select(table.c.user_id, table.c.chat_id).where(table.c.user_id.in_(user_ids))
+        )
+
+        return dict(result.tuples())
+
+
+@instrument_repository
+class DeadLetterRepository(IDeadLetterRepository):
+    """
+    Implementation of IDeadLetterRepository on the notification_dead_letters table.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, letter: DeadLetter) -> DeadLetter:
+        table = DeadLetterModel.__table__
+
+        result = await self.session.execute(
+            insert(table)
+            .values(
+                chat_id=letter.chat_id,
+                text=letter.text,
+                priority=letter.priority,
+                attempts=letter.attempts,
+                error=letter.error,
+                date_created=letter.date_created,
+            )
+            .returning(table.c.dead_letter_id)
+        )
+        letter.dead_letter_id = result.scalar_one()
+
+        return letter
+
+    async def get_recent(self, limit: int) -> List[DeadLetter]:
+        table = DeadLetterModel.__table__
+
+        result = await self.session.execute(
+            select(table).order_by(table.c.dead_letter_id.desc()).limit(limit)
+        )
+
+        return [
+            DeadLetter(
+                dead_letter_id=row.dead_letter_id,
+                chat_id=row.chat_id,
+                text=row.text,
+                priority=row.priority,
+                attempts=row.attempts,
+                error=row.error,
+                date_created=row.date_created,
+            )
+            for row in result
+        ]
\ No newline at end of file
@@ -0,0 +1,161 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, List, Optional
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.database.models.transaction import DEFAULT_PARTITION, TransactionModel
+from src.infrastructure.metrics.queries import instrument_repository
+
+PARENT_TABLE = TransactionModel.__tablename__
+# Named, not SELECT *: a table converted from the unpartitioned layout may order its columns differently.
+COLUMNS = ", ".join(column.name for column in TransactionModel.__table__.columns)
+# pg_advisory_xact_lock key serializing partition maintenance across application workers.
+MAINTENANCE_LOCK_KEY = 0x7472616E73
+MONTHLY_PARTITION = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(kw_only=True)
+class TransactionPartition:
+    """One month of transactions: [month_start, month_end)."""
+    name: str
+    month_start: date
+
+    @property
+    def month_end(self) -> date:
+        return add_months(self.month_start, 1)
+
+    @classmethod
+    def for_month(cls, month: date) -> "TransactionPartition":
+        return cls(name=f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}", month_start=month_start(month))
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional["TransactionPartition"]:
+        match = MONTHLY_PARTITION.match(name)
+        if not match:
+            return None
+        return cls(name=name, month_start=date(int(match.group(1)), int(match.group(2)), 1))
+
+
+@instrument_repository
+class TransactionPartitionRepository:
+    """
+    DDL and catalog queries for the monthly partitions of the transactions table.
+    Partition names encode their month (transactions_p2024_05), so no bounds
+    have to be parsed back out of pg_catalog.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def set_lock_timeout(self, milliseconds: int) -> None:
+        """Fail fast instead of queueing every insert behind a DDL lock; local to the transaction."""
+        await self.session.execute(
+            select(func.set_config("lock_timeout", f"{milliseconds}ms", True))
+        )
+
+    async def lock(self) -> None:
+        """Wait for other workers' maintenance; released at commit."""
+        await self.session.execute(select(func.pg_advisory_xact_lock(MAINTENANCE_LOCK_KEY)))
+
+    async def list_attached(self) -> List[TransactionPartition]:
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass)"
+            ),
+            {"parent": PARENT_TABLE},
+        )
+        return self._monthly(result.scalars())
+
+    async def list_archived(self, schema: str) -> List[TransactionPartition]:
+        result = await self.session.execute(
+            text("SELECT tablename FROM pg_tables WHERE schemaname = :schema"),
+            {"schema": schema},
+        )
+        return self._monthly(result.scalars())
+
+    def _monthly(self, names: Iterable[str]) -> List[TransactionPartition]:
+        partitions = [TransactionPartition.from_name(name) for name in names]
+        return sorted(
+            (partition for partition in partitions if partition is not None),
+            key=lambda partition: partition.month_start,
+        )
+
+    async def oldest_in_default(self) -> Optional[datetime]:
+        """Oldest row no monthly partition covers; an index lookup on date_created."""
+        result = await self.session.execute(
+            text(f"SELECT min(date_created) FROM {DEFAULT_PARTITION}")
+        )
+        return result.scalar_one()
+
+    async def create(self, partition: TransactionPartition) -> int:
+        """
+        Create and attach the partition, moving its month out of the default
+        partition first. Returns the number of rows moved.
+
+        The table is filled before ATTACH, so its indexes are built in one pass
+        and ATTACH finds no overlapping rows left in the default partition.
+        """
+        await self.session.execute(
+            text(f"CREATE TABLE {partition.name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        )
+
+        bounds = {"month_start": partition.month_start, "month_end": partition.month_end}
+        result = await self.session.execute(
+            text(
+                f"WITH moved AS ("
+                f"DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE date_created >= :month_start AND date_created < :month_end "
+                f"RETURNING {COLUMNS}"
+                f") INSERT INTO {partition.name} ({COLUMNS}) SELECT {COLUMNS} FROM moved"
+            ),
+            bounds,
+        )
+
+        # Partition bounds are DDL and cannot be bind parameters; both are dates we formatted.
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {partition.name} "
+                f"FOR VALUES FROM ('{partition.month_start.isoformat()}') "
+                f"TO ('{partition.month_end.isoformat()}')"
+            )
+        )
+
+        return result.rowcount
+
+    async def archive(self, partition: TransactionPartition, schema: str) -> None:
+        """
+        Detach the partition and move it into the cold storage schema. The rows
+        stay queryable as {schema}.{name} but no longer show up in transactions.
+        A month archived before (and backfilled since) is appended to its table.
+        """
+        await self.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        await self.session.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}")
+        )
+
+        archived = f"{schema}.{partition.name}"
+        exists = await self.session.execute(select(func.to_regclass(archived).is_not(None)))
+        if not exists.scalar_one():
+            await self.session.execute(text(f"ALTER TABLE {partition.name} SET SCHEMA {schema}"))
+            return
+
+        await self.session.execute(
+            text(f"INSERT INTO {archived} ({COLUMNS}) SELECT {COLUMNS} FROM {partition.name}")
+        )
+        await self.session.execute(text(f"DROP TABLE {partition.name}"))
+
+    async def archived_until(self, schema: str) -> Optional[date]:
+        """End of the newest archived month; transactions before it are no longer attached."""
+        archived = await self.list_archived(schema)
+        return archived[-1].month_end if archived else None
\ No newline at end of file
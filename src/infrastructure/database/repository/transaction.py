@@ -1,28 +1,63 @@
-from typing import Optional, List
-from sqlalchemy import func, case
-from datetime import datetime
+import time
+from collections import defaultdict
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Optional, List, Sequence, Set, Union
+from sqlalchemy import func, case, cast, insert, or_, update, values, column, table, tuple_, union_all, BigInteger, DateTime, Integer
+from datetime import datetime, time as time_of_day
 from sqlmodel import select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.domain.entities.transaction import Transaction
-from src.domain.interfaces.transaction_repo import ITransactionRepository
+from sqlalchemy.sql import Select
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionBatch
+from src.domain.entities.reconciliation import BalanceDiscrepancy
+from src.domain.interfaces.transaction_repo import BalanceReconciliation, BulkInsertResult, ITransactionRepository, TransactionPage
 from src.domain.entities.transaction import TransactionType, TransactionCategory
+from src.domain.entities.statistics import AggregateDimension, TimeBucket, TransactionAggregate
 from infrastructure.database.models.transaction import TransactionModel
+from infrastructure.database.models.users import UserModel
+from infrastructure.database.models.daily_totals import DailyUserCategoryTotalModel
+from infrastructure.database.repository.daily_totals import DailyTotalsRepository
+from infrastructure.database.repository.partitions import TransactionPartitionRepository, month_start
+from src.infrastructure.config import transaction_partition_config
+from src.infrastructure.pagination import decode_cursor, encode_cursor
+from src.infrastructure.iterables import chunked
+from src.infrastructure.metrics.queries import instrument_repository
+from src.infrastructure.database.routing import replica_read
 
+COPY_COLUMNS = (
+    "transaction_id", "user_id", "transaction_type", "amount", "category", "description", "date_created"
+)
+# Column order of every Core read; _row_to_entity and TransactionBatch.from_rows rely on it.
+ROW_COLUMNS = tuple(TransactionModel.__table__.c[name] for name in COPY_COLUMNS)
+
+
+@instrument_repository
 class TransactionRepository(ITransactionRepository):
-    def __init__(self, session: AsyncSession):
+    """
+    History listings and get_total_by_user() may be served by a read replica
+    (see RoutingSession); aggregate() only with replica_aggregates, because
+    its results usually fill the statistics snapshot cache or budget counters.
+    """
+
+    def __init__(self, session: AsyncSession, replica_aggregates: bool = False):
         self.session = session
+        self.replica_aggregates = replica_aggregates
+        self.daily_totals = DailyTotalsRepository(session)
     
-    def _to_entity(self, model: TransactionModel) -> Transaction:
+    def _row_to_entity(self, row: Row) -> Transaction:
         """
-        Convert ORM model to Domain entity.
+        Convert a Core result row of ROW_COLUMNS to Domain entity.
+        Rows are tuples, unpacking them is the cheapest way to read all fields.
         """
+        transaction_id, user_id, transaction_type, amount, category, description, date_created = row
         return Transaction(
-            transaction_id=model.transaction_id,
-            user_id=model.user_id,
-            transaction_type=model.transaction_type,
-            amount=model.amount,
-            category=model.category,
-            date_created=model.date_created,
+            transaction_id=transaction_id,
+            user_id=user_id,
+            transaction_type=transaction_type,
+            amount=Money(amount),
+            category=category,
+            description=description,
+            date_created=date_created,
         )
         
     def _to_model(self, entity: Transaction) -> TransactionModel:
@@ -35,23 +70,63 @@ class TransactionRepository(ITransactionRepository):
             transaction_type=entity.transaction_type,
             amount=entity.amount,
             category=entity.category,
+            description=entity.description,
             date_created=entity.date_created,
         )
     
+    def _select_by_user(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> Select:
+        """
+        SELECT ROW_COLUMNS of a user's transactions with filters, newest first.
+        Plain columns instead of TransactionModel: rows skip ORM instances
+        and the identity map and are mapped straight to Domain entities.
+        Date bounds stay bare comparisons on date_created so that months
+        outside the range are pruned from the plan. May be read from a replica.
+        """
+        table = TransactionModel.__table__
+
+        query = replica_read(select(*ROW_COLUMNS).where(table.c.user_id == user_id))
+
+        if transaction_type:
+            query = query.where(table.c.transaction_type == transaction_type)
+
+        if category:
+            query = query.where(table.c.category == category)
+
+        if date_from:
+            query = query.where(table.c.date_created >= date_from)
+
+        if date_to:
+            query = query.where(table.c.date_created <= date_to)
+
+        return query.order_by(
+            table.c.date_created.desc(),
+            table.c.transaction_id.desc(),
+        )
+
     async def get_by_id(
             self,
             transaction_id: int, 
         ) -> Optional[Transaction]:
         """
-        
+        Get transaction by ID. Without date_created nothing can be pruned:
+        this probes the primary key index of every attached partition.
         """
 
-        query = select(TransactionModel).where(TransactionModel.transaction_id == transaction_id)
+        query = select(*ROW_COLUMNS).where(
+            TransactionModel.__table__.c.transaction_id == transaction_id
+        )
 
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none
+        row = result.one_or_none()
 
-        return self._to_entity(model) if model else None
+        return self._row_to_entity(row) if row else None
     
     async def get_by_user_id(
         self, 
@@ -65,32 +140,120 @@ class TransactionRepository(ITransactionRepository):
     ) -> List[Transaction]:
         """Get transactions for a user with filters."""
         
-        query = select(TransactionModel).where(TransactionModel.user_id == user_id)
-        
-        if transaction_type:
-            query = query.where(TransactionModel.transaction_type == transaction_type)
-        
-        if category:
-            query = query.where(TransactionModel.category == category)
-        
-        if date_from:
-            query = query.where(TransactionModel.date_created >= date_from)
-        
-        if date_to:
-            query = query.where(TransactionModel.date_created <= date_to)
-        
+        query = self._select_by_user(user_id, transaction_type, category, date_from, date_to)
+
         if limit:
             query = query.limit(limit).offset(offset)
         
-        query = query.order_by(TransactionModel.date_created.desc())
-        
         result = await self.session.execute(query)
         
-        models = result.scalars().all()
-        transactions = [self._to_entity(model) for model in models]
-        
-        return transactions
+        return [self._row_to_entity(row) for row in result.all()]
+
+    async def get_batch_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> TransactionBatch:
+        """Same rows as get_by_user_id, transposed into columns without per-row entities."""
+
+        query = self._select_by_user(user_id, transaction_type, category, date_from, date_to)
+
+        if limit:
+            query = query.limit(limit)
+
+        result = await self.session.execute(query)
+
+        return TransactionBatch.from_rows(result.tuples().all())
     
+    async def get_page_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        """
+        Keyset pagination over (date_created, transaction_id), newest first.
+        Uses ix_transactions_user_id_date_created_transaction_id, so the
+        database seeks straight to the cursor position instead of skipping rows.
+
+        The month the page starts in is read first: that plan touches a single
+        partition and usually fills the page. Only a short page goes on to the
+        older months, whose plan includes every remaining partition.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+
+        table = TransactionModel.__table__
+        query = self._select_by_user(user_id, transaction_type, category, date_from, date_to)
+        upper = date_to
+
+        if cursor:
+            last_date_created, last_transaction_id = decode_cursor(cursor)
+            query = query.where(
+                # Redundant with the row comparison, but partition pruning only understands plain bounds.
+                table.c.date_created <= last_date_created,
+                tuple_(table.c.date_created, table.c.transaction_id)
+                < tuple_(last_date_created, last_transaction_id)
+            )
+            upper = last_date_created
+
+        # One extra row tells whether there is a next page.
+        recent_from = datetime.combine(month_start((upper or datetime.now()).date()), time_of_day.min)
+
+        if date_from is not None and date_from >= recent_from:
+            rows = (await self.session.execute(query.limit(limit + 1))).all()
+        else:
+            rows = (
+                await self.session.execute(query.where(table.c.date_created >= recent_from).limit(limit + 1))
+            ).all()
+            if len(rows) <= limit:
+                rows += (
+                    await self.session.execute(
+                        query.where(table.c.date_created < recent_from).limit(limit + 1 - len(rows))
+                    )
+                ).all()
+
+        transactions = [self._row_to_entity(row) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = transactions[-1]
+            next_cursor = encode_cursor(last.date_created, last.transaction_id)
+
+        return TransactionPage(items=transactions, next_cursor=next_cursor)
+
+    async def iter_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Transaction]:
+        """Stream transactions through a server-side cursor."""
+
+        query = self._select_by_user(
+            user_id, transaction_type, category, date_from, date_to
+        ).execution_options(yield_per=batch_size)
+
+        result = await self.session.stream(query)
+
+        try:
+            async for rows in result.partitions():
+                for row in rows:
+                    yield self._row_to_entity(row)
+        finally:
+            await result.close()
+
     async def create(self, transaction: Transaction) -> Transaction:
         """Create a new transaction."""
         model = self._to_model(transaction)
@@ -99,23 +262,175 @@ class TransactionRepository(ITransactionRepository):
         await self.session.flush() 
         
         transaction.transaction_id = model.transaction_id
+
+        await self.daily_totals.add([transaction])
+
         return transaction
         
+    async def create_many(
+        self,
+        transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]],
+        chunk_size: int = 1000,
+        min_balance: Optional[Money] = Money(0),
+        use_copy: bool = True,
+    ) -> BulkInsertResult:
+        """
+        Bulk insert transactions.
+
+        Each chunk starts with one guarded UPDATE of users.balance for all users
+        touched by the chunk. Rows of users it did not update are rejected; the
+        rest are written with one multi-row INSERT ... RETURNING (or COPY when
+        running on asyncpg and use_copy is set) and one upsert into the daily rollup.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        connection = await self.session.connection()
+        copy_supported = use_copy and connection.dialect.driver == "asyncpg"
+
+        result = BulkInsertResult()
+
+        async for chunk in chunked(transactions, chunk_size):
+            started = time.perf_counter()
+
+            updated_user_ids = await self._apply_balance_deltas(chunk, min_balance)
+            if len(updated_user_ids) < len({transaction.user_id for transaction in chunk}):
+                result.rejected.extend(
+                    transaction for transaction in chunk if transaction.user_id not in updated_user_ids
+                )
+                chunk = [transaction for transaction in chunk if transaction.user_id in updated_user_ids]
+
+            if chunk:
+                if copy_supported:
+                    transaction_ids = await self._copy_chunk(chunk)
+                else:
+                    transaction_ids = await self._insert_chunk(chunk)
+
+                await self.daily_totals.add(chunk)
+
+                for transaction, transaction_id in zip(chunk, transaction_ids):
+                    transaction.transaction_id = transaction_id
+
+                result.transaction_ids.extend(transaction_ids)
+
+            result.chunk_timings.append(time.perf_counter() - started)
+
+        return result
+
+    async def _insert_chunk(self, chunk: List[Transaction]) -> List[int]:
+        """Multi-row INSERT ... RETURNING, ids come back in input order."""
+        transactions = TransactionModel.__table__
+
+        query = insert(transactions).returning(
+            transactions.c.transaction_id, sort_by_parameter_order=True
+        )
+        rows = [
+            {
+                "user_id": transaction.user_id,
+                "transaction_type": transaction.transaction_type,
+                "amount": transaction.amount,
+                "category": transaction.category,
+                "description": transaction.description,
+                "date_created": transaction.date_created,
+            }
+            for transaction in chunk
+        ]
+
+        result = await self.session.execute(query, rows)
+
+        return list(result.scalars().all())
+
+    async def _copy_chunk(self, chunk: List[Transaction]) -> List[int]:
+        """
+        COPY the chunk through the raw asyncpg connection of the current transaction.
+        COPY cannot return generated keys, so ids are reserved from the sequence first.
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        id_rows = await driver_connection.fetch(
+            "SELECT nextval(pg_get_serial_sequence($1, 'transaction_id')) "
+            "FROM generate_series(1, $2)",
+            TransactionModel.__tablename__,
+            len(chunk),
+        )
+        transaction_ids = [row[0] for row in id_rows]
+
+        # SQLAlchemy Enum columns store member names, so COPY must write names too.
+        records = [
+            (
+                transaction_id,
+                transaction.user_id,
+                transaction.transaction_type.name,
+                transaction.amount,
+                transaction.category.name,
+                transaction.description,
+                transaction.date_created,
+            )
+            for transaction_id, transaction in zip(transaction_ids, chunk)
+        ]
+
+        await driver_connection.copy_records_to_table(
+            TransactionModel.__tablename__,
+            records=records,
+            columns=COPY_COLUMNS,
+        )
+
+        return transaction_ids
+
+    async def _apply_balance_deltas(self, chunk: List[Transaction], min_balance: Optional[Money]) -> Set[int]:
+        """
+        UPDATE users SET balance = balance + deltas.delta
+        FROM (VALUES ...) AS deltas(user_id, delta) WHERE users.user_id = deltas.user_id
+            AND (deltas.delta >= 0 OR users.balance + deltas.delta >= :min_balance)
+        RETURNING users.user_id
+
+        Returns the users whose balance was changed: the guard, like the one of
+        a withdrawal, only stops balances from going down below min_balance.
+        """
+        deltas: Dict[int, int] = defaultdict(int)
+
+        for transaction in chunk:
+            if transaction.transaction_type == TransactionType.INCOME:
+                deltas[transaction.user_id] += transaction.amount
+            else:
+                deltas[transaction.user_id] -= transaction.amount
+
+        users = UserModel.__table__
+        deltas_table = values(
+            column("user_id", Integer), column("delta", BigInteger), name="deltas"
+        ).data(sorted(deltas.items()))
+
+        query = (
+            update(users)
+            .where(users.c.user_id == deltas_table.c.user_id)
+            .values(balance=users.c.balance + deltas_table.c.delta)
+            .returning(users.c.user_id)
+        )
+
+        if min_balance is not None:
+            query = query.where(
+                or_(deltas_table.c.delta >= 0, users.c.balance + deltas_table.c.delta >= min_balance)
+            )
+
+        result = await self.session.execute(query)
+        return set(result.scalars())
+
     async def get_total_by_user(
         self, 
         user_id: int, 
         transaction_type: Optional[TransactionType] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-    ) -> float:
+    ) -> Money:
         """
-        Get sum of transactions (always positive).
+        Get sum of transactions (always positive), exact.
         For statistics: "You spent 500 on food"
         """
-        from sqlalchemy import func
-        
-        query = select(func.sum(TransactionModel.amount)).where(
-            TransactionModel.user_id == user_id
+        # sum(bigint) is numeric in PostgreSQL; cast back so the driver hands out an int.
+        query = replica_read(
+            select(cast(func.sum(TransactionModel.amount), BigInteger)).where(TransactionModel.user_id == user_id)
         )
         
         if transaction_type:
@@ -130,4 +445,181 @@ class TransactionRepository(ITransactionRepository):
         result = await self.session.execute(query)
         total = result.scalar_one_or_none()
         
-        return float(total) if total else 0.0
\ No newline at end of file
+        return Money(total or 0)
+
+    async def reconcile_balances(self, min_user_id: int, max_user_id: int) -> BalanceReconciliation:
+        """
+        One statement, so balances and transactions come from the same snapshot:
+
+            SELECT users.user_id, users.balance, coalesce(computed.total, 0)
+            FROM users LEFT JOIN (
+                SELECT user_id, sum(signed amount) FROM (
+                    transactions UNION ALL archive.transactions_p... ) GROUP BY user_id
+            ) computed ...
+            WHERE users.user_id BETWEEN :min AND :max
+
+        Archived partitions still hold part of the history behind each balance,
+        so they are summed too.
+        """
+        users = UserModel.__table__
+        transactions = TransactionModel.__table__
+
+        archived = await TransactionPartitionRepository(self.session).list_archived(
+            transaction_partition_config.archive_schema
+        )
+        sources = [transactions] + [
+            table(
+                partition.name,
+                column("user_id", Integer),
+                column("transaction_type", transactions.c.transaction_type.type),
+                column("amount", BigInteger),
+                schema=transaction_partition_config.archive_schema,
+            )
+            for partition in archived
+        ]
+
+        signed_sums = union_all(*(
+            select(
+                source.c.user_id,
+                func.sum(
+                    case(
+                        (source.c.transaction_type == TransactionType.INCOME, source.c.amount),
+                        else_=-source.c.amount,
+                    )
+                ).label("total"),
+            )
+            .where(source.c.user_id.between(min_user_id, max_user_id))
+            .group_by(source.c.user_id)
+            for source in sources
+        )).subquery()
+
+        computed = (
+            select(signed_sums.c.user_id, cast(func.sum(signed_sums.c.total), BigInteger).label("total"))
+            .group_by(signed_sums.c.user_id)
+            .subquery()
+        )
+
+        query = (
+            select(users.c.user_id, users.c.balance, func.coalesce(computed.c.total, 0))
+            .outerjoin(computed, computed.c.user_id == users.c.user_id)
+            .where(users.c.user_id.between(min_user_id, max_user_id))
+        )
+
+        result = await self.session.execute(query)
+
+        reconciliation = BalanceReconciliation(min_user_id=min_user_id, max_user_id=max_user_id)
+        for user_id, balance, total in result.tuples():
+            reconciliation.checked_users += 1
+            if balance != total:
+                reconciliation.discrepancies.append(
+                    BalanceDiscrepancy(user_id=user_id, stored_balance=Money(balance), computed_balance=Money(total))
+                )
+
+        return reconciliation
+
+    def _rollup_covers(
+        self,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> bool:
+        """Whole-day ranges (or no range) can be answered from the daily rollup."""
+        return (
+            (date_from is None or date_from.time() == time_of_day.min)
+            and (date_to is None or date_to.time() == time_of_day.max)
+        )
+
+    async def aggregate(
+        self,
+        user_ids: Sequence[int],
+        group_by: Sequence[AggregateDimension] = (),
+        bucket: Optional[TimeBucket] = None,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[TransactionAggregate]:
+        """
+        Grouped aggregation in one round trip:
+
+            SELECT user_id, [transaction_type], [category], [date_trunc(bucket, day)],
+                   sum(total), sum(count), min(min_amount), max(max_amount)
+            FROM daily_user_category_totals WHERE user_id IN (...) AND ...
+            GROUP BY user_id, ...
+
+        Reads the daily rollup whenever the date range is made of whole days
+        (date_from at 00:00, date_to at 23:59:59.999999 or unset);
+        otherwise falls back to the same aggregation over raw transactions.
+        """
+        if not user_ids:
+            return []
+
+        if self._rollup_covers(date_from, date_to):
+            table = DailyUserCategoryTotalModel.__table__
+            period_column = cast(table.c.day, DateTime)
+            measures = [
+                cast(func.sum(table.c.total), BigInteger).label("total"),
+                func.sum(table.c.count).label("count"),
+                func.min(table.c.min_amount).label("min_amount"),
+                func.max(table.c.max_amount).label("max_amount"),
+            ]
+            date_from_bound = date_from.date() if date_from else None
+            date_to_bound = date_to.date() if date_to else None
+            date_column = table.c.day
+        else:
+            table = TransactionModel.__table__
+            period_column = table.c.date_created
+            measures = [
+                cast(func.sum(table.c.amount), BigInteger).label("total"),
+                func.count().label("count"),
+                func.min(table.c.amount).label("min_amount"),
+                func.max(table.c.amount).label("max_amount"),
+            ]
+            date_from_bound = date_from
+            date_to_bound = date_to
+            date_column = table.c.date_created
+
+        keys = [table.c.user_id]
+
+        if AggregateDimension.TRANSACTION_TYPE in group_by:
+            keys.append(table.c.transaction_type)
+
+        if AggregateDimension.CATEGORY in group_by:
+            keys.append(table.c.category)
+
+        if bucket:
+            keys.append(func.date_trunc(bucket.value, period_column).label("period_start"))
+
+        query = select(*keys, *measures).where(table.c.user_id.in_(user_ids))
+
+        if transaction_type:
+            query = query.where(table.c.transaction_type == transaction_type)
+
+        if category:
+            query = query.where(table.c.category == category)
+
+        if date_from_bound:
+            query = query.where(date_column >= date_from_bound)
+
+        if date_to_bound:
+            query = query.where(date_column <= date_to_bound)
+
+        query = query.group_by(*keys).order_by(*keys)
+
+        if self.replica_aggregates:
+            query = replica_read(query)
+
+        result = await self.session.execute(query)
+
+        return [
+            TransactionAggregate(
+                user_id=row.user_id,
+                transaction_type=row.transaction_type if AggregateDimension.TRANSACTION_TYPE in group_by else None,
+                category=row.category if AggregateDimension.CATEGORY in group_by else None,
+                period_start=row.period_start if bucket else None,
+                total=Money(row.total),
+                count=int(row.count),
+                min_amount=Money(row.min_amount),
+                max_amount=Money(row.max_amount),
+            )
+            for row in result
+        ]
\ No newline at end of file
@@ -1,10 +1,20 @@
-from typing import Optional
+from dataclasses import replace
+from typing import List, Optional
 from sqlmodel import select
+from sqlalchemy import Integer, column, insert, literal, true, update, values
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.entities.money import Money
 from src.domain.entities.user import User
+from src.domain.entities.transaction import Transaction
 from src.domain.interfaces.user_repo import IUserRepository
 from infrastructure.database.models.users import UserModel
+from infrastructure.database.models.transaction import TransactionModel
+from infrastructure.database.repository.daily_totals import DailyTotalsRepository
+from src.infrastructure.metrics.queries import instrument_repository
+from src.infrastructure.database.routing import locking_read
 
+@instrument_repository
 class UserRepository(IUserRepository):
     """
     Implementation of IUserRepository using SQLModel + PostgreSQL.
@@ -21,10 +31,22 @@ class UserRepository(IUserRepository):
             username=model.username,
             hashed_password=model.password, 
             number=model.number,
-            balance=model.balance,
+            balance=Money(model.balance),
             date_created=model.date_created,
         )
 
+    def _row_to_entity(self, row: Row) -> User:
+        """Convert a Core result row of the users table to Domain entity."""
+        return User(
+            user_id=row.user_id,
+            email=row.email,
+            username=row.username,
+            hashed_password=row.password,
+            number=row.number,
+            balance=Money(row.balance),
+            date_created=row.date_created,
+        )
+
     def _to_model(self, entity: User) -> UserModel:
         """Convert Domain entity to ORM model."""
         return UserModel(
@@ -53,7 +75,7 @@ class UserRepository(IUserRepository):
         query = select(UserModel).where(UserModel.user_id == user_id)
 
         if with_lock:
-            query = query.with_for_update()
+            query = locking_read(query.with_for_update())
 
         result = await self.session.execute(query)
         model = result.scalar_one_or_none()
@@ -69,7 +91,7 @@ class UserRepository(IUserRepository):
         query = select(UserModel).where(UserModel.email == email)
         
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none
+        model = result.scalar_one_or_none()
 
         return self._to_entity(model) if model else None
 
@@ -96,15 +118,230 @@ class UserRepository(IUserRepository):
             user: User,
             )->User:
         """
-        Update an existing user.
+        Update the profile fields of an existing user.
         Returns the updated user.
+
+        Balance and password are not written: the entity may come from an
+        unlocked (or cached) read, and writing them back would undo changes
+        committed since.
         """
-        model = self._to_model(user)
+        users = UserModel.__table__
+
+        query = (
+            update(users)
+            .where(users.c.user_id == user.user_id)
+            .values(email=user.email, username=user.username, number=user.number)
+            .returning(*users.c)
+        )
+
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+
+        if row is None:
+            raise ValueError("User not found")
+
+        return self._row_to_entity(row)
+
+    async def replace_password_hash(
+            self,
+            user_id: int,
+            old_hash: str,
+            new_hash: str,
+            ) -> bool:
+        """
+        Compare-and-set of the password hash:
+
+            UPDATE users SET password = :new_hash
+            WHERE user_id = :user_id AND password = :old_hash
+
+        Only that column is written, so concurrent balance changes are kept.
+        """
+        users = UserModel.__table__
+
+        query = (
+            update(users)
+            .where(users.c.user_id == user_id, users.c.password == old_hash)
+            .values(password=new_hash)
+        )
+
+        result = await self.session.execute(query)
+
+        return result.rowcount == 1
+
+    async def apply_transaction(
+            self,
+            transaction: Transaction,
+            delta: Money,
+            min_balance: Optional[Money] = None,
+            ) -> Optional[User]:
+        """
+        Change balance, insert the transaction and fold it into the daily rollup
+        in a single statement:
+
+            WITH updated AS (
+                UPDATE users SET balance = balance + :delta
+                WHERE user_id = :user_id AND balance + :delta >= :min_balance
+                RETURNING users.*
+            ), inserted AS (
+                INSERT INTO transactions (...) SELECT ... FROM updated
+                RETURNING transactions.*
+            ), rollup AS (
+                INSERT INTO daily_user_category_totals SELECT ... FROM inserted
+                ON CONFLICT (...) DO UPDATE SET total = total + excluded.total, ...
+            )
+            SELECT updated.*, inserted.transaction_id
+            FROM updated JOIN inserted USING (user_id)
+
+        The row lock is taken by the UPDATE itself and held only until commit,
+        no SELECT ... FOR UPDATE round trip is needed.
+        Returns None if the user does not exist or the guard rejected the change.
+        """
+        users = UserModel.__table__
+        transactions = TransactionModel.__table__
+
+        update_query = (
+            update(users)
+            .where(users.c.user_id == transaction.user_id)
+            .values(balance=users.c.balance + delta)
+            .returning(*users.c)
+        )
+
+        if min_balance is not None:
+            update_query = update_query.where(users.c.balance + delta >= min_balance)
+
+        updated = update_query.cte("updated")
+
+        inserted = (
+            insert(transactions)
+            .from_select(
+                ["user_id", "transaction_type", "amount", "category", "description", "date_created"],
+                select(
+                    updated.c.user_id,
+                    literal(transaction.transaction_type, transactions.c.transaction_type.type),
+                    literal(transaction.amount, transactions.c.amount.type),
+                    literal(transaction.category, transactions.c.category.type),
+                    literal(transaction.description, transactions.c.description.type),
+                    literal(transaction.date_created, transactions.c.date_created.type),
+                ),
+            )
+            .returning(*transactions.c)
+            .cte("inserted")
+        )
+
+        rollup = DailyTotalsRepository.upsert_from(inserted).cte("rollup")
+
+        query = (
+            select(updated, inserted.c.transaction_id)
+            .join_from(updated, inserted, inserted.c.user_id == updated.c.user_id)
+            .add_cte(rollup)
+        )
+
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+
+        if row is None:
+            return None
+
+        transaction.transaction_id = row.transaction_id
+
+        return self._row_to_entity(row)
+
+    async def apply_transactions(
+            self,
+            user_id: int,
+            transactions: List[Transaction],
+            deltas: List[Money],
+            ) -> Optional[List[User]]:
+        """
+        Same single-statement write as apply_transaction, for many rows:
+
+            WITH updated AS (
+                UPDATE users SET balance = balance + :total WHERE user_id = :user_id
+                RETURNING users.*
+            ), inserted AS (
+                INSERT INTO transactions (...)
+                SELECT ... FROM updated CROSS JOIN (VALUES ...) AS new_rows ORDER BY ordinal
+                RETURNING transactions.*
+            ), rollup AS (...)
+            SELECT updated.*, inserted.transaction_id FROM updated JOIN inserted USING (user_id)
+
+        ORDER BY ordinal makes the serial ids follow the input order.
+        """
+        users = UserModel.__table__
+        transactions_table = TransactionModel.__table__
+
+        updated = (
+            update(users)
+            .where(users.c.user_id == user_id)
+            .values(balance=users.c.balance + sum(deltas))
+            .returning(*users.c)
+            .cte("updated")
+        )
+
+        new_rows = values(
+            column("ordinal", Integer),
+            column("transaction_type", transactions_table.c.transaction_type.type),
+            column("amount", transactions_table.c.amount.type),
+            column("category", transactions_table.c.category.type),
+            column("description", transactions_table.c.description.type),
+            column("date_created", transactions_table.c.date_created.type),
+            name="new_rows",
+        ).data([
+            (
+                ordinal,
+                transaction.transaction_type,
+                transaction.amount,
+                transaction.category,
+                transaction.description,
+                transaction.date_created,
+            )
+            for ordinal, transaction in enumerate(transactions)
+        ])
+
+        inserted = (
+            insert(transactions_table)
+            .from_select(
+                ["user_id", "transaction_type", "amount", "category", "description", "date_created"],
+                select(
+                    updated.c.user_id,
+                    new_rows.c.transaction_type,
+                    new_rows.c.amount,
+                    new_rows.c.category,
+                    new_rows.c.description,
+                    new_rows.c.date_created,
+                )
+                .select_from(updated.join(new_rows, true()))
+                .order_by(new_rows.c.ordinal),
+            )
+            .returning(*transactions_table.c)
+            .cte("inserted")
+        )
+
+        rollup = DailyTotalsRepository.upsert_from(inserted).cte("rollup")
+
+        query = (
+            select(updated, inserted.c.transaction_id)
+            .join_from(updated, inserted, inserted.c.user_id == updated.c.user_id)
+            .order_by(inserted.c.transaction_id)
+            .add_cte(rollup)
+        )
+
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        if not rows:
+            return None
+
+        user = self._row_to_entity(rows[0])
+        balance = user.balance - sum(deltas)
+        snapshots = []
 
-        updated_model = await self.session.merge(model)
-        await self.session.flush()
+        for transaction, delta, row in zip(transactions, deltas, rows):
+            transaction.transaction_id = row.transaction_id
+            balance += delta
+            snapshots.append(replace(user, balance=balance))
 
-        return self._to_entity(updated_model)
+        return snapshots
 
     async def delete(
         self, 
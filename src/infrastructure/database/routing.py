@@ -0,0 +1,181 @@
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable, Select, visitors
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import CTE
+
+# Seconds since the last replayed transaction, or 0 when the replica has
+# replayed everything it received (an idle primary is not "lag").
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+class ReplicaRouter:
+    """
+    Tracks which replicas are usable and picks one per read.
+
+    A replica drops out when a lag check exceeds max_lag_seconds or when
+    any statement on it fails with a connection error, and comes back on
+    the next successful check. With no usable replica reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[AsyncEngine],
+        max_lag_seconds: float,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self._healthy: Dict[Engine, bool] = {
+            replica.sync_engine: True for replica in replicas
+        }
+        self._round_robin = itertools.cycle([replica.sync_engine for replica in replicas])
+
+        for replica in replicas:
+            event.listen(replica.sync_engine, "handle_error", self._on_error)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect and context.engine is not None:
+            self.mark_unhealthy(context.engine, "connection lost")
+
+    def mark_unhealthy(self, engine: Engine, reason: str) -> None:
+        if self._healthy.get(engine):
+            logger.warning("Replica {} disabled: {}", engine.url.render_as_string(hide_password=True), reason)
+        self._healthy[engine] = False
+
+    def pick(self) -> Optional[Engine]:
+        """Next healthy replica in round-robin order, or None."""
+        for _ in range(len(self.replicas)):
+            engine = next(self._round_robin)
+            if self._healthy[engine]:
+                return engine
+        return None
+
+    async def check(self) -> None:
+        """Measure lag of every replica and update its health."""
+        for replica in self.replicas:
+            engine = replica.sync_engine
+            try:
+                async with replica.connect() as connection:
+                    lag = float((await connection.execute(REPLICA_LAG_QUERY)).scalar_one())
+            except Exception as e:
+                self.mark_unhealthy(engine, f"check failed: {e}")
+                continue
+
+            if lag > self.max_lag_seconds:
+                self.mark_unhealthy(engine, f"lag {lag:.1f}s")
+            else:
+                if not self._healthy[engine]:
+                    logger.info("Replica {} enabled again", engine.url.render_as_string(hide_password=True))
+                self._healthy[engine] = True
+
+    async def run_checks(self, interval: float) -> None:
+        """Background loop started by DatabaseProvider."""
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+
+def replica_read(query: Executable) -> Executable:
+    """
+    Mark a read that may be served by a replica, up to max_lag_seconds old.
+    Only for results that go straight back to the caller: anything that fills
+    a cache reads the primary, or a lagging replica would refill the cache
+    with rows older than the invalidation.
+    """
+    return query.execution_options(replica=True)
+
+
+def locking_read(query: Executable) -> Executable:
+    """Mark a read that locks rows (FOR UPDATE): it pins the session to the primary."""
+    return query.execution_options(locking=True)
+
+
+def _is_plain_read(clause: Any) -> bool:
+    """SELECT not marked as locking and without data-modifying CTEs."""
+    if not isinstance(clause, Select):
+        return False
+
+    if clause.get_execution_options().get("locking"):
+        return False
+
+    for element in visitors.iterate(clause):
+        if isinstance(element, CTE) and isinstance(element.element, UpdateBase):
+            return False
+
+    return True
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads marked with replica_read() to a replica and
+    everything else to the primary.
+
+    Replica reads run in a separate session per replica, opened on first
+    use and closed with this one; they return rows, not tracked ORM objects.
+    After the first write or locking read the session stays on the primary,
+    so a request always reads its own writes.
+
+    A replica read whose connection is lost (or cannot be opened) marks the
+    replica unhealthy, drops that replica's session and runs once more on
+    the primary, where the session then stays. Other errors are raised as
+    they are.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if not _is_plain_read(clause):
+            self.info["pinned"] = True
+
+        return self.info["router"].primary.sync_engine
+
+    def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        router: ReplicaRouter = self.info["router"]
+
+        if self.info.get("pinned") or not isinstance(statement, Executable):
+            return super().execute(statement, *args, **kwargs)
+        if not statement.get_execution_options().get("replica"):
+            return super().execute(statement, *args, **kwargs)
+
+        replica = router.pick()
+        if replica is None:
+            return super().execute(statement, *args, **kwargs)
+
+        replica_sessions: Dict[Engine, Session] = self.info.setdefault("replica_sessions", {})
+        if replica not in replica_sessions:
+            replica_sessions[replica] = Session(bind=replica)
+
+        try:
+            return replica_sessions[replica].execute(statement, *args, **kwargs)
+        except (DBAPIError, OSError) as e:
+            # OSError: no connection could be opened, the driver raises it unwrapped.
+            if isinstance(e, DBAPIError) and not e.connection_invalidated:
+                raise
+            router.mark_unhealthy(replica, f"read failed: {e}")
+
+        logger.warning(
+            "Read on replica {} failed, retrying on the primary",
+            replica.url.render_as_string(hide_password=True),
+        )
+        replica_sessions.pop(replica).close()
+        self.info["pinned"] = True
+        return super().execute(statement, *args, **kwargs)
+
+    def close(self) -> None:
+        for replica_session in self.info.pop("replica_sessions", {}).values():
+            replica_session.close()
+        super().close()
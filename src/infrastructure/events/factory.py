@@ -0,0 +1,20 @@
+from src.domain.interfaces.event_queue import IExpenseEventQueue
+from src.infrastructure.config import BudgetAlertConfig, RedisConfig, budget_alert_config, redis_config
+from src.infrastructure.events.memory import InMemoryExpenseEventQueue
+from src.infrastructure.events.redis import RedisStreamExpenseEventQueue
+
+
+def create_expense_event_queue(
+    config: BudgetAlertConfig = budget_alert_config,
+    redis: RedisConfig = redis_config,
+) -> IExpenseEventQueue:
+    """Build the queue selected by BUDGET_ALERTS_BACKEND."""
+    if config.backend == "redis":
+        return RedisStreamExpenseEventQueue.from_url(
+            redis.url,
+            stream=config.stream,
+            group=config.consumer_group,
+            max_len=config.stream_max_len,
+            claim_idle_seconds=config.claim_idle_seconds,
+        )
+    return InMemoryExpenseEventQueue(max_size=config.queue_max_size)
\ No newline at end of file
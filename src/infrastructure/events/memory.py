@@ -0,0 +1,37 @@
+import asyncio
+from loguru import logger
+from src.domain.entities.events import ExpenseRecorded
+from src.domain.interfaces.event_queue import EventDelivery, IExpenseEventQueue
+
+class InMemoryExpenseEventQueue(IExpenseEventQueue):
+    """
+    asyncio.Queue inside one worker process. publish() never waits: when the
+    consumer falls max_size events behind, new events are dropped and counted
+    rather than slowing down withdrawals. Nothing survives a restart.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self._queue: asyncio.Queue[ExpenseRecorded] = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+
+    async def publish(self, event: ExpenseRecorded) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Expense event queue is full, {self.dropped} events dropped so far")
+
+    async def receive(self, max_batch: int, timeout: float) -> EventDelivery:
+        delivery = EventDelivery()
+        try:
+            delivery.events.append(await asyncio.wait_for(self._queue.get(), timeout))
+        except asyncio.TimeoutError:
+            return delivery
+
+        while len(delivery.events) < max_batch and not self._queue.empty():
+            delivery.events.append(self._queue.get_nowait())
+        return delivery
+
+    async def ack(self, delivery: EventDelivery) -> None:
+        pass
\ No newline at end of file
@@ -0,0 +1,123 @@
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+from src.domain.entities.events import ExpenseRecorded
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionCategory
+from src.domain.interfaces.event_queue import EventDelivery, IExpenseEventQueue
+
+class RedisStreamClient(Protocol):
+    """The subset of redis.asyncio.Redis used by the queue; fakes only need these."""
+
+    async def xadd(self, name: str, fields: Dict[str, Any], maxlen: Optional[int] = None, approximate: bool = True) -> Any: ...
+
+    async def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False) -> Any: ...
+
+    async def xreadgroup(
+        self, groupname: str, consumername: str, streams: Dict[str, str], count: Optional[int] = None, block: Optional[int] = None
+    ) -> Any: ...
+
+    async def xautoclaim(
+        self, name: str, groupname: str, consumername: str, min_idle_time: int, start_id: str = "0-0", count: Optional[int] = None
+    ) -> Any: ...
+
+    async def xack(self, name: str, groupname: str, *ids: str) -> Any: ...
+
+
+def _encode(event: ExpenseRecorded) -> Dict[str, str]:
+    return {
+        "user_id": str(event.user_id),
+        "transaction_id": str(event.transaction_id),
+        "category": event.category.value,
+        "amount": str(int(event.amount)),
+        "date_created": event.date_created.isoformat(),
+    }
+
+
+def _decode(fields: Dict[str, str]) -> ExpenseRecorded:
+    return ExpenseRecorded(
+        user_id=int(fields["user_id"]),
+        transaction_id=int(fields["transaction_id"]),
+        category=TransactionCategory(fields["category"]),
+        amount=Money(int(fields["amount"])),
+        date_created=datetime.fromisoformat(fields["date_created"]),
+    )
+
+
+class RedisStreamExpenseEventQueue(IExpenseEventQueue):
+    """
+    Durable queue on a Redis stream with one consumer group shared by all
+    workers. Events stay pending until acked; events a consumer took but never
+    acked (it crashed or restarted) are claimed by another one after
+    claim_idle_seconds, so each event is processed at least once.
+    """
+
+    def __init__(
+        self,
+        client: RedisStreamClient,
+        stream: str = "expense-events",
+        group: str = "budget-alerts",
+        max_len: int = 1_000_000,
+        claim_idle_seconds: float = 60.0,
+        consumer: Optional[str] = None,
+    ):
+        self.client = client
+        self.stream = stream
+        self.group = group
+        self.max_len = max_len
+        self.claim_idle_seconds = claim_idle_seconds
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+        self._next_claim = 0.0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisStreamExpenseEventQueue":
+        """Build a queue on top of redis.asyncio (imported only when used)."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url, decode_responses=True), **kwargs)
+
+    async def publish(self, event: ExpenseRecorded) -> None:
+        await self.client.xadd(self.stream, _encode(event), maxlen=self.max_len, approximate=True)
+
+    async def receive(self, max_batch: int, timeout: float) -> EventDelivery:
+        await self._ensure_group()
+
+        entries: List[Tuple[str, Dict[str, str]]] = []
+        if time.monotonic() >= self._next_claim:
+            # Pending entries of consumers that went away, including this one before a restart.
+            _, entries, *_ = await self.client.xautoclaim(
+                self.stream, self.group, self.consumer,
+                min_idle_time=int(self.claim_idle_seconds * 1000), count=max_batch,
+            )
+            if len(entries) < max_batch:
+                self._next_claim = time.monotonic() + self.claim_idle_seconds
+
+        if not entries:
+            response = await self.client.xreadgroup(
+                self.group, self.consumer, {self.stream: ">"}, count=max_batch, block=int(timeout * 1000)
+            )
+            entries = response[0][1] if response else []
+
+        delivery = EventDelivery()
+        for entry_id, fields in entries:
+            if fields:  # trimmed away while pending
+                delivery.events.append(_decode(fields))
+            delivery.receipts.append(entry_id)
+        return delivery
+
+    async def ack(self, delivery: EventDelivery) -> None:
+        if delivery.receipts:
+            await self.client.xack(self.stream, self.group, *delivery.receipts)
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
\ No newline at end of file
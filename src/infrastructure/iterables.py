@@ -0,0 +1,27 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, List, TypeVar, Union
+
+T = TypeVar("T")
+
+
+async def chunked(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    chunk_size: int,
+) -> AsyncIterator[List[T]]:
+    """Split a sync or async iterable into lists of at most chunk_size items."""
+    chunk: List[T] = []
+
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
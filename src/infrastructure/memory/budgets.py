@@ -0,0 +1,46 @@
+from dataclasses import replace
+from typing import List, Optional, Sequence
+from src.domain.entities.budget import Budget, BudgetAlert
+from src.domain.interfaces.budget_repo import IBudgetRepository
+from src.infrastructure.memory.store import InMemoryStore
+
+class InMemoryBudgetRepository(IBudgetRepository):
+    """
+    Implementation of IBudgetRepository on plain dicts, for benchmarks and local runs.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, budget: Budget) -> Budget:
+        if budget.user_id not in self.store.users:
+            raise ValueError("User not found")
+
+        budget.budget_id = self.store.next_budget_id
+        self.store.next_budget_id += 1
+        self.store.budgets[budget.budget_id] = replace(budget)
+
+        return budget
+
+    async def get_by_id(self, budget_id: int) -> Optional[Budget]:
+        budget = self.store.budgets.get(budget_id)
+        return replace(budget) if budget else None
+
+    async def get_by_user_ids(self, user_ids: Sequence[int]) -> List[Budget]:
+        wanted = set(user_ids)
+        return [replace(budget) for budget in self.store.budgets.values() if budget.user_id in wanted]
+
+    async def delete(self, budget_id: int) -> None:
+        self.store.budgets.pop(budget_id, None)
+        self.store.budget_alerts = {
+            sent for sent in self.store.budget_alerts if sent[0] != budget_id
+        }
+
+    async def record_alerts(self, alerts: Sequence[BudgetAlert]) -> List[BudgetAlert]:
+        recorded = []
+        for alert in alerts:
+            key = (alert.budget_id, alert.period_start, alert.threshold)
+            if alert.budget_id in self.store.budgets and key not in self.store.budget_alerts:
+                self.store.budget_alerts.add(key)
+                recorded.append(alert)
+        return recorded
\ No newline at end of file
@@ -0,0 +1,46 @@
+from dataclasses import replace
+from typing import Dict, List, Sequence
+from src.domain.entities.notification import DeadLetter
+from src.domain.interfaces.dead_letter_repo import IDeadLetterRepository
+from src.domain.interfaces.telegram_link_repo import ITelegramLinkRepository
+from src.infrastructure.memory.store import InMemoryStore
+
+class InMemoryTelegramLinkRepository(ITelegramLinkRepository):
+    """
+    Implementation of ITelegramLinkRepository on plain dicts, for benchmarks and local runs.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def link(self, user_id: int, chat_id: int) -> None:
+        if user_id not in self.store.users:
+            raise ValueError("User not found")
+        self.store.telegram_chat_ids[user_id] = chat_id
+
+    async def unlink(self, user_id: int) -> None:
+        self.store.telegram_chat_ids.pop(user_id, None)
+
+    async def get_chat_ids(self, user_ids: Sequence[int]) -> Dict[int, int]:
+        chat_ids = self.store.telegram_chat_ids
+        return {user_id: chat_ids[user_id] for user_id in user_ids if user_id in chat_ids}
+
+
+class InMemoryDeadLetterRepository(IDeadLetterRepository):
+    """
+    Implementation of IDeadLetterRepository on a plain list, for benchmarks and local runs.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def add(self, letter: DeadLetter) -> DeadLetter:
+        letter.dead_letter_id = self.store.next_dead_letter_id
+        self.store.next_dead_letter_id += 1
+        self.store.dead_letters.append(replace(letter))
+        return letter
+
+    async def get_recent(self, limit: int) -> List[DeadLetter]:
+        if limit <= 0:
+            return []
+        return [replace(letter) for letter in reversed(self.store.dead_letters[-limit:])]
\ No newline at end of file
@@ -0,0 +1,43 @@
+import bisect
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+from src.domain.entities.budget import Budget
+from src.domain.entities.notification import DeadLetter
+from src.domain.entities.transaction import Transaction
+from src.domain.entities.user import User
+
+SortKey = Tuple[datetime, int]
+
+@dataclass
+class InMemoryStore:
+    """
+    Tables shared by the in-memory repositories.
+
+    transactions_by_user keeps (date_created, transaction_id) keys sorted
+    ascending, so listings walk it backwards and cursors are a bisect away.
+    """
+    users: Dict[int, User] = field(default_factory=dict)
+    user_ids_by_email: Dict[str, int] = field(default_factory=dict)
+    transactions: Dict[int, Transaction] = field(default_factory=dict)
+    transactions_by_user: Dict[int, List[SortKey]] = field(default_factory=dict)
+    budgets: Dict[int, Budget] = field(default_factory=dict)
+    # (budget_id, period_start, threshold) of alerts already sent.
+    budget_alerts: Set[Tuple[int, datetime, int]] = field(default_factory=set)
+    telegram_chat_ids: Dict[int, int] = field(default_factory=dict)
+    dead_letters: List[DeadLetter] = field(default_factory=list)
+    next_user_id: int = 1
+    next_transaction_id: int = 1
+    next_budget_id: int = 1
+    next_dead_letter_id: int = 1
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        """Store a copy of the transaction, assigning its id."""
+        transaction.transaction_id = self.next_transaction_id
+        self.next_transaction_id += 1
+
+        self.transactions[transaction.transaction_id] = replace(transaction)
+        bisect.insort(
+            self.transactions_by_user.setdefault(transaction.user_id, []),
+            (transaction.date_created, transaction.transaction_id),
+        )
@@ -0,0 +1,282 @@
+import bisect
+import time
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionBatch, TransactionCategory, TransactionType
+from src.domain.entities.statistics import AggregateDimension, TimeBucket, TransactionAggregate, truncate_to_bucket
+from src.domain.entities.reconciliation import BalanceDiscrepancy
+from src.domain.interfaces.transaction_repo import BalanceReconciliation, BulkInsertResult, ITransactionRepository, TransactionPage
+from src.infrastructure.iterables import chunked
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.pagination import decode_cursor, encode_cursor
+
+
+class InMemoryTransactionRepository(ITransactionRepository):
+    """
+    Implementation of ITransactionRepository on plain dicts, for benchmarks and local runs.
+    Per-user listings come from the store's sorted (date_created, transaction_id) index.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def _newest_first(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        before: Optional[Tuple[datetime, int]] = None,
+    ) -> Iterator[Transaction]:
+        keys = self.store.transactions_by_user.get(user_id, [])
+        end = bisect.bisect_left(keys, before) if before else len(keys)
+
+        for index in range(end - 1, -1, -1):
+            date_created, transaction_id = keys[index]
+
+            if date_from and date_created < date_from:
+                break
+            if date_to and date_created > date_to:
+                continue
+
+            transaction = self.store.transactions[transaction_id]
+            if transaction_type and transaction.transaction_type != transaction_type:
+                continue
+            if category and transaction.category != category:
+                continue
+
+            yield transaction
+
+    async def get_by_id(self, transaction_id: int) -> Optional[Transaction]:
+        transaction = self.store.transactions.get(transaction_id)
+        return replace(transaction) if transaction else None
+
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Transaction]:
+        transactions = self._newest_first(user_id, transaction_type, category, date_from, date_to)
+
+        result = []
+        for index, transaction in enumerate(transactions):
+            if index < offset:
+                continue
+            if limit and len(result) >= limit:
+                break
+            result.append(replace(transaction))
+
+        return result
+
+    async def get_batch_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> TransactionBatch:
+        transactions = self._newest_first(user_id, transaction_type, category, date_from, date_to)
+
+        rows = []
+        for transaction in transactions:
+            if limit and len(rows) >= limit:
+                break
+            rows.append((
+                transaction.transaction_id,
+                transaction.user_id,
+                transaction.transaction_type,
+                transaction.amount,
+                transaction.category,
+                transaction.description,
+                transaction.date_created,
+            ))
+
+        return TransactionBatch.from_rows(rows)
+
+    async def get_page_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+
+        before = decode_cursor(cursor) if cursor else None
+        transactions = self._newest_first(
+            user_id, transaction_type, category, date_from, date_to, before
+        )
+
+        items: List[Transaction] = []
+        next_cursor = None
+        for transaction in transactions:
+            if len(items) == limit:
+                last = items[-1]
+                next_cursor = encode_cursor(last.date_created, last.transaction_id)
+                break
+            items.append(replace(transaction))
+
+        return TransactionPage(items=items, next_cursor=next_cursor)
+
+    async def iter_by_user_id(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Transaction]:
+        transactions = self._newest_first(user_id, transaction_type, category, date_from, date_to)
+        for transaction in transactions:
+            yield replace(transaction)
+
+    async def create(self, transaction: Transaction) -> Transaction:
+        self.store.add_transaction(transaction)
+        return transaction
+
+    async def create_many(
+        self,
+        transactions: Union[Iterable[Transaction], AsyncIterable[Transaction]],
+        chunk_size: int = 1000,
+        min_balance: Optional[Money] = Money(0),
+    ) -> BulkInsertResult:
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        result = BulkInsertResult()
+
+        async for chunk in chunked(transactions, chunk_size):
+            started = time.perf_counter()
+
+            deltas: Dict[int, int] = defaultdict(int)
+            for transaction in chunk:
+                if transaction.transaction_type == TransactionType.INCOME:
+                    deltas[transaction.user_id] += transaction.amount
+                else:
+                    deltas[transaction.user_id] -= transaction.amount
+
+            # Same guard as the database: the whole chunk of a user, or none of it.
+            accepted = set()
+            for user_id, delta in deltas.items():
+                user = self.store.users.get(user_id)
+                if user is None:
+                    continue
+                if min_balance is not None and delta < 0 and user.balance + delta < min_balance:
+                    continue
+                user.balance += delta
+                accepted.add(user_id)
+
+            for transaction in chunk:
+                if transaction.user_id not in accepted:
+                    result.rejected.append(transaction)
+                    continue
+
+                self.store.add_transaction(transaction)
+                result.transaction_ids.append(transaction.transaction_id)
+
+            result.chunk_timings.append(time.perf_counter() - started)
+
+        return result
+
+    async def get_total_by_user(
+        self,
+        user_id: int,
+        transaction_type: Optional[TransactionType] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> Money:
+        transactions = self._newest_first(user_id, transaction_type, None, date_from, date_to)
+        return Money(sum(transaction.amount for transaction in transactions))
+
+    async def reconcile_balances(self, min_user_id: int, max_user_id: int) -> BalanceReconciliation:
+        reconciliation = BalanceReconciliation(min_user_id=min_user_id, max_user_id=max_user_id)
+
+        for user_id in range(min_user_id, max_user_id + 1):
+            user = self.store.users.get(user_id)
+            if user is None:
+                continue
+
+            computed = Money(0)
+            for _, transaction_id in self.store.transactions_by_user.get(user_id, []):
+                transaction = self.store.transactions[transaction_id]
+                if transaction.transaction_type == TransactionType.INCOME:
+                    computed += transaction.amount
+                else:
+                    computed -= transaction.amount
+
+            reconciliation.checked_users += 1
+            if computed != user.balance:
+                reconciliation.discrepancies.append(
+                    BalanceDiscrepancy(user_id=user_id, stored_balance=user.balance, computed_balance=computed)
+                )
+
+        return reconciliation
+
+    async def aggregate(
+        self,
+        user_ids: Sequence[int],
+        group_by: Sequence[AggregateDimension] = (),
+        bucket: Optional[TimeBucket] = None,
+        transaction_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[TransactionAggregate]:
+        by_type = AggregateDimension.TRANSACTION_TYPE in group_by
+        by_category = AggregateDimension.CATEGORY in group_by
+
+        groups: Dict[tuple, List[int]] = defaultdict(list)
+
+        for user_id in sorted(set(user_ids)):
+            transactions = self._newest_first(user_id, transaction_type, category, date_from, date_to)
+            for transaction in transactions:
+                key = (
+                    user_id,
+                    transaction.transaction_type if by_type else None,
+                    transaction.category if by_category else None,
+                    truncate_to_bucket(transaction.date_created, bucket) if bucket else None,
+                )
+                groups[key].append(transaction.amount)
+
+        # Same order as PostgreSQL: enums sort by declaration order.
+        type_order = {member: index for index, member in enumerate(TransactionType)}
+        category_order = {member: index for index, member in enumerate(TransactionCategory)}
+
+        def sort_key(key: tuple) -> tuple:
+            user_id, type_, category_, period_start = key
+            return (
+                user_id,
+                type_order.get(type_, -1),
+                category_order.get(category_, -1),
+                period_start or datetime.min,
+            )
+
+        return [
+            TransactionAggregate(
+                user_id=key[0],
+                transaction_type=key[1],
+                category=key[2],
+                period_start=key[3],
+                total=Money(sum(amounts)),
+                count=len(amounts),
+                min_amount=Money(min(amounts)),
+                max_amount=Money(max(amounts)),
+            )
+            for key, amounts in sorted(groups.items(), key=lambda item: sort_key(item[0]))
+        ]
@@ -0,0 +1,106 @@
+from dataclasses import replace
+from typing import List, Optional
+from src.domain.entities.money import Money
+from src.domain.entities.user import User
+from src.domain.entities.transaction import Transaction
+from src.domain.interfaces.user_repo import IUserRepository
+from src.infrastructure.memory.store import InMemoryStore
+
+class InMemoryUserRepository(IUserRepository):
+    """
+    Implementation of IUserRepository on plain dicts, for benchmarks and local runs.
+    Entities are copied in and out, like rows of a real database.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def get_by_id(self, user_id: int, with_lock: bool = True) -> Optional[User]:
+        user = self.store.users.get(user_id)
+        return replace(user) if user else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user_id = self.store.user_ids_by_email.get(email)
+        return await self.get_by_id(user_id) if user_id is not None else None
+
+    async def create(self, user: User) -> User:
+        if user.email in self.store.user_ids_by_email:
+            raise ValueError(f"Email {user.email} is already registered")
+
+        user.user_id = self.store.next_user_id
+        self.store.next_user_id += 1
+
+        self.store.users[user.user_id] = replace(user)
+        self.store.user_ids_by_email[user.email] = user.user_id
+
+        return user
+
+    async def update(self, user: User) -> User:
+        existing = self.store.users.get(user.user_id)
+        if existing is None:
+            raise ValueError("User not found")
+
+        if existing.email != user.email:
+            del self.store.user_ids_by_email[existing.email]
+            self.store.user_ids_by_email[user.email] = user.user_id
+
+        existing.email = user.email
+        existing.username = user.username
+        existing.number = user.number
+
+        return replace(existing)
+
+    async def replace_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        user = self.store.users.get(user_id)
+        if user is None or user.hashed_password != old_hash:
+            return False
+
+        user.hashed_password = new_hash
+
+        return True
+
+    async def apply_transaction(
+        self,
+        transaction: Transaction,
+        delta: Money,
+        min_balance: Optional[Money] = None,
+    ) -> Optional[User]:
+        user = self.store.users.get(transaction.user_id)
+        if user is None:
+            return None
+
+        if min_balance is not None and user.balance + delta < min_balance:
+            return None
+
+        user.balance += delta
+        self.store.add_transaction(transaction)
+
+        return replace(user)
+
+    async def apply_transactions(
+        self,
+        user_id: int,
+        transactions: List[Transaction],
+        deltas: List[Money],
+    ) -> Optional[List[User]]:
+        user = self.store.users.get(user_id)
+        if user is None:
+            return None
+
+        snapshots = []
+        for transaction, delta in zip(transactions, deltas):
+            user.balance += delta
+            self.store.add_transaction(transaction)
+            snapshots.append(replace(user))
+
+        return snapshots
+
+    async def delete(self, user_id: int) -> None:
+        user = self.store.users.pop(user_id, None)
+        if user is None:
+            return
+
+        del self.store.user_ids_by_email[user.email]
+
+        for _, transaction_id in self.store.transactions_by_user.pop(user_id, []):
+            del self.store.transactions[transaction_id]
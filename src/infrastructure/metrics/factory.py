@@ -0,0 +1,24 @@
+from typing import Optional, Tuple
+from src.domain.interfaces.metrics import IMetricsSink
+from src.infrastructure.config import MetricsConfig, metrics_config
+from src.infrastructure.metrics.sinks import FanoutSink, HistogramSink, LoguruSink
+
+
+def create_metrics_sink(
+    config: MetricsConfig = metrics_config,
+) -> Tuple[IMetricsSink, Optional[HistogramSink]]:
+    """
+    Build the sink selected by METRICS_SINKS.
+    Also returns the histogram sink (if any) so /metrics can render it.
+    """
+    histogram = HistogramSink() if "histogram" in config.sinks else None
+
+    sinks: list[IMetricsSink] = []
+    if histogram is not None:
+        sinks.append(histogram)
+    if "loguru" in config.sinks:
+        sinks.append(LoguruSink())
+
+    if len(sinks) == 1:
+        return sinks[0], histogram
+    return FanoutSink(sinks), histogram
@@ -0,0 +1,102 @@
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Type, TypeVar
+from loguru import logger
+from sqlalchemy import Engine, event
+from src.application.instrumentation import get_metrics_sink
+
+QUERY_DURATION = "db_query_duration_seconds"
+
+T = TypeVar("T")
+
+# Repository method currently issuing SQL, e.g. "TransactionRepository.create".
+current_operation: ContextVar[str] = ContextVar("current_operation", default="unlabeled")
+
+
+def _label_coroutine(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = current_operation.set(name)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+
+    return wrapper
+
+
+def _label_async_generator(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # The label is set only while the generator runs, never across a yield.
+        generator = func(*args, **kwargs)
+        try:
+            while True:
+                token = current_operation.set(name)
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    current_operation.reset(token)
+                yield item
+        finally:
+            await generator.aclose()
+
+    return wrapper
+
+
+def instrument_repository(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator: every public async method labels the SQL it runs
+    with "<Class>.<method>" for db_query_duration_seconds and slow query logs.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith("_"):
+            continue
+
+        name = f"{cls.__name__}.{attribute}"
+        if inspect.isasyncgenfunction(value):
+            setattr(cls, attribute, _label_async_generator(name, value))
+        elif inspect.iscoroutinefunction(value):
+            setattr(cls, attribute, _label_coroutine(name, value))
+
+    return cls
+
+
+def instrument_engine(
+    engine: Engine,
+    slow_query_seconds: Optional[float] = None,
+) -> None:
+    """
+    Time every statement on the engine into the installed metrics sink;
+    log those slower than slow_query_seconds.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation = current_operation.get()
+
+        get_metrics_sink().observe(QUERY_DURATION, elapsed, {"operation": operation})
+
+        if slow_query_seconds is not None and elapsed >= slow_query_seconds:
+            logger.bind(operation=operation, duration=elapsed).warning(
+                "Slow query in {} took {:.1f} ms: {}",
+                operation,
+                elapsed * 1000,
+                " ".join(statement.split())[:500],
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # A failed statement never reaches after_cursor_execute.
+        started = context.connection.info.get("query_started") if context.connection else None
+        if started:
+            started.pop()
@@ -0,0 +1,111 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+from loguru import logger
+from src.domain.interfaces.metrics import IMetricsSink
+
+# Seconds; covers sub-millisecond cache hits up to multi-second imports.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram, the Prometheus way."""
+    buckets: Sequence[float]
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile (inf past the last bucket)."""
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+class HistogramSink(IMetricsSink):
+    """
+    In-memory histograms per metric name and label set.
+    render_prometheus() produces the text exposition format for /metrics.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.histograms: Dict[str, Dict[LabelSet, Histogram]] = {}
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.buckets)
+
+        histogram.observe(value)
+
+    def get(self, name: str, **labels: str) -> Histogram:
+        return self.histograms[name][tuple(sorted(labels.items()))]
+
+    def render_prometheus(self) -> str:
+        lines = []
+
+        for name, series in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+
+            for key, histogram in sorted(series.items()):
+                labels = ",".join(f'{label}="{_escape(value)}"' for label, value in key)
+                prefix = f"{labels}," if labels else ""
+
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {histogram.total}")
+                lines.append(f"{name}_count{suffix} {histogram.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LoguruSink(IMetricsSink):
+    """Every measurement as a structured loguru record (metric, value, labels in extra)."""
+
+    def __init__(self, level: str = "DEBUG"):
+        self.level = level
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        logger.bind(metric=name, value=value, **labels).log(
+            self.level, "{} {:.6f}s {}", name, value, dict(labels)
+        )
+
+class FanoutSink(IMetricsSink):
+    """Forward each measurement to several sinks."""
+
+    def __init__(self, sinks: Sequence[IMetricsSink]):
+        self.sinks = list(sinks)
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        for sink in self.sinks:
+            sink.observe(name, value, labels)
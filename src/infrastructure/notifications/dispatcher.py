@@ -0,0 +1,344 @@
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+from src.domain.entities.notification import DeadLetter, Notification, NotificationPriority
+from src.domain.interfaces.dead_letter_repo import IDeadLetterRepository
+from src.domain.interfaces.notification_dispatcher import INotificationDispatcher
+from src.infrastructure.config import TelegramConfig, telegram_config
+from src.infrastructure.notifications.telegram import TelegramBotClient, TelegramError
+
+# Idle chats whose bucket has refilled are forgotten this often.
+PRUNE_INTERVAL_SECONDS = 30.0
+# Merged alerts are separated by a blank line.
+MERGE_SEPARATOR = "\n\n"
+
+
+class TokenBucket:
+    """rate tokens per second up to capacity; one token per message."""
+
+    def __init__(self, rate: float, capacity: int, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available, 0 if one is available now."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def pause(self, seconds: float, now: float) -> None:
+        """No token for the next `seconds`, as flood control asked."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass
+class _Outgoing:
+    chat_id: int
+    priority: NotificationPriority
+    seq: int
+    texts: List[str]
+    length: int
+    queued_at: float
+    attempts: int = 0
+
+    @property
+    def text(self) -> str:
+        return MERGE_SEPARATOR.join(self.texts)
+
+
+@dataclass
+class _Chat:
+    chat_id: int
+    bucket: TokenBucket
+    queue: List[Tuple[int, int, _Outgoing]] = field(default_factory=list)
+    # Queued, not yet sent mergeable message per priority; new alerts join it.
+    merge_targets: Dict[NotificationPriority, _Outgoing] = field(default_factory=dict)
+    # In the ready or delayed heap of the dispatcher.
+    scheduled: bool = False
+    # Key of the chat's live entry in the ready heap; older entries are stale.
+    ready_key: Optional[Tuple[int, int]] = None
+    # One message per chat at a time keeps the chat's messages in order.
+    sending: bool = False
+
+
+@dataclass
+class DispatcherStats:
+    """Counters of a NotificationDispatcher."""
+    submitted: int = 0
+    merged: int = 0
+    sent: int = 0
+    retried: int = 0
+    rate_limited: int = 0
+    dead_lettered: int = 0
+    dropped: int = 0
+
+
+class NotificationDispatcher(INotificationDispatcher):
+    """
+    Sends queued notifications through the Bot API within its rate limits.
+
+    Every chat has its own priority queue and token bucket; a global token
+    bucket caps the total rate. Chats that may send now sit in a heap ordered
+    by the priority of their next message, throttled chats in a heap ordered
+    by when their bucket refills, so a busy chat never holds up the others.
+    Mergeable notifications (alerts) still waiting for their turn are appended
+    to the chat's pending message instead of becoming another one.
+
+    Failed sends are retried with exponential backoff; 429 responses pause
+    the chat for retry_after. Permanent errors (chat not found, bot blocked)
+    and messages out of attempts go to the dead letter repository.
+    """
+
+    def __init__(
+        self,
+        client: TelegramBotClient,
+        dead_letters: IDeadLetterRepository,
+        config: TelegramConfig = telegram_config,
+    ):
+        self.client = client
+        self.dead_letters = dead_letters
+        self.config = config
+        self.stats = DispatcherStats()
+        self._chats: Dict[int, _Chat] = {}
+        self._ready: List[Tuple[int, int, int]] = []
+        self._delayed: List[Tuple[float, int, int]] = []
+        self._retries: List[Tuple[float, int, _Outgoing]] = []
+        self._seq = itertools.count()
+        self._global = TokenBucket(config.global_rate, config.global_burst, time.monotonic())
+        self._in_flight: Set[asyncio.Task] = set()
+        self._outstanding = 0
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._next_prune = time.monotonic() + PRUNE_INTERVAL_SECONDS
+
+    def submit(self, notification: Notification) -> bool:
+        if self._outstanding >= self.config.max_pending:
+            self.stats.dropped += 1
+            if self.stats.dropped == 1 or self.stats.dropped % 1000 == 0:
+                logger.warning(f"Notification queue is full, {self.stats.dropped} messages dropped so far")
+            return False
+
+        now = time.monotonic()
+        chat = self._chat(notification.chat_id, now)
+        self.stats.submitted += 1
+
+        if notification.mergeable:
+            target = chat.merge_targets.get(notification.priority)
+            added = len(MERGE_SEPARATOR) + len(notification.text)
+            if target is not None and target.length + added <= self.config.max_message_length:
+                target.texts.append(notification.text)
+                target.length += added
+                self.stats.merged += 1
+                return True
+
+        outgoing = _Outgoing(
+            chat_id=notification.chat_id,
+            priority=notification.priority,
+            seq=next(self._seq),
+            texts=[notification.text],
+            length=len(notification.text),
+            queued_at=now,
+        )
+        if notification.mergeable:
+            chat.merge_targets[notification.priority] = outgoing
+
+        self._outstanding += 1
+        self._idle.clear()
+        self._enqueue(chat, outgoing, now)
+        return True
+
+    async def run(self) -> None:
+        """Background loop started from the application lifespan."""
+        while True:
+            now = time.monotonic()
+            self._promote(now)
+
+            timeout = self._next_due(now)
+            if self._ready and len(self._in_flight) < self.config.max_in_flight:
+                wait = self._global.delay(now)
+                if wait <= 0:
+                    self._dispatch_next(now)
+                    continue
+                timeout = wait if timeout is None else min(timeout, wait)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self) -> None:
+        """Wait until every submitted message was sent or dead-lettered."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Wait for in-flight sends, then close the HTTP client; stop run() first."""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        await self.client.close()
+
+    def _chat(self, chat_id: int, now: float) -> _Chat:
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            chat = self._chats[chat_id] = _Chat(
+                chat_id=chat_id,
+                bucket=TokenBucket(self.config.chat_rate, self.config.chat_burst, now),
+            )
+        return chat
+
+    def _enqueue(self, chat: _Chat, outgoing: _Outgoing, now: float) -> None:
+        heapq.heappush(chat.queue, (outgoing.priority, outgoing.seq, outgoing))
+        self._schedule(chat, now)
+        self._wakeup.set()
+
+    def _schedule(self, chat: _Chat, now: float) -> None:
+        """Put the chat into the ready or delayed heap if it has something to send."""
+        if chat.sending or not chat.queue:
+            return
+
+        priority, seq, _ = chat.queue[0]
+        key = (priority, seq)
+
+        if chat.scheduled:
+            # A more urgent message arrived for a chat that is already ready.
+            if chat.ready_key is not None and key < chat.ready_key:
+                chat.ready_key = key
+                heapq.heappush(self._ready, (priority, seq, chat.chat_id))
+            return
+
+        chat.scheduled = True
+        delay = chat.bucket.delay(now)
+        if delay > 0:
+            chat.ready_key = None
+            heapq.heappush(self._delayed, (now + delay, next(self._seq), chat.chat_id))
+        else:
+            chat.ready_key = key
+            heapq.heappush(self._ready, (priority, seq, chat.chat_id))
+
+    def _promote(self, now: float) -> None:
+        while self._retries and self._retries[0][0] <= now:
+            _, _, outgoing = heapq.heappop(self._retries)
+            self._enqueue(self._chat(outgoing.chat_id, now), outgoing, now)
+
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, chat_id = heapq.heappop(self._delayed)
+            chat = self._chats[chat_id]
+            chat.scheduled = False
+            self._schedule(chat, now)
+
+        if now >= self._next_prune:
+            self._prune(now)
+
+    def _next_due(self, now: float) -> Optional[float]:
+        due = [heap[0][0] for heap in (self._delayed, self._retries) if heap]
+        return max(0.0, min(due) - now) if due else None
+
+    def _dispatch_next(self, now: float) -> None:
+        priority, seq, chat_id = heapq.heappop(self._ready)
+        chat = self._chats.get(chat_id)
+        if chat is None or chat.ready_key != (priority, seq):
+            return
+
+        chat.scheduled = False
+        chat.ready_key = None
+        if chat.bucket.delay(now) > 0:  # paused by a 429 since it was scheduled
+            self._schedule(chat, now)
+            return
+
+        _, _, outgoing = heapq.heappop(chat.queue)
+        if chat.merge_targets.get(outgoing.priority) is outgoing:
+            del chat.merge_targets[outgoing.priority]
+
+        chat.bucket.take(now)
+        self._global.take(now)
+        chat.sending = True
+
+        task = asyncio.create_task(self._send(chat, outgoing))
+        self._in_flight.add(task)
+        task.add_done_callback(self._sent)
+
+    def _sent(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._wakeup.set()
+
+    async def _send(self, chat: _Chat, outgoing: _Outgoing) -> None:
+        error: Optional[TelegramError] = None
+        try:
+            await self.client.send_message(chat.chat_id, outgoing.text)
+        except TelegramError as e:
+            error = e
+        finally:
+            chat.sending = False
+
+        now = time.monotonic()
+        if error is None:
+            self.stats.sent += 1
+            self._done()
+        else:
+            outgoing.attempts += 1
+            if error.permanent or outgoing.attempts >= self.config.max_attempts:
+                await self._dead_letter(outgoing, error)
+            elif error.retry_after is not None:
+                self.stats.rate_limited += 1
+                chat.bucket.pause(error.retry_after, now)
+                heapq.heappush(chat.queue, (outgoing.priority, outgoing.seq, outgoing))
+            else:
+                self.stats.retried += 1
+                backoff = min(
+                    self.config.backoff_max_seconds,
+                    self.config.backoff_base_seconds * 2 ** (outgoing.attempts - 1),
+                )
+                heapq.heappush(self._retries, (now + backoff, outgoing.seq, outgoing))
+
+        self._schedule(chat, now)
+
+    async def _dead_letter(self, outgoing: _Outgoing, error: TelegramError) -> None:
+        self.stats.dead_lettered += 1
+        try:
+            await self.dead_letters.add(
+                DeadLetter(
+                    chat_id=outgoing.chat_id,
+                    text=outgoing.text,
+                    priority=outgoing.priority,
+                    attempts=outgoing.attempts,
+                    error=str(error),
+                )
+            )
+        except Exception as e:
+            logger.error(f"Could not store dead letter for chat {outgoing.chat_id}: {e}")
+        finally:
+            self._done()
+
+    def _done(self) -> None:
+        self._outstanding -= 1
+        if self._outstanding == 0:
+            self._idle.set()
+
+    def _prune(self, now: float) -> None:
+        self._next_prune = now + PRUNE_INTERVAL_SECONDS
+        idle = [
+            chat_id
+            for chat_id, chat in self._chats.items()
+            if not chat.queue and not chat.sending and not chat.scheduled and chat.bucket.is_full(now)
+        ]
+        for chat_id in idle:
+            del self._chats[chat_id]
\ No newline at end of file
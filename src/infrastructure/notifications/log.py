@@ -0,0 +1,15 @@
+from typing import Sequence
+from loguru import logger
+from src.domain.entities.budget import BudgetAlert
+from src.domain.interfaces.alert_notifier import IAlertNotifier
+
+class LogAlertNotifier(IAlertNotifier):
+    """Writes alerts to the application log; used until a delivery channel is configured."""
+
+    async def notify(self, alerts: Sequence[BudgetAlert]) -> None:
+        for alert in alerts:
+            scope = alert.category.value if alert.category else "all expenses"
+            logger.info(
+                f"Budget {alert.budget_id} of user {alert.user_id} ({scope}, {alert.period.value}): "
+                f"{alert.threshold}% reached, spent {alert.spent} of {alert.limit}"
+            )
\ No newline at end of file
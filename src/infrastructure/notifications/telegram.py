@@ -0,0 +1,119 @@
+from typing import Any, Dict, Optional, Protocol, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.entities.budget import BudgetAlert
+from src.domain.entities.notification import Notification, NotificationPriority
+from src.domain.interfaces.alert_notifier import IAlertNotifier
+from src.domain.interfaces.notification_dispatcher import INotificationDispatcher
+from src.infrastructure.config import TelegramConfig, telegram_config
+from infrastructure.database.repository.notifications import TelegramLinkRepository
+
+class HttpResponse(Protocol):
+    status_code: int
+
+    def json(self) -> Any: ...
+
+class HttpClient(Protocol):
+    """The subset of httpx.AsyncClient used by the bot client; fakes only need these."""
+
+    async def post(self, url: str, json: Dict[str, Any]) -> HttpResponse: ...
+
+    async def aclose(self) -> None: ...
+
+
+class TelegramError(Exception):
+    """
+    A failed Bot API call. retry_after is set on 429 (flood control);
+    status is None when no response came back at all.
+    """
+
+    def __init__(self, description: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(description)
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def permanent(self) -> bool:
+        """Chat not found, bot blocked, bad request: retrying does not help."""
+        return self.status is not None and 400 <= self.status < 500 and self.status != 429
+
+
+class TelegramBotClient:
+    """Minimal Bot API client: sendMessage only."""
+
+    def __init__(self, http: HttpClient, token: str, api_url: str = "https://api.telegram.org"):
+        self.http = http
+        self.url = f"{api_url.rstrip('/')}/bot{token}/sendMessage"
+
+    @classmethod
+    def from_config(cls, config: TelegramConfig = telegram_config) -> "TelegramBotClient":
+        """Build a client on top of httpx (imported only when used)."""
+        import httpx
+
+        if config.bot_token is None:
+            raise ValueError("TELEGRAM_BOT_TOKEN is not set")
+
+        http = httpx.AsyncClient(
+            timeout=config.request_timeout_seconds,
+            limits=httpx.Limits(max_connections=config.max_in_flight, max_keepalive_connections=config.max_in_flight),
+        )
+        return cls(http, config.bot_token.get_secret_value(), config.api_url)
+
+    async def send_message(self, chat_id: int, text: str) -> None:
+        try:
+            response = await self.http.post(self.url, json={"chat_id": chat_id, "text": text})
+        except Exception as e:
+            raise TelegramError(f"{type(e).__name__}: {e}") from e
+
+        if response.status_code == 200:
+            return
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        raise TelegramError(
+            body.get("description") or f"HTTP {response.status_code}",
+            status=response.status_code,
+            retry_after=(body.get("parameters") or {}).get("retry_after"),
+        )
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+
+def format_alert(alert: BudgetAlert) -> str:
+    scope = alert.category.value if alert.category else "all expenses"
+    return (
+        f"Budget for {scope} this {alert.period.value}: {alert.threshold}% reached "
+        f"({alert.spent} of {alert.limit})"
+    )
+
+
+class TelegramAlertNotifier(IAlertNotifier):
+    """
+    Queues budget alerts for the users' linked chats. Alerts are mergeable,
+    so several alerts pending for one chat go out as one message.
+    Users without a linked chat are skipped.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], dispatcher: INotificationDispatcher):
+        self.session_factory = session_factory
+        self.dispatcher = dispatcher
+
+    async def notify(self, alerts: Sequence[BudgetAlert]) -> None:
+        async with self.session_factory() as session:
+            chat_ids = await TelegramLinkRepository(session).get_chat_ids(
+                sorted({alert.user_id for alert in alerts})
+            )
+
+        for alert in alerts:
+            chat_id = chat_ids.get(alert.user_id)
+            if chat_id is not None:
+                self.dispatcher.submit(
+                    Notification(
+                        chat_id=chat_id,
+                        text=format_alert(alert),
+                        priority=NotificationPriority.ALERT,
+                        mergeable=True,
+                    )
+                )
\ No newline at end of file
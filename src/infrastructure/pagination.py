@@ -0,0 +1,20 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(date_created: datetime, transaction_id: int) -> str:
+    """Pack the keyset position of the last row into an opaque string."""
+    raw = f"{date_created.isoformat()}|{transaction_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Reverse of encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_created, transaction_id = raw.split("|")
+        return datetime.fromisoformat(date_created), int(transaction_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
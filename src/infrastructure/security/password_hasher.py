@@ -0,0 +1,141 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from src.domain.interfaces.password_hasher import IPasswordHasher
+from src.infrastructure.config import PasswordHasherConfig, password_hasher_config
+
+# bcrypt only looks at this many bytes of a password; bcrypt >= 5 raises on longer ones.
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Module-level functions so they can be pickled into a ProcessPoolExecutor.
+# bcrypt / argon2-cffi are imported inside them: only the configured scheme is needed.
+
+def _bcrypt_hash(password: str, rounds: int) -> str:
+    import bcrypt
+
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+def _bcrypt_verify(password: str, hashed_password: str) -> bool:
+    import bcrypt
+
+    try:
+        return bcrypt.checkpw(password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
+
+
+def _argon2_hash(password: str, time_cost: int, memory_cost: int, parallelism: int) -> str:
+    from argon2 import PasswordHasher
+
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    return hasher.hash(password)
+
+
+def _argon2_verify(password: str, hashed_password: str) -> bool:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    try:
+        return PasswordHasher().verify(hashed_password, password)
+    except (InvalidHashError, VerificationError):
+        return False
+
+
+@dataclass
+class HasherMetrics:
+    """Live counters of the hashing pool."""
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    completed: int = 0
+
+class PasswordHasher(IPasswordHasher):
+    """
+    bcrypt / argon2 hasher that never runs on the event loop.
+
+    Work goes to a thread or process pool; at most max_concurrency jobs
+    are handed to the pool at once, the rest wait on a semaphore and are
+    reported as queued. verify() accepts hashes of both schemes, so
+    switching the scheme only affects new hashes (and rehash on login).
+    """
+
+    def __init__(
+        self,
+        config: PasswordHasherConfig = password_hasher_config,
+        executor: Optional[Executor] = None,
+    ):
+        self.config = config
+        self.metrics = HasherMetrics()
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+
+        if executor is not None:
+            self._executor = executor
+        elif config.executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=config.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=config.max_workers, thread_name_prefix="password-hasher"
+            )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        self.metrics.queued += 1
+        self.metrics.max_queued = max(self.metrics.max_queued, self.metrics.queued)
+
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.metrics.queued -= 1
+
+        self.metrics.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.completed += 1
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        """Raises ValueError for passwords the configured scheme cannot take."""
+        if self.config.scheme == "argon2":
+            return await self._run(
+                _argon2_hash,
+                password,
+                self.config.argon2_time_cost,
+                self.config.argon2_memory_cost,
+                self.config.argon2_parallelism,
+            )
+        if len(password.encode()) > BCRYPT_MAX_PASSWORD_BYTES:
+            raise ValueError(f"Password must not be longer than {BCRYPT_MAX_PASSWORD_BYTES} bytes")
+        return await self._run(_bcrypt_hash, password, self.config.bcrypt_rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        if hashed_password.startswith("$argon2"):
+            return await self._run(_argon2_verify, password, hashed_password)
+        return await self._run(_bcrypt_verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Parses cost parameters out of the hash string, no hashing involved."""
+        if self.config.scheme == "argon2":
+            if not hashed_password.startswith("$argon2"):
+                return True
+
+            from argon2 import PasswordHasher as Argon2Hasher
+
+            return Argon2Hasher(
+                time_cost=self.config.argon2_time_cost,
+                memory_cost=self.config.argon2_memory_cost,
+                parallelism=self.config.argon2_parallelism,
+            ).check_needs_rehash(hashed_password)
+
+        # bcrypt: $2b$<rounds>$<salt+hash>
+        parts = hashed_password.split("$")
+        if len(parts) != 4 or not parts[1].startswith("2") or not parts[2].isdigit():
+            return True
+        return int(parts[2]) < self.config.bcrypt_rounds
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; call on application shutdown."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
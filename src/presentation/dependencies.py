@@ -0,0 +1,67 @@
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.use_cases.authenticate_user import AuthenticateUserUseCase
+from src.application.use_cases.create_user import CreateUserUseCase
+from src.application.use_cases.deposit import DepositUseCase
+from src.application.use_cases.get_statistics import GetStatisticsUseCase
+from src.application.use_cases.withdraw import WithdrawUseCase
+from src.infrastructure.database import DatabaseProvider
+from src.infrastructure.database.commit_hooks import SessionCommitHooks
+
+# Use cases of one request, built from what the lifespan started (app.state)
+# and repositories of the request session. FastAPI resolves get_session once
+# per request, so every repository of a use case shares it.
+
+
+def get_deposit_use_case(
+    request: Request,
+    session: AsyncSession = Depends(DatabaseProvider.get_session),
+) -> DepositUseCase:
+    state = request.app.state
+    return DepositUseCase(
+        state.repositories.users(session),
+        state.repositories.transactions(session),
+        idempotency_repo=state.repositories.idempotency(session),
+        coalescer=state.deposit_coalescer,
+        statistics=state.statistics,
+        commit_hooks=SessionCommitHooks.of(session),
+    )
+
+
+def get_withdraw_use_case(
+    request: Request,
+    session: AsyncSession = Depends(DatabaseProvider.get_session),
+) -> WithdrawUseCase:
+    state = request.app.state
+    return WithdrawUseCase(
+        state.repositories.users(session),
+        state.repositories.transactions(session),
+        idempotency_repo=state.repositories.idempotency(session),
+        events=state.expense_events,
+        statistics=state.statistics,
+        commit_hooks=SessionCommitHooks.of(session),
+    )
+
+
+def get_statistics_use_case(
+    request: Request,
+    session: AsyncSession = Depends(DatabaseProvider.get_session),
+) -> GetStatisticsUseCase:
+    state = request.app.state
+    return GetStatisticsUseCase(state.repositories.transactions(session), statistics=state.statistics)
+
+
+def get_create_user_use_case(
+    request: Request,
+    session: AsyncSession = Depends(DatabaseProvider.get_session),
+) -> CreateUserUseCase:
+    state = request.app.state
+    return CreateUserUseCase(state.repositories.users(session), state.password_hasher)
+
+
+def get_authenticate_user_use_case(
+    request: Request,
+    session: AsyncSession = Depends(DatabaseProvider.get_session),
+) -> AuthenticateUserUseCase:
+    state = request.app.state
+    return AuthenticateUserUseCase(state.repositories.users(session), state.password_hasher)
\ No newline at end of file
@@ -0,0 +1,43 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.application.instrumentation import get_metrics_sink
+
+REQUEST_DURATION = "http_request_duration_seconds"
+
+class RequestTimingMiddleware:
+    """
+    Pure ASGI middleware recording http_request_duration_seconds
+    labeled with method, route template and status code.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Route templates keep label cardinality bounded; raw paths would not.
+            route = scope.get("route")
+            get_metrics_sink().observe(
+                REQUEST_DURATION,
+                time.perf_counter() - started,
+                {
+                    "method": scope["method"],
+                    "route": getattr(route, "path", "unmatched"),
+                    "status": str(status_code),
+                },
+            )
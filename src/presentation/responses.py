@@ -0,0 +1,85 @@
+from json.encoder import encode_basestring
+from typing import AsyncIterable, AsyncIterator, Iterable, Mapping, Optional
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.interfaces.transaction_repo import TransactionPage
+from src.infrastructure.iterables import chunked
+
+# JSON of every enum value, encoded once instead of once per row.
+TRANSACTION_TYPES = {transaction_type: encode_basestring(transaction_type.value) for transaction_type in TransactionType}
+CATEGORIES = {category: encode_basestring(category.value) for category in TransactionCategory}
+
+
+def encode_transaction(transaction: Transaction) -> str:
+    """
+    One transaction as a JSON object, written straight from the entity.
+    Amounts are decimal strings in major units ("12.34"), as in the export.
+    """
+    transaction_id = transaction.transaction_id
+    description = transaction.description
+    return (
+        f'{{"transaction_id":{"null" if transaction_id is None else transaction_id},'
+        f'"user_id":{transaction.user_id},'
+        f'"transaction_type":{TRANSACTION_TYPES[transaction.transaction_type]},'
+        f'"amount":"{transaction.amount!s}",'
+        f'"category":{CATEGORIES[transaction.category]},'
+        f'"description":{"null" if description is None else encode_basestring(description)},'
+        f'"date_created":"{transaction.date_created.isoformat()}"}}'
+    )
+
+
+def encode_transactions(transactions: Iterable[Transaction]) -> bytes:
+    """A JSON array of transactions; a TransactionBatch works as well as a list."""
+    return f"[{','.join(map(encode_transaction, transactions))}]".encode()
+
+
+def encode_transaction_page(page: TransactionPage) -> bytes:
+    next_cursor = "null" if page.next_cursor is None else encode_basestring(page.next_cursor)
+    return (
+        f'{{"items":[{",".join(map(encode_transaction, page.items))}],"next_cursor":{next_cursor}}}'
+    ).encode()
+
+
+class TransactionPageResponse(Response):
+    """
+    A TransactionPage as JSON, without FastAPI's jsonable_encoder or a
+    pydantic model: repository data is trusted and needs no validation.
+    Return an instance from the endpoint, otherwise FastAPI runs the page
+    through jsonable_encoder before render() sees it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: TransactionPage) -> bytes:
+        return encode_transaction_page(content)
+
+
+class TransactionStreamResponse(StreamingResponse):
+    """
+    A JSON array of transactions from an async iterable, sent in chunks of
+    rows_per_chunk rows, so memory use does not depend on how many there are.
+    """
+
+    def __init__(
+        self,
+        transactions: AsyncIterable[Transaction],
+        rows_per_chunk: int = 500,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        super().__init__(
+            self._chunks(transactions, rows_per_chunk),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+            background=background,
+        )
+
+    async def _chunks(self, transactions: AsyncIterable[Transaction], rows_per_chunk: int) -> AsyncIterator[bytes]:
+        separator = "["
+        async for rows in chunked(transactions, rows_per_chunk):
+            yield f"{separator}{','.join(map(encode_transaction, rows))}".encode()
+            separator = ","
+        yield b"[]" if separator == "[" else b"]"
\ No newline at end of file
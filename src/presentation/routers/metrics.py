@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from src.infrastructure.database import DatabaseProvider
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request) -> str:
+    """Prometheus text exposition of connection pool gauges and timing histograms."""
+    pool = DatabaseProvider.pool_metrics()
+
+    samples = [
+        ("db_pool_size", "gauge", "Configured number of pooled connections", pool.size),
+        ("db_pool_checked_out", "gauge", "Connections currently in use", pool.checked_out),
+        ("db_pool_checked_in", "gauge", "Idle connections in the pool", pool.checked_in),
+        ("db_pool_overflow", "gauge", "Connections open above pool_size", pool.overflow),
+        ("db_pool_max_overflow", "gauge", "Configured max_overflow", pool.max_overflow),
+        ("db_pool_checkouts_total", "counter", "Connection checkouts", pool.checkouts),
+        ("db_pool_wait_seconds_total", "counter", "Time spent waiting for a connection", pool.wait_seconds_total),
+        ("db_pool_wait_seconds_max", "gauge", "Longest wait for a connection", pool.wait_seconds_max),
+        ("db_pool_timeouts_total", "counter", "Checkouts that hit pool_timeout", pool.timeouts),
+    ]
+
+    hasher = getattr(request.app.state, "password_hasher", None)
+    if hasher is not None:
+        samples += [
+            ("password_hasher_in_flight", "gauge", "Hash jobs running in the worker pool", hasher.metrics.in_flight),
+            ("password_hasher_queued", "gauge", "Hash jobs waiting for the pool", hasher.metrics.queued),
+            ("password_hasher_queued_max", "gauge", "Most hash jobs ever waiting at once", hasher.metrics.max_queued),
+            ("password_hasher_completed_total", "counter", "Finished hash jobs", hasher.metrics.completed),
+        ]
+
+    repositories = getattr(request.app.state, "repositories", None)
+    if repositories is not None:
+        stats = repositories.user_cache_stats
+        samples += [
+            ("user_cache_hits_total", "counter", "Unlocked user reads served from cache", stats.hits),
+            ("user_cache_misses_total", "counter", "Unlocked user reads that went to the database", stats.misses),
+            ("user_cache_invalidations_total", "counter", "User writes that invalidated the cache", stats.invalidations),
+        ]
+
+    statistics = getattr(request.app.state, "statistics", None)
+    if statistics is not None:
+        stats = statistics.stats
+        samples += [
+            ("statistics_cache_hits_total", "counter", "Statistics snapshots served from cache", stats.hits),
+            ("statistics_cache_misses_total", "counter", "Statistics snapshots computed", stats.misses),
+            ("statistics_cache_coalesced_total", "counter", "Misses that waited for another caller's compute", stats.coalesced),
+            ("statistics_cache_invalidations_total", "counter", "Writes that invalidated snapshots", stats.invalidations),
+        ]
+
+    lines = []
+    for name, kind, help_text, value in samples:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+
+    text = "\n".join(lines) + "\n"
+
+    histogram = getattr(request.app.state, "metrics_histogram", None)
+    if histogram is not None:
+        text += histogram.render_prometheus()
+
+    return text
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.authenticate_user import AuthenticateUserRequest, AuthenticateUserUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.user import User
+from src.domain.interfaces.password_hasher import IPasswordHasher
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.users import InMemoryUserRepository
+
+
+class PrefixHasher(IPasswordHasher):
+    """"new:<password>" is current, "old:<password>" needs a rehash."""
+
+    def __init__(self, during_hash=None):
+        self.during_hash = during_hash
+
+    async def hash(self, password: str) -> str:
+        if self.during_hash:
+            self.during_hash()
+        return f"new:{password}"
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return hashed_password.split(":", 1)[1] == password
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return hashed_password.startswith("old:")
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+def create_user(store: InMemoryStore, hashed_password: str) -> User:
+    user = User(email="ann@example.com", username="ann", hashed_password=hashed_password, balance=Money(100_00))
+    return asyncio.run(InMemoryUserRepository(store).create(user))
+
+
+def login(store: InMemoryStore, hasher: IPasswordHasher, password: str = "secret"):
+    use_case = AuthenticateUserUseCase(InMemoryUserRepository(store), hasher)
+    return asyncio.run(use_case.execute(AuthenticateUserRequest(email="ann@example.com", password=password)))
+
+
+def test_outdated_hash_is_replaced(store: InMemoryStore):
+    user = create_user(store, "old:secret")
+
+    login(store, PrefixHasher())
+
+    assert store.users[user.user_id].hashed_password == "new:secret"
+
+
+def test_rehash_keeps_a_concurrent_balance_change(store: InMemoryStore):
+    user = create_user(store, "old:secret")
+
+    def deposit():
+        store.users[user.user_id].balance += Money(50_00)
+
+    login(store, PrefixHasher(during_hash=deposit))
+
+    assert store.users[user.user_id].balance == Money(150_00)
+    assert store.users[user.user_id].hashed_password == "new:secret"
+
+
+def test_rehash_does_not_overwrite_a_concurrent_rehash(store: InMemoryStore):
+    user = create_user(store, "old:secret")
+
+    def other_login():
+        store.users[user.user_id].hashed_password = "new:other"
+
+    login(store, PrefixHasher(during_hash=other_login))
+
+    assert store.users[user.user_id].hashed_password == "new:other"
+
+
+def test_wrong_password_is_rejected(store: InMemoryStore):
+    create_user(store, "old:secret")
+
+    with pytest.raises(ValueError, match="Invalid email or password"):
+        login(store, PrefixHasher(), password="guess")
+
+class LimitedHasher(PrefixHasher):
+    """Like a bcrypt scheme that cannot hash passwords over 8 characters."""
+
+    async def hash(self, password: str) -> str:
+        if len(password) > 8:
+            raise ValueError("Password must not be longer than 8 bytes")
+        return await super().hash(password)
+
+
+def test_login_works_when_the_new_scheme_cannot_rehash(store: InMemoryStore):
+    user = create_user(store, "old:a very long secret")
+
+    login(store, LimitedHasher(), password="a very long secret")
+
+    assert store.users[user.user_id].hashed_password == "old:a very long secret"
\ No newline at end of file
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.deposit import DepositRequest, DepositUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.user import User
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.memory.users import InMemoryUserRepository
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+def create_user(store: InMemoryStore) -> User:
+    user = User(email="ann@example.com", username="ann", hashed_password="x", balance=Money(100_00))
+    return asyncio.run(InMemoryUserRepository(store).create(user))
+
+
+def deposit(store: InMemoryStore, user: User, amount):
+    use_case = DepositUseCase(InMemoryUserRepository(store), InMemoryTransactionRepository(store))
+    return asyncio.run(use_case.execute(DepositRequest(user_id=user.user_id, amount=amount)))
+
+
+def test_deposit_adds_to_the_balance(store: InMemoryStore):
+    user = create_user(store)
+
+    assert deposit(store, user, Money(5_00)).balance == Money(105_00)
+
+
+@pytest.mark.parametrize("amount", [True, False, 1.0])
+def test_amount_must_be_money(store: InMemoryStore, amount):
+    user = create_user(store)
+
+    with pytest.raises(ValueError, match="Amount must be Money"):
+        deposit(store, user, amount)
+
+    assert store.users[user.user_id].balance == Money(100_00)
\ No newline at end of file
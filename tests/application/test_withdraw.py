@@ -0,0 +1,93 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.application.use_cases.withdraw import WithdrawRequest, WithdrawUseCase
+from src.domain.entities.events import ExpenseRecorded
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import TransactionCategory
+from src.domain.entities.user import User
+from src.domain.interfaces.event_queue import EventDelivery, IExpenseEventQueue
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.memory.users import InMemoryUserRepository
+from tests.fakes import ManualCommitHooks
+
+
+class RecordingQueue(IExpenseEventQueue):
+    def __init__(self):
+        self.published: List[ExpenseRecorded] = []
+
+    async def publish(self, event: ExpenseRecorded) -> None:
+        self.published.append(event)
+
+    async def receive(self, max_batch: int, timeout: float) -> EventDelivery:
+        return EventDelivery()
+
+    async def ack(self, delivery: EventDelivery) -> None:
+        pass
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+def create_use_case(store: InMemoryStore, events: IExpenseEventQueue, hooks: ManualCommitHooks) -> WithdrawUseCase:
+    return WithdrawUseCase(
+        InMemoryUserRepository(store), InMemoryTransactionRepository(store), events=events, commit_hooks=hooks
+    )
+
+
+def create_user(store: InMemoryStore) -> User:
+    user = User(email="ann@example.com", username="ann", hashed_password="x", balance=Money(100_00))
+    return asyncio.run(InMemoryUserRepository(store).create(user))
+
+
+def withdraw(user: User, amount: int) -> WithdrawRequest:
+    return WithdrawRequest(user_id=user.user_id, amount=Money(amount), category=TransactionCategory.FOOD)
+
+
+def test_expense_is_published_after_commit(store: InMemoryStore):
+    user = create_user(store)
+    events, hooks = RecordingQueue(), ManualCommitHooks()
+
+    asyncio.run(create_use_case(store, events, hooks).execute(withdraw(user, 30_00)))
+    assert events.published == []
+
+    asyncio.run(hooks.commit())
+    assert [(event.user_id, event.amount, event.category) for event in events.published] == [
+        (user.user_id, Money(30_00), TransactionCategory.FOOD)
+    ]
+
+
+def test_rolled_back_expense_is_not_published(store: InMemoryStore):
+    user = create_user(store)
+    events, hooks = RecordingQueue(), ManualCommitHooks()
+
+    asyncio.run(create_use_case(store, events, hooks).execute(withdraw(user, 30_00)))
+    hooks.rollback()
+    asyncio.run(hooks.commit())
+
+    assert events.published == []
+
+
+def test_rejected_withdrawal_registers_nothing(store: InMemoryStore):
+    user = create_user(store)
+    events, hooks = RecordingQueue(), ManualCommitHooks()
+
+    with pytest.raises(ValueError, match="Not enough balance"):
+        asyncio.run(create_use_case(store, events, hooks).execute(withdraw(user, 500_00)))
+
+    assert hooks.callbacks == []
+
+@pytest.mark.parametrize("amount", [True, 1.5])
+def test_amount_must_be_money(store: InMemoryStore, amount):
+    user = create_user(store)
+    request = WithdrawRequest(user_id=user.user_id, amount=amount, category=TransactionCategory.FOOD)
+
+    with pytest.raises(ValueError, match="Amount must be Money"):
+        asyncio.run(create_use_case(store, RecordingQueue(), ManualCommitHooks()).execute(request))
+
+    assert store.users[user.user_id].balance == Money(100_00)
\ No newline at end of file
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import random
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from src.domain.interfaces.commit_hooks import AfterCommit, ICommitHooks
+from src.infrastructure.config import TelegramConfig
+from src.infrastructure.notifications.dispatcher import TokenBucket
+
+MESSAGE_ID = re.compile(r"#(\d+)")
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis: the RedisClient subset, with EX expiry."""
+
+    def __init__(self):
+        self.data: Dict[str, Tuple[Optional[float], str]] = {}
+
+    async def get(self, name: str) -> Optional[str]:
+        entry = self.data.get(name)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: str, ex: Optional[int] = None) -> bool:
+        self.data[name] = (time.monotonic() + ex if ex is not None else None, value)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+
+class ManualCommitHooks(ICommitHooks):
+    """Holds after-commit callbacks until the test commits or rolls back."""
+
+    def __init__(self):
+        self.callbacks: List[AfterCommit] = []
+
+    async def after_commit(self, callback: AfterCommit) -> None:
+        self.callbacks.append(callback)
+
+    async def commit(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            await callback()
+
+    def rollback(self) -> None:
+        self.callbacks.clear()
+
+
+class FakeBotApi:
+    """
+    A local sendMessage endpoint with Bot API style flood control, speaking
+    just enough HTTP/1.1 (keep-alive, Content-Length) for httpx.
+
+    Requests over the limits of config get 429 with parameters.retry_after,
+    error_rate of them get 500 and chats in blocked get 403. Replies queued
+    in responses[chat_id] are answered first, in order, whatever the limits.
+    """
+
+    def __init__(
+        self,
+        config: TelegramConfig,
+        error_rate: float = 0.0,
+        blocked: Optional[Set[int]] = None,
+        latency: float = 0.0,
+        seed: int = 0,
+    ):
+        self.config = config
+        self.error_rate = error_rate
+        self.blocked = blocked or set()
+        self.latency = latency
+        self.rnd = random.Random(seed)
+        self.responses: Dict[int, List[Tuple[int, dict]]] = defaultdict(list)
+        self.server: asyncio.Server
+        self.reset()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    def reset(self) -> None:
+        now = time.monotonic()
+        self.global_bucket = TokenBucket(self.config.global_rate, self.config.global_burst, now)
+        self.chat_buckets: Dict[int, TokenBucket] = {}
+        self.requests = 0
+        self.too_many = 0
+        # Message id ("#<id>" in the text) -> perf_counter() of the first delivery.
+        self.delivered: Dict[int, float] = {}
+        # Per chat: monotonic time of every request, and texts that were accepted.
+        self.attempts: Dict[int, List[float]] = defaultdict(list)
+        self.messages: Dict[int, List[str]] = defaultdict(list)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                body = json.loads(await reader.readexactly(length)) if length else {}
+
+                await asyncio.sleep(self.latency)
+                status, payload = self.send_message(body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def send_message(self, body: dict) -> Tuple[int, dict]:
+        self.requests += 1
+        chat_id = body["chat_id"]
+        now = time.monotonic()
+        self.attempts[chat_id].append(now)
+
+        if self.responses[chat_id]:
+            status, payload = self.responses[chat_id].pop(0)
+            if status == 429:
+                self.too_many += 1
+            if status != 200:
+                return status, payload
+        elif chat_id in self.blocked:
+            return 403, {"ok": False, "error_code": 403, "description": "Forbidden: bot was blocked by the user"}
+        elif self.rnd.random() < self.error_rate:
+            return 500, {"ok": False, "error_code": 500, "description": "Internal Server Error"}
+        else:
+            chat = self.chat_buckets.get(chat_id)
+            if chat is None:
+                chat = self.chat_buckets[chat_id] = TokenBucket(self.config.chat_rate, self.config.chat_burst, now)
+            # A little slack, as the real limits are not exact either.
+            wait = max(chat.delay(now), self.global_bucket.delay(now))
+            if wait > 0.05:
+                self.too_many += 1
+                return 429, too_many_requests(wait)
+            chat.take(now)
+            self.global_bucket.take(now)
+
+        received = time.perf_counter()
+        self.messages[chat_id].append(body["text"])
+        for match in MESSAGE_ID.finditer(body["text"]):
+            self.delivered.setdefault(int(match.group(1)), received)
+        return 200, {"ok": True, "result": {"message_id": self.requests}}
+
+
+def too_many_requests(retry_after: float) -> dict:
+    return {
+        "ok": False,
+        "error_code": 429,
+        "description": "Too Many Requests",
+        "parameters": {"retry_after": round(retry_after, 3)},
+    }
\ No newline at end of file
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.deposit import DepositRequest, DepositUseCase
+from src.application.use_cases.get_statistics import GetStatisticsRequest, GetStatisticsUseCase
+from src.application.use_cases.withdraw import WithdrawRequest, WithdrawUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.cache.redis import RedisCacheBackend
+from src.infrastructure.cache.statistics import (
+    StatisticsInvalidatingTransactionRepository,
+    StatisticsSnapshotCache,
+)
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.memory.users import InMemoryUserRepository
+from tests.fakes import FakeRedis, ManualCommitHooks
+
+
+class DirectCoalescer:
+    """Applies every transaction at once, standing in for TransactionCoalescer."""
+
+    def __init__(self, user_repo: InMemoryUserRepository):
+        self.user_repo = user_repo
+
+    async def apply_transaction(self, transaction: Transaction, delta: Money):
+        return await self.user_repo.apply_transaction(transaction, delta)
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+@pytest.fixture
+def statistics() -> StatisticsSnapshotCache:
+    return StatisticsSnapshotCache(RedisCacheBackend(FakeRedis(), prefix="statistics:"), ttl=60)
+
+
+@pytest.fixture
+def user(store: InMemoryStore) -> User:
+    user = User(email="ann@example.com", username="ann", hashed_password="x", balance=Money(100_00))
+    return asyncio.run(InMemoryUserRepository(store).create(user))
+
+
+def spent(store: InMemoryStore, statistics: StatisticsSnapshotCache, user: User) -> Money:
+    use_case = GetStatisticsUseCase(InMemoryTransactionRepository(store), statistics=statistics)
+    snapshot = asyncio.run(use_case.execute(GetStatisticsRequest(user_id=user.user_id)))
+    return snapshot.total(TransactionType.EXPENSE)
+
+
+def withdraw(store: InMemoryStore, statistics: StatisticsSnapshotCache, hooks: ManualCommitHooks, user: User) -> None:
+    use_case = WithdrawUseCase(
+        InMemoryUserRepository(store), InMemoryTransactionRepository(store), statistics=statistics, commit_hooks=hooks
+    )
+    request = WithdrawRequest(user_id=user.user_id, amount=Money(30_00), category=TransactionCategory.FOOD)
+    asyncio.run(use_case.execute(request))
+
+
+def test_withdrawal_invalidates_snapshots_after_commit(store, statistics, user):
+    hooks = ManualCommitHooks()
+    assert spent(store, statistics, user) == Money(0)
+
+    withdraw(store, statistics, hooks, user)
+    # Not committed yet: readers keep the snapshot they had.
+    assert spent(store, statistics, user) == Money(0)
+    assert statistics.stats.invalidations == 0
+
+    asyncio.run(hooks.commit())
+    assert spent(store, statistics, user) == Money(30_00)
+    assert statistics.stats.invalidations == 1
+
+
+def test_snapshot_computed_before_commit_is_not_served_after_it(store, statistics, user):
+    hooks = ManualCommitHooks()
+    withdraw(store, statistics, hooks, user)
+    # The in-memory store shows the write early; a snapshot computed now lands
+    # under the generation that the commit replaces.
+    assert spent(store, statistics, user) == Money(30_00)
+
+    asyncio.run(hooks.commit())
+
+    assert spent(store, statistics, user) == Money(30_00)
+    assert (statistics.stats.misses, statistics.stats.hits) == (2, 0)
+
+
+def test_coalesced_deposit_invalidates_at_once(store, statistics, user):
+    hooks = ManualCommitHooks()
+    user_repo = InMemoryUserRepository(store)
+    use_case = DepositUseCase(
+        user_repo,
+        InMemoryTransactionRepository(store),
+        coalescer=DirectCoalescer(user_repo),
+        statistics=statistics,
+        commit_hooks=hooks,
+    )
+
+    asyncio.run(use_case.execute(DepositRequest(user_id=user.user_id, amount=Money(10_00))))
+
+    assert hooks.callbacks == []
+    assert statistics.stats.invalidations == 1
+
+
+def test_bulk_insert_invalidates_only_if_committed(store, statistics, user):
+    hooks = ManualCommitHooks()
+    transaction_repo = StatisticsInvalidatingTransactionRepository(
+        InMemoryTransactionRepository(store), statistics, commit_hooks=hooks
+    )
+    rows = [
+        Transaction(
+            user_id=user.user_id,
+            transaction_type=TransactionType.EXPENSE,
+            amount=Money(5_00),
+            category=TransactionCategory.FOOD,
+        )
+        for _ in range(2)
+    ]
+
+    asyncio.run(transaction_repo.create_many(rows))
+    hooks.rollback()
+    assert statistics.stats.invalidations == 0
+
+    asyncio.run(transaction_repo.create_many(rows))
+    asyncio.run(hooks.commit())
+    assert statistics.stats.invalidations == 1
\ No newline at end of file
@@ -0,0 +1,171 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.cache.redis import RedisCacheBackend
+from src.infrastructure.cache.users import CachedUserRepository
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.users import InMemoryUserRepository
+from tests.fakes import FakeRedis, ManualCommitHooks
+
+HASH = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA"
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def hooks() -> ManualCommitHooks:
+    return ManualCommitHooks()
+
+
+@pytest.fixture
+def users(redis: FakeRedis, hooks: ManualCommitHooks) -> CachedUserRepository:
+    return CachedUserRepository(
+        InMemoryUserRepository(InMemoryStore()), RedisCacheBackend(redis), ttl=60, commit_hooks=hooks
+    )
+
+
+def create_user(users: CachedUserRepository, balance: int = 100_00) -> User:
+    return asyncio.run(
+        users.create(User(email="ann@example.com", username="ann", hashed_password=HASH, balance=Money(balance)))
+    )
+
+
+def expense(user: User, amount: int) -> Transaction:
+    return Transaction(
+        user_id=user.user_id,
+        transaction_type=TransactionType.EXPENSE,
+        amount=Money(amount),
+        category=TransactionCategory.FOOD,
+    )
+
+
+def test_unlocked_reads_miss_once_then_hit(users: CachedUserRepository):
+    user = create_user(users)
+
+    async def read_twice():
+        return [await users.get_by_id(user.user_id, with_lock=False) for _ in range(2)]
+
+    first, second = asyncio.run(read_twice())
+
+    assert (users.stats.misses, users.stats.hits) == (1, 1)
+    assert first.balance == second.balance == Money(100_00)
+
+
+def test_locked_reads_bypass_the_cache(users: CachedUserRepository, redis: FakeRedis):
+    user = create_user(users)
+
+    async def read():
+        await users.get_by_id(user.user_id, with_lock=False)
+        users.user_repo.store.users[user.user_id].balance = Money(5_00)
+        return await users.get_by_id(user.user_id, with_lock=True)
+
+    locked = asyncio.run(read())
+
+    assert locked.balance == Money(5_00)
+    assert (users.stats.misses, users.stats.hits) == (1, 0)
+
+
+def test_balance_change_invalidates(users: CachedUserRepository, hooks: ManualCommitHooks):
+    user = create_user(users)
+
+    async def withdraw_then_read():
+        await users.get_by_id(user.user_id, with_lock=False)
+        await users.apply_transaction(expense(user, 30_00), delta=Money(-30_00))
+        await hooks.commit()
+        return await users.get_by_id(user.user_id, with_lock=False)
+
+    after = asyncio.run(withdraw_then_read())
+
+    assert after.balance == Money(70_00)
+    assert users.stats.invalidations == 1
+    assert (users.stats.misses, users.stats.hits) == (2, 0)
+
+
+def test_row_read_before_commit_is_not_served_after_commit(users: CachedUserRepository, hooks: ManualCommitHooks):
+    user = create_user(users)
+    repository = users.user_repo
+    read_row = repository.get_by_id
+
+    async def slow_read(user_id: int, with_lock: bool = True):
+        # A concurrent write commits between this reader's DB read and its store.
+        row = await read_row(user_id, with_lock)
+        repository.get_by_id = read_row
+        await users.apply_transaction(expense(user, 30_00), delta=Money(-30_00))
+        await hooks.commit()
+        return row
+
+    async def race():
+        repository.get_by_id = slow_read
+        stale = await users.get_by_id(user.user_id, with_lock=False)
+        return stale, await users.get_by_id(user.user_id, with_lock=False)
+
+    stale, after_commit = asyncio.run(race())
+
+    assert stale.balance == Money(100_00)
+    assert after_commit.balance == Money(70_00)
+    assert (users.stats.misses, users.stats.hits) == (2, 0)
+
+
+def test_row_read_before_write_is_not_served_before_commit(users: CachedUserRepository):
+    user = create_user(users)
+
+    async def race():
+        await users.get_by_id(user.user_id, with_lock=False)
+        await users.apply_transaction(expense(user, 30_00), delta=Money(-30_00))
+        # The write is not committed: readers see the old row, but from the database.
+        return await users.get_by_id(user.user_id, with_lock=False)
+
+    asyncio.run(race())
+
+    assert (users.stats.misses, users.stats.hits) == (2, 0)
+
+
+def test_rolled_back_write_keeps_no_pending_invalidation(users: CachedUserRepository, hooks: ManualCommitHooks):
+    user = create_user(users)
+
+    async def write():
+        await users.apply_transaction(expense(user, 30_00), delta=Money(-30_00))
+
+    asyncio.run(write())
+    hooks.rollback()
+
+    assert hooks.callbacks == []
+
+
+def test_password_hash_is_not_cached(users: CachedUserRepository, redis: FakeRedis):
+    user = create_user(users)
+
+    async def read():
+        cached = await users.get_by_id(user.user_id, with_lock=False)
+        cached = await users.get_by_id(user.user_id, with_lock=False)
+        return cached, await users.get_by_email(user.email)
+
+    cached, by_email = asyncio.run(read())
+
+    generation = redis.data[f"users:user:gen:{user.user_id}"][1]
+    assert sorted(redis.data) == [f"users:user:gen:{user.user_id}", f"users:user:id:{user.user_id}:{generation}"]
+    assert all(HASH not in value and "hashed_password" not in value for _, value in redis.data.values())
+    assert cached.hashed_password == ""
+    # The login path reads the repository, hash included.
+    assert by_email.hashed_password == HASH
+
+
+def test_entries_expire(users: CachedUserRepository, redis: FakeRedis):
+    user = create_user(users)
+
+    async def read_after_expiry():
+        await users.get_by_id(user.user_id, with_lock=False)
+        for key, (_, value) in redis.data.items():
+            redis.data[key] = (0.0, value)
+        return await users.get_by_id(user.user_id, with_lock=False)
+
+    assert replace(asyncio.run(read_after_expiry()), hashed_password=HASH) == users.user_repo.store.users[user.user_id]
+    assert users.stats.misses == 2
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Helpers for tests that need PostgreSQL. They run against the database in
+TEST_POSTGRES_URL (an asyncpg DSN), whose public schema they drop and
+recreate, and are skipped when it is not set.
+"""
+import os
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+
+def postgres_url() -> str:
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    return url
+
+
+async def create_database(url: str, suffix: str) -> str:
+    """(Re)create a sibling database of url's, e.g. to stand in for a replica, and return its DSN."""
+    url_object = make_url(url)
+    name = f"{url_object.database}_{suffix}"
+
+    admin = create_async_engine(url, poolclass=NullPool, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as connection:
+        await connection.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        await connection.execute(text(f'CREATE DATABASE "{name}"'))
+    await admin.dispose()
+
+    return url_object.set(database=name).render_as_string(hide_password=False)
+
+
+async def fresh_engine(url: str) -> AsyncEngine:
+    """Engine on url with an empty schema of every model."""
+    from infrastructure.database.base import Base
+    from infrastructure.database.models import load_models
+
+    load_models()
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as connection:
+        await connection.execute(text("DROP SCHEMA IF EXISTS archive CASCADE"))
+        await connection.execute(text("DROP SCHEMA public CASCADE"))
+        await connection.execute(text("CREATE SCHEMA public"))
+        await connection.run_sync(Base.metadata.create_all)
+    return engine
+
+ROLLUP_ROWS = text(
+    """
+    SELECT user_id, day, category, transaction_type, total, count, min_amount, max_amount
+    FROM daily_user_category_totals
+    ORDER BY 1, 2, 3, 4
+    """
+)
+RAW_ROLLUP_ROWS = text(
+    """
+    SELECT user_id, date_created::date, category, transaction_type, sum(amount), count(*), min(amount), max(amount)
+    FROM transactions
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+    """
+)
+
+
+async def rollup_and_raw_rows(engine: AsyncEngine) -> Tuple[List[tuple], List[tuple]]:
+    """daily_user_category_totals, and the same totals computed from the transactions themselves."""
+    async with engine.connect() as connection:
+        rollup = [tuple(row) for row in await connection.execute(ROLLUP_ROWS)]
+        raw = [tuple(row) for row in await connection.execute(RAW_ROLLUP_ROWS)]
+    return rollup, raw
\ No newline at end of file
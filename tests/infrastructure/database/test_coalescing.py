@@ -0,0 +1,90 @@
+import asyncio
+from typing import List
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.config import DepositCoalescingConfig
+from src.infrastructure.database.coalescing import TransactionCoalescer
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.users import InMemoryUserRepository
+
+
+class FailingCommitSession(AsyncSession):
+    """Session whose COMMIT is lost on the way back: the server may have applied it."""
+
+    async def commit(self) -> None:
+        raise OperationalError("COMMIT", {}, ConnectionResetError("connection reset"))
+
+
+class BatchRejectingUserRepository(InMemoryUserRepository):
+    """Fails statements of more than one transaction before anything is applied."""
+
+    async def apply_transactions(self, user_id, transactions, deltas):
+        if len(transactions) > 1:
+            raise OperationalError("INSERT", {}, ValueError("value out of range"))
+        return await super().apply_transactions(user_id, transactions, deltas)
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+@pytest.fixture
+def user(store: InMemoryStore) -> User:
+    return asyncio.run(
+        InMemoryUserRepository(store).create(User(email="ann@example.com", username="ann", hashed_password=""))
+    )
+
+
+def deposit(user: User, amount: int) -> Transaction:
+    return Transaction(
+        user_id=user.user_id,
+        transaction_type=TransactionType.INCOME,
+        amount=Money(amount),
+        category=TransactionCategory.OTHER,
+    )
+
+
+def deposit_concurrently(coalescer: TransactionCoalescer, user: User, amounts: List[int]) -> list:
+    async def run():
+        return await asyncio.gather(
+            *[coalescer.apply_transaction(deposit(user, amount), Money(amount)) for amount in amounts],
+            return_exceptions=True,
+        )
+
+    return asyncio.run(run())
+
+
+def test_failed_commit_is_not_retried(store: InMemoryStore, user: User):
+    coalescer = TransactionCoalescer(
+        FailingCommitSession,
+        DepositCoalescingConfig(enabled=True, window_ms=50),
+        user_repo_factory=lambda session: InMemoryUserRepository(store),
+    )
+
+    results = deposit_concurrently(coalescer, user, [10_00, 20_00, 30_00])
+
+    assert all(isinstance(result, OperationalError) for result in results)
+    # Written by the one batch statement, and not again row by row.
+    assert store.users[user.user_id].balance == Money(60_00)
+    assert len(store.transactions) == 3
+
+
+def test_failed_statement_is_retried_row_by_row(store: InMemoryStore, user: User):
+    coalescer = TransactionCoalescer(
+        AsyncSession,
+        DepositCoalescingConfig(enabled=True, window_ms=50),
+        user_repo_factory=lambda session: BatchRejectingUserRepository(store),
+    )
+
+    results = deposit_concurrently(coalescer, user, [10_00, 20_00, 30_00])
+
+    assert sorted(result.balance for result in results) == [Money(10_00), Money(30_00), Money(60_00)]
+    assert store.users[user.user_id].balance == Money(60_00)
+    assert len(store.transactions) == 3
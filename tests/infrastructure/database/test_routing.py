@@ -0,0 +1,70 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.application.use_cases.get_statistics import GetStatisticsRequest, GetStatisticsUseCase
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.cache.memory import InMemoryCacheBackend
+from src.infrastructure.cache.statistics import StatisticsSnapshotCache
+from src.infrastructure.database.factory import RepositoryFactory
+from src.infrastructure.database.routing import ReplicaRouter, RoutingSession
+from infrastructure.database.repository.users import UserRepository
+from tests.infrastructure.database.postgres import create_database, fresh_engine, postgres_url
+
+
+async def seed(engine: AsyncEngine, expenses: list) -> int:
+    async with AsyncSession(engine, expire_on_commit=False) as session, session.begin():
+        users = UserRepository(session)
+        user = await users.create(User(email="ann@example.com", username="ann", hashed_password="", balance=Money(100_00)))
+        for amount in expenses:
+            transaction = Transaction(
+                user_id=user.user_id,
+                transaction_type=TransactionType.EXPENSE,
+                amount=Money(amount),
+                category=TransactionCategory.FOOD,
+                date_created=datetime.now(),
+            )
+            await users.apply_transaction(transaction, delta=Money(-amount))
+    return user.user_id
+
+
+def test_lagging_replica_fills_no_cache():
+    url = postgres_url()
+
+    async def run():
+        primary = await fresh_engine(url)
+        # The replica has not replayed the second expense yet.
+        replica = await fresh_engine(await create_database(url, "replica"))
+        user_id = await seed(primary, [10_00, 30_00])
+        await seed(replica, [10_00])
+
+        router = ReplicaRouter(primary, [replica], max_lag_seconds=5)
+        sessions = async_sessionmaker(primary, sync_session_class=RoutingSession, info={"router": router})
+        statistics = StatisticsSnapshotCache(InMemoryCacheBackend())
+        repositories = RepositoryFactory(InMemoryCacheBackend(), statistics=statistics)
+
+        try:
+            for _ in range(2):
+                async with sessions() as session:
+                    user = await repositories.users(session).get_by_id(user_id, with_lock=False)
+                    snapshot = await GetStatisticsUseCase(
+                        repositories.transactions(session), statistics=statistics
+                    ).execute(GetStatisticsRequest(user_id=user_id))
+                    history_total = await repositories.transactions(session).get_total_by_user(user_id)
+        finally:
+            await primary.dispose()
+            await replica.dispose()
+
+        return user, snapshot, history_total, repositories, statistics
+
+    user, snapshot, history_total, repositories, statistics = asyncio.run(run())
+
+    # Second round served from both caches, with what the primary holds.
+    assert (repositories.user_cache_stats.hits, statistics.stats.hits) == (1, 1)
+    assert user.balance == Money(60_00)
+    assert snapshot.total(TransactionType.EXPENSE) == Money(40_00)
+    # History reads do use the replica.
+    assert history_total == Money(10_00)
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from infrastructure.database.models.transaction import TransactionModel
+from infrastructure.database.models.users import UserModel
+from infrastructure.database.repository.transaction import TransactionRepository
+from infrastructure.database.repository.users import UserRepository
+from tests.infrastructure.database.postgres import fresh_engine, postgres_url, rollup_and_raw_rows
+
+
+async def create_users(engine: AsyncEngine, *balances: int) -> list:
+    async with AsyncSession(engine, expire_on_commit=False) as session, session.begin():
+        users = UserRepository(session)
+        return [
+            await users.create(
+                User(email=f"user{index}@example.com", username="ann", hashed_password="", balance=Money(balance))
+            )
+            for index, balance in enumerate(balances)
+        ]
+
+
+async def stored_rows(engine: AsyncEngine):
+    async with AsyncSession(engine) as session:
+        amounts = dict((await session.execute(select(TransactionModel.transaction_id, TransactionModel.amount))).all())
+        balances = dict((await session.execute(select(UserModel.user_id, UserModel.balance))).all())
+    return amounts, balances
+
+
+def transaction(user: User, transaction_type: TransactionType, amount: int, days_ago: int = 0) -> Transaction:
+    return Transaction(
+        user_id=user.user_id,
+        transaction_type=transaction_type,
+        amount=Money(amount),
+        category=TransactionCategory.FOOD,
+        date_created=datetime.now() - timedelta(days=days_ago),
+    )
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_create_many_keeps_input_order_and_rollup(use_copy: bool):
+    url = postgres_url()
+    amounts = [5_00, 1_00, 4_00, 2_00, 3_00]
+
+    async def run():
+        engine = await fresh_engine(url)
+        try:
+            ann, bob = await create_users(engine, 0, 0)
+            rows = [
+                transaction(ann if index % 2 else bob, TransactionType.INCOME, amount, days_ago=index % 3)
+                for index, amount in enumerate(amounts)
+            ]
+            async with AsyncSession(engine) as session, session.begin():
+                result = await TransactionRepository(session).create_many(rows, chunk_size=2, use_copy=use_copy)
+            return ann, bob, rows, result, await stored_rows(engine), await rollup_and_raw_rows(engine)
+        finally:
+            await engine.dispose()
+
+    ann, bob, rows, result, (amounts_by_id, balances), (rollup, raw) = asyncio.run(run())
+
+    assert result.transaction_ids == [row.transaction_id for row in rows]
+    assert [amounts_by_id[i] for i in result.transaction_ids] == amounts
+    assert len(result.chunk_timings) == 3
+    assert (balances[ann.user_id], balances[bob.user_id]) == (3_00, 12_00)
+    assert rollup == raw
+
+
+def test_create_many_guard_rejects_the_users_whole_chunk():
+    url = postgres_url()
+
+    async def run():
+        engine = await fresh_engine(url)
+        try:
+            ann, bob = await create_users(engine, 10_00, 10_00)
+            rows = [
+                transaction(ann, TransactionType.INCOME, 5_00),
+                transaction(bob, TransactionType.EXPENSE, 4_00),
+                transaction(ann, TransactionType.EXPENSE, 20_00),
+            ]
+            async with AsyncSession(engine) as session, session.begin():
+                result = await TransactionRepository(session).create_many(rows)
+            return ann, bob, rows, result, await stored_rows(engine), await rollup_and_raw_rows(engine)
+        finally:
+            await engine.dispose()
+
+    ann, bob, rows, result, (amounts_by_id, balances), (rollup, raw) = asyncio.run(run())
+
+    assert result.rejected_user_ids == [ann.user_id]
+    assert result.transaction_ids == [rows[1].transaction_id]
+    assert list(amounts_by_id) == result.transaction_ids
+    assert (balances[ann.user_id], balances[bob.user_id]) == (10_00, 6_00)
+    assert rollup == raw
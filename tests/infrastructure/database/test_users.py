@@ -0,0 +1,115 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from infrastructure.database.models.transaction import TransactionModel
+from infrastructure.database.repository.users import UserRepository
+from tests.infrastructure.database.postgres import fresh_engine, postgres_url, rollup_and_raw_rows
+
+
+async def create_user(engine: AsyncEngine, balance: int = 100_00) -> User:
+    async with AsyncSession(engine, expire_on_commit=False) as session, session.begin():
+        return await UserRepository(session).create(
+            User(email="ann@example.com", username="ann", hashed_password="", balance=Money(balance))
+        )
+
+
+async def transaction_count(engine: AsyncEngine) -> int:
+    async with AsyncSession(engine) as session:
+        return (await session.execute(select(func.count()).select_from(TransactionModel))).scalar_one()
+
+
+def transaction(
+    user_id: int, transaction_type: TransactionType, amount: int, days_ago: int = 0
+) -> Transaction:
+    return Transaction(
+        user_id=user_id,
+        transaction_type=transaction_type,
+        amount=Money(amount),
+        category=TransactionCategory.FOOD,
+        date_created=datetime.now() - timedelta(days=days_ago),
+    )
+
+
+def test_apply_transaction_guard_rejects_overdraft():
+    url = postgres_url()
+
+    async def run():
+        engine = await fresh_engine(url)
+        try:
+            user = await create_user(engine)
+            withdrawal = transaction(user.user_id, TransactionType.EXPENSE, 150_00)
+            async with AsyncSession(engine) as session, session.begin():
+                users = UserRepository(session)
+                result = await users.apply_transaction(withdrawal, Money(-150_00), min_balance=Money(0))
+                after = await users.get_by_id(user.user_id)
+            return result, withdrawal, after, await transaction_count(engine), await rollup_and_raw_rows(engine)
+        finally:
+            await engine.dispose()
+
+    result, withdrawal, after, count, (rollup, _) = asyncio.run(run())
+
+    assert result is None
+    assert withdrawal.transaction_id is None
+    assert after.balance == Money(100_00)
+    assert count == 0
+    assert rollup == []
+
+
+def test_apply_transactions_keeps_input_order_and_rollup():
+    url = postgres_url()
+    amounts = [30_00, 10_00, 20_00]
+
+    async def run():
+        engine = await fresh_engine(url)
+        try:
+            user = await create_user(engine)
+            deposits = [
+                transaction(user.user_id, TransactionType.INCOME, amount, days_ago=index)
+                for index, amount in enumerate(amounts)
+            ]
+            withdrawal = transaction(user.user_id, TransactionType.EXPENSE, 5_00)
+            async with AsyncSession(engine) as session, session.begin():
+                users = UserRepository(session)
+                snapshots = await users.apply_transactions(
+                    user.user_id, deposits, [Money(amount) for amount in amounts]
+                )
+                await users.apply_transaction(withdrawal, Money(-5_00), min_balance=Money(0))
+                stored = {
+                    row.transaction_id: row.amount
+                    for row in await session.execute(select(TransactionModel.transaction_id, TransactionModel.amount))
+                }
+            return deposits, snapshots, stored, await rollup_and_raw_rows(engine)
+        finally:
+            await engine.dispose()
+
+    deposits, snapshots, stored, (rollup, raw) = asyncio.run(run())
+
+    ids = [deposit.transaction_id for deposit in deposits]
+    assert ids == sorted(ids)
+    assert [stored[i] for i in ids] == amounts
+    assert [snapshot.balance for snapshot in snapshots] == [Money(130_00), Money(140_00), Money(160_00)]
+    assert len(rollup) == 4
+    assert rollup == raw
+
+
+def test_apply_transactions_of_unknown_user():
+    url = postgres_url()
+
+    async def run():
+        engine = await fresh_engine(url)
+        try:
+            async with AsyncSession(engine) as session, session.begin():
+                result = await UserRepository(session).apply_transactions(
+                    404, [transaction(404, TransactionType.INCOME, 10_00)], [Money(10_00)]
+                )
+            return result, await transaction_count(engine)
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == (None, 0)
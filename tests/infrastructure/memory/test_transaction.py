@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.memory.users import InMemoryUserRepository
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+def create_user(store: InMemoryStore, email: str, balance: int) -> User:
+    return asyncio.run(
+        InMemoryUserRepository(store).create(User(email=email, username="ann", hashed_password="", balance=Money(balance)))
+    )
+
+
+def transaction(user: User, transaction_type: TransactionType, amount: int) -> Transaction:
+    return Transaction(
+        user_id=user.user_id,
+        transaction_type=transaction_type,
+        amount=Money(amount),
+        category=TransactionCategory.FOOD,
+    )
+
+
+def test_create_many_keeps_input_order_across_chunks(store: InMemoryStore):
+    ann = create_user(store, "ann@example.com", 0)
+    bob = create_user(store, "bob@example.com", 0)
+    amounts = [5_00, 1_00, 4_00, 2_00, 3_00]
+    rows = [transaction(ann if index % 2 else bob, TransactionType.INCOME, amount) for index, amount in enumerate(amounts)]
+
+    result = asyncio.run(InMemoryTransactionRepository(store).create_many(rows, chunk_size=2))
+
+    assert result.transaction_ids == [row.transaction_id for row in rows]
+    assert [store.transactions[i].amount for i in result.transaction_ids] == amounts
+    assert len(result.chunk_timings) == 3
+    assert (store.users[ann.user_id].balance, store.users[bob.user_id].balance) == (Money(3_00), Money(12_00))
+
+
+def test_create_many_guard_rejects_the_users_whole_chunk(store: InMemoryStore):
+    ann = create_user(store, "ann@example.com", 10_00)
+    bob = create_user(store, "bob@example.com", 10_00)
+    rows = [
+        transaction(ann, TransactionType.INCOME, 5_00),
+        transaction(bob, TransactionType.EXPENSE, 4_00),
+        transaction(ann, TransactionType.EXPENSE, 20_00),
+    ]
+
+    result = asyncio.run(InMemoryTransactionRepository(store).create_many(rows))
+
+    assert result.rejected_user_ids == [ann.user_id]
+    assert result.transaction_ids == [rows[1].transaction_id]
+    assert (store.users[ann.user_id].balance, store.users[bob.user_id].balance) == (Money(10_00), Money(6_00))
\ No newline at end of file
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.entities.user import User
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.memory.users import InMemoryUserRepository
+
+
+@pytest.fixture
+def users() -> InMemoryUserRepository:
+    return InMemoryUserRepository(InMemoryStore())
+
+
+@pytest.fixture
+def user(users: InMemoryUserRepository) -> User:
+    return asyncio.run(
+        users.create(User(email="ann@example.com", username="ann", hashed_password="", balance=Money(100_00)))
+    )
+
+
+def transaction(user_id: int, transaction_type: TransactionType, amount: int) -> Transaction:
+    return Transaction(
+        user_id=user_id,
+        transaction_type=transaction_type,
+        amount=Money(amount),
+        category=TransactionCategory.FOOD,
+    )
+
+
+def test_apply_transaction_guard_rejects_overdraft(users: InMemoryUserRepository, user: User):
+    withdrawal = transaction(user.user_id, TransactionType.EXPENSE, 150_00)
+
+    result = asyncio.run(users.apply_transaction(withdrawal, Money(-150_00), min_balance=Money(0)))
+
+    assert result is None
+    assert withdrawal.transaction_id is None
+    assert users.store.users[user.user_id].balance == Money(100_00)
+    assert users.store.transactions == {}
+
+
+def test_apply_transaction_of_unknown_user(users: InMemoryUserRepository):
+    deposit = transaction(404, TransactionType.INCOME, 10_00)
+
+    assert asyncio.run(users.apply_transaction(deposit, Money(10_00))) is None
+    assert users.store.transactions == {}
+
+
+def test_apply_transactions_keeps_input_order(users: InMemoryUserRepository, user: User):
+    amounts = [30_00, 10_00, 20_00]
+    deposits = [transaction(user.user_id, TransactionType.INCOME, amount) for amount in amounts]
+
+    snapshots = asyncio.run(users.apply_transactions(user.user_id, deposits, [Money(amount) for amount in amounts]))
+
+    ids = [deposit.transaction_id for deposit in deposits]
+    assert ids == sorted(ids)
+    assert [users.store.transactions[i].amount for i in ids] == amounts
+    assert [snapshot.balance for snapshot in snapshots] == [Money(130_00), Money(140_00), Money(160_00)]
\ No newline at end of file
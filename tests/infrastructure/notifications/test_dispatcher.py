@@ -0,0 +1,134 @@
+import asyncio
+from typing import List, Tuple
+
+import httpx
+import pytest
+
+from src.domain.entities.notification import DeadLetter, Notification, NotificationPriority
+from src.infrastructure.config import TelegramConfig
+from src.infrastructure.memory.notifications import InMemoryDeadLetterRepository
+from src.infrastructure.memory.store import InMemoryStore
+from src.infrastructure.notifications.dispatcher import NotificationDispatcher
+from src.infrastructure.notifications.telegram import TelegramBotClient
+from tests.fakes import FakeBotApi, too_many_requests
+
+SERVER_ERROR = (500, {"ok": False, "error_code": 500, "description": "Internal Server Error"})
+
+
+def fast_config(**overrides) -> TelegramConfig:
+    """Limits high enough not to matter, retries in milliseconds."""
+    settings = dict(
+        global_rate=1000.0,
+        global_burst=1000,
+        chat_rate=1000.0,
+        chat_burst=1000,
+        max_in_flight=8,
+        max_attempts=3,
+        backoff_base_seconds=0.01,
+        backoff_max_seconds=0.05,
+    )
+    settings.update(overrides)
+    return TelegramConfig(**settings)
+
+
+def deliver(
+    api: FakeBotApi, notifications: List[Notification], config: TelegramConfig
+) -> Tuple[NotificationDispatcher, List[DeadLetter]]:
+    """Submit everything before the dispatcher starts, run it until drained."""
+    store = InMemoryStore()
+
+    async def run() -> NotificationDispatcher:
+        url = await api.start()
+        client = TelegramBotClient(httpx.AsyncClient(timeout=5), "test", url)
+        dispatcher = NotificationDispatcher(client, InMemoryDeadLetterRepository(store), config)
+        for notification in notifications:
+            dispatcher.submit(notification)
+
+        runner = asyncio.create_task(dispatcher.run())
+        try:
+            await asyncio.wait_for(dispatcher.drain(), 10)
+        finally:
+            runner.cancel()
+            await dispatcher.close()
+            await api.stop()
+        return dispatcher
+
+    return asyncio.run(run()), store.dead_letters
+
+
+def reply(chat_id: int, text: str) -> Notification:
+    return Notification(chat_id=chat_id, text=text)
+
+
+def alert(chat_id: int, text: str) -> Notification:
+    return Notification(chat_id=chat_id, text=text, priority=NotificationPriority.ALERT, mergeable=True)
+
+
+def test_messages_of_a_chat_arrive_in_order_under_flood_control():
+    # The server allows 10 messages/s per chat, the dispatcher believes 1000/s:
+    # it runs into 429s and has to hold each chat's later messages back.
+    api = FakeBotApi(fast_config(chat_rate=10.0, chat_burst=1))
+    texts = {chat_id: [f"chat {chat_id} #{index}" for index in range(4)] for chat_id in (1, 2, 3)}
+    notifications = [reply(chat_id, texts[chat_id][index]) for index in range(4) for chat_id in texts]
+
+    dispatcher, dead_letters = deliver(api, notifications, fast_config())
+
+    assert api.too_many > 0
+    assert dispatcher.stats.rate_limited > 0
+    assert dead_letters == []
+    for chat_id, expected in texts.items():
+        assert api.messages[chat_id] == expected
+
+
+def test_retry_after_pauses_the_chat():
+    api = FakeBotApi(fast_config())
+    api.responses[7].append((429, too_many_requests(0.3)))
+
+    dispatcher, dead_letters = deliver(api, [reply(7, "hello"), reply(8, "other chat")], fast_config())
+
+    first, second = api.attempts[7]
+    assert second - first == pytest.approx(0.3, abs=0.1)
+    assert api.messages[7] == ["hello"]
+    assert (dispatcher.stats.rate_limited, dispatcher.stats.sent) == (1, 2)
+    # Only the chat that hit flood control waits.
+    assert api.attempts[8][0] < second
+    assert dead_letters == []
+
+
+def test_pending_alerts_are_merged_into_one_message():
+    api = FakeBotApi(fast_config())
+    notifications = [alert(3, f"alert {index}") for index in range(4)] + [reply(3, "reply")]
+
+    dispatcher, _ = deliver(api, notifications, fast_config())
+
+    assert api.messages[3] == ["alert 0\n\nalert 1\n\nalert 2\n\nalert 3", "reply"]
+    assert (dispatcher.stats.merged, dispatcher.stats.sent, api.requests) == (3, 2, 2)
+
+
+def test_merged_alerts_stay_within_the_message_length():
+    api = FakeBotApi(fast_config())
+    notifications = [alert(3, f"alert {index}") for index in range(4)]
+
+    dispatcher, _ = deliver(api, notifications, fast_config(max_message_length=len("alert 0\n\nalert 1")))
+
+    assert api.messages[3] == ["alert 0\n\nalert 1", "alert 2\n\nalert 3"]
+    assert dispatcher.stats.merged == 2
+
+
+def test_failed_messages_are_dead_lettered():
+    api = FakeBotApi(fast_config(), blocked={5})
+    api.responses[6].extend([SERVER_ERROR] * 3)
+
+    dispatcher, dead_letters = deliver(
+        api, [reply(5, "blocked"), reply(6, "failing"), reply(7, "fine")], fast_config(max_attempts=3)
+    )
+
+    letters = {letter.chat_id: letter for letter in dead_letters}
+    assert set(letters) == {5, 6}
+    # Permanent errors are not retried.
+    assert (letters[5].attempts, len(api.attempts[5])) == (1, 1)
+    assert "blocked" in letters[5].error
+    assert (letters[6].attempts, len(api.attempts[6])) == (3, 3)
+    assert letters[6].text == "failing"
+    assert api.messages[7] == ["fine"]
+    assert (dispatcher.stats.dead_lettered, dispatcher.stats.retried, dispatcher.stats.sent) == (2, 2, 1)
\ No newline at end of file
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.config import PasswordHasherConfig
+from src.infrastructure.security.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def bcrypt_hasher():
+    hasher = PasswordHasher(PasswordHasherConfig(scheme="bcrypt", bcrypt_rounds=4))
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def argon2_hasher():
+    hasher = PasswordHasher(PasswordHasherConfig(scheme="argon2", argon2_time_cost=1, argon2_memory_cost=1024))
+    yield hasher
+    hasher.shutdown()
+
+
+def test_bcrypt_rejects_passwords_over_72_bytes(bcrypt_hasher: PasswordHasher):
+    with pytest.raises(ValueError, match="72 bytes"):
+        asyncio.run(bcrypt_hasher.hash("я" * 37))
+
+    hashed = asyncio.run(bcrypt_hasher.hash("я" * 36))
+    assert asyncio.run(bcrypt_hasher.verify("я" * 36, hashed))
+
+
+def test_long_password_never_verifies_against_bcrypt(bcrypt_hasher: PasswordHasher):
+    hashed = asyncio.run(bcrypt_hasher.hash("x" * 72))
+
+    assert not asyncio.run(bcrypt_hasher.verify("x" * 73, hashed))
+
+
+def test_argon2_takes_long_passwords(argon2_hasher: PasswordHasher):
+    hashed = asyncio.run(argon2_hasher.hash("x" * 200))
+
+    assert asyncio.run(argon2_hasher.verify("x" * 200, hashed))
+
+
+@pytest.mark.parametrize(
+    "hashed_password, expected",
+    [
+        ("$2b$04$" + "a" * 53, False),
+        ("$2b$03$" + "a" * 53, True),
+        ("$2b$xx$abc", True),
+        ("$2b$$abc", True),
+        ("not a hash", True),
+        ("$argon2id$v=19$m=1024,t=1,p=4$c2FsdA$aGFzaA", True),
+    ],
+)
+def test_bcrypt_needs_rehash(bcrypt_hasher: PasswordHasher, hashed_password: str, expected: bool):
+    assert bcrypt_hasher.needs_rehash(hashed_password) is expected
+
+
+def test_metrics_count_finished_jobs(bcrypt_hasher: PasswordHasher):
+    async def hash_many():
+        await asyncio.gather(*(bcrypt_hasher.hash("secret") for _ in range(6)))
+
+    asyncio.run(hash_many())
+
+    metrics = bcrypt_hasher.metrics
+    assert (metrics.completed, metrics.in_flight, metrics.queued) == (6, 0, 0)
+    # max_concurrency (4 by default) jobs are submitted at once, the rest queue.
+    assert metrics.max_queued >= 2
\ No newline at end of file
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.deposit import DepositUseCase
+from src.application.use_cases.get_statistics import GetStatisticsUseCase
+from src.application.use_cases.withdraw import WithdrawUseCase
+from src.infrastructure.database import DatabaseProvider
+from src.infrastructure.database.commit_hooks import SessionCommitHooks
+from src.presentation.dependencies import get_deposit_use_case, get_statistics_use_case, get_withdraw_use_case
+
+
+class RecordingRepositories:
+    """Hands out (kind, session number) tuples in place of repositories."""
+
+    def users(self, session):
+        return ("users", session.info["number"])
+
+    def transactions(self, session):
+        return ("transactions", session.info["number"])
+
+    def idempotency(self, session):
+        return ("idempotency", session.info["number"])
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.state.repositories = RecordingRepositories()
+    app.state.deposit_coalescer = SimpleNamespace(name="coalescer")
+    app.state.statistics = SimpleNamespace(name="statistics")
+    app.state.expense_events = SimpleNamespace(name="events")
+
+    sessions = iter(range(100))
+
+    async def session():
+        # Never bound to an engine: the use cases are only built, not run.
+        yield AsyncSession(info={"number": next(sessions)})
+
+    app.dependency_overrides[DatabaseProvider.get_session] = session
+
+    @app.get("/deposit")
+    async def deposit(use_case: DepositUseCase = Depends(get_deposit_use_case)):
+        return {
+            "repositories": [use_case.user_repo, use_case.transaction_repo, use_case.idempotency.repo],
+            "coalescer": use_case.coalescer.name,
+            "statistics": use_case.statistics.name,
+            "commit_hooks": isinstance(use_case.commit_hooks, SessionCommitHooks),
+        }
+
+    @app.get("/withdraw")
+    async def withdraw(use_case: WithdrawUseCase = Depends(get_withdraw_use_case)):
+        return {
+            "repositories": [use_case.user_repo, use_case.transaction_repo, use_case.idempotency.repo],
+            "events": use_case.events.name,
+            "statistics": use_case.statistics.name,
+            "commit_hooks": isinstance(use_case.commit_hooks, SessionCommitHooks),
+        }
+
+    @app.get("/statistics")
+    async def statistics(use_case: GetStatisticsUseCase = Depends(get_statistics_use_case)):
+        return {"repositories": [use_case.transaction_repo], "statistics": use_case.statistics.name}
+
+    return app
+
+
+def test_deposit_gets_the_coalescer_and_statistics():
+    body = TestClient(create_app()).get("/deposit").json()
+
+    assert body["repositories"] == [["users", 0], ["transactions", 0], ["idempotency", 0]]
+    assert (body["coalescer"], body["statistics"]) == ("coalescer", "statistics")
+    assert body["commit_hooks"]
+
+
+def test_withdraw_gets_expense_events_and_statistics():
+    body = TestClient(create_app()).get("/withdraw").json()
+
+    assert body["repositories"] == [["users", 0], ["transactions", 0], ["idempotency", 0]]
+    assert (body["events"], body["statistics"]) == ("events", "statistics")
+    # Events wait for the request session to commit.
+    assert body["commit_hooks"]
+
+
+def test_statistics_use_case_gets_the_snapshot_cache():
+    body = TestClient(create_app()).get("/statistics").json()
+
+    assert body == {"repositories": [["transactions", 0]], "statistics": "statistics"}
\ No newline at end of file
@@ -0,0 +1,66 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from src.infrastructure.cache.memory import InMemoryCacheBackend
+from src.infrastructure.cache.statistics import StatisticsSnapshotCache
+from src.infrastructure.config import PasswordHasherConfig
+from src.infrastructure.database import DatabaseProvider, PoolMetrics
+from src.infrastructure.database.factory import RepositoryFactory
+from src.infrastructure.security.password_hasher import PasswordHasher
+from src.presentation.routers import metrics
+
+
+@pytest.fixture
+def app(monkeypatch) -> FastAPI:
+    pool = PoolMetrics(
+        size=5, checked_out=1, checked_in=4, overflow=0, max_overflow=10,
+        checkouts=7, wait_seconds_total=0.0, wait_seconds_max=0.0, timeouts=0,
+    )
+    monkeypatch.setattr(DatabaseProvider, "pool_metrics", classmethod(lambda cls, engine=None: pool))
+    app = FastAPI()
+    app.include_router(metrics.router)
+    return app
+
+
+def samples(app: FastAPI) -> dict:
+    text = TestClient(app).get("/metrics").text
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#"))
+
+
+def test_password_hasher_queue(app: FastAPI):
+    hasher = PasswordHasher(PasswordHasherConfig())
+    hasher.metrics.queued, hasher.metrics.max_queued, hasher.metrics.completed = 3, 9, 120
+    app.state.password_hasher = hasher
+    try:
+        values = samples(app)
+    finally:
+        hasher.shutdown()
+
+    assert values["password_hasher_queued"] == "3"
+    assert values["password_hasher_queued_max"] == "9"
+    assert values["password_hasher_completed_total"] == "120"
+    assert values["db_pool_checkouts_total"] == "7"
+
+
+def test_cache_counters(app: FastAPI):
+    app.state.repositories = RepositoryFactory(InMemoryCacheBackend())
+    app.state.repositories.user_cache_stats.hits = 40
+    app.state.repositories.user_cache_stats.misses = 2
+    app.state.repositories.user_cache_stats.invalidations = 5
+    app.state.statistics = StatisticsSnapshotCache(InMemoryCacheBackend())
+    app.state.statistics.stats.coalesced = 3
+
+    values = samples(app)
+
+    assert values["user_cache_hits_total"] == "40"
+    assert values["user_cache_misses_total"] == "2"
+    assert values["user_cache_invalidations_total"] == "5"
+    assert values["statistics_cache_coalesced_total"] == "3"
+
+
+def test_subsystems_that_did_not_start_are_left_out(app: FastAPI):
+    values = samples(app)
+
+    assert "password_hasher_queued" not in values
+    assert "user_cache_hits_total" not in values
\ No newline at end of file
@@ -0,0 +1,67 @@
+import asyncio
+import json
+from datetime import datetime
+
+from src.domain.entities.money import Money
+from src.domain.entities.transaction import Transaction, TransactionCategory, TransactionType
+from src.domain.interfaces.transaction_repo import TransactionPage
+from src.presentation.responses import TransactionPageResponse, TransactionStreamResponse
+
+
+def transaction(transaction_id: int, description=None) -> Transaction:
+    return Transaction(
+        transaction_id=transaction_id,
+        user_id=1,
+        transaction_type=TransactionType.EXPENSE,
+        amount=Money(12_34),
+        category=TransactionCategory.FOOD,
+        description=description,
+        date_created=datetime(2026, 1, 2, 3, 4, 5, 6),
+    )
+
+
+def expected(item: Transaction) -> dict:
+    return {
+        "transaction_id": item.transaction_id,
+        "user_id": 1,
+        "transaction_type": TransactionType.EXPENSE.value,
+        "amount": "12.34",
+        "category": TransactionCategory.FOOD.value,
+        "description": item.description,
+        "date_created": "2026-01-02T03:04:05.000006",
+    }
+
+
+def test_page_is_valid_json():
+    items = [transaction(2, 'Quote " and \\ backslash\n'), transaction(1, "Такси")]
+
+    body = TransactionPageResponse(TransactionPage(items=items, next_cursor="abc")).body
+
+    assert json.loads(body) == {"items": [expected(item) for item in items], "next_cursor": "abc"}
+
+
+def test_stream_sends_one_json_array_in_chunks():
+    items = [transaction(index) for index in range(5)]
+
+    async def rows():
+        for item in items:
+            yield item
+
+    async def body(response: TransactionStreamResponse):
+        return [chunk async for chunk in response.body_iterator]
+
+    chunks = asyncio.run(body(TransactionStreamResponse(rows(), rows_per_chunk=2)))
+
+    assert len(chunks) == 4
+    assert json.loads(b"".join(chunks)) == [expected(item) for item in items]
+
+
+def test_empty_stream_is_an_empty_array():
+    async def rows():
+        return
+        yield
+
+    async def body(response: TransactionStreamResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    assert json.loads(asyncio.run(body(TransactionStreamResponse(rows())))) == []
\ No newline at end of file